@@ -0,0 +1,70 @@
+"""
+Synthetic entity templates of configurable size, used by the benchmarks.
+"""
+import dataclasses
+from typing import Any, Dict, List, Type
+
+from data_snack_dynamic_entity.types import EntityTemplates
+from data_snack_dynamic_entity.utils import unwrap_optional
+
+FIELD_TYPES = ["int", "float", "str", "bool"]
+SAMPLE_VALUES = {int: 1, float: 1.5, str: "value", bool: True}
+
+
+def simple_template(fields: int, version: int = 1) -> Dict:
+    """Simple entity with an `index` key and `fields - 1` other fields of mixed types, every fourth is optional."""
+    properties = {"index": {"type": "int", "key": True}}
+    for i in range(fields - 1):
+        properties[f"field_{i}"] = {"type": FIELD_TYPES[i % len(FIELD_TYPES)], "optional": i % 4 == 3}
+    return {"type": "simple", "version": version, "properties": properties}
+
+
+def wide_templates(entities: int, fields: int) -> EntityTemplates:
+    """`entities` independent simple entities with `fields` fields each."""
+    return {f"Entity{i}": simple_template(fields) for i in range(entities)}
+
+
+def fan_in_templates(sources: int, fields: int) -> EntityTemplates:
+    """`sources` simple entities and a single `Compound` entity built from all of them."""
+    templates = {f"Source{i}": simple_template(fields) for i in range(sources)}
+    templates["Compound"] = {
+        "type": "compound",
+        "sources": [
+            {
+                "entity": source_name,
+                "fields": [
+                    {"field": f"source_{i}_{field_name}", "source_field": field_name}
+                    for field_name in templates[source_name]["properties"]
+                ],
+            }
+            for i, source_name in enumerate(templates)
+        ],
+    }
+    return templates
+
+
+def chain_templates(depth: int, fields: int) -> EntityTemplates:
+    """A simple entity `Level0` and `depth` compound entities, each one built from the previous level."""
+    templates = {"Level0": simple_template(fields)}
+    for level in range(1, depth + 1):
+        templates[f"Level{level}"] = {
+            "type": "compound",
+            "sources": [
+                {
+                    "entity": f"Level{level - 1}",
+                    "fields": [
+                        {"field": field_name, "source_field": field_name}
+                        for field_name in templates["Level0"]["properties"]
+                    ],
+                }
+            ],
+        }
+    return templates
+
+
+def sample_values(entity_type: Type) -> List[Any]:
+    """Constructor arguments of an entity with a value of the right type for each field."""
+    return [
+        SAMPLE_VALUES.get(unwrap_optional(entity_field.type)[0])
+        for entity_field in dataclasses.fields(entity_type) if entity_field.init
+    ]
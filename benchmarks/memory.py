@@ -0,0 +1,58 @@
+"""
+Measures memory used by a single entity instance with and without `__slots__`.
+
+Usage: python benchmarks/memory.py [--instances N] [--fields M]
+"""
+import argparse
+import gc
+import platform
+import tracemalloc
+from typing import Dict, Type
+
+from data_snack_dynamic_entity.simple_entity.factory import SimpleEntityFactory
+
+
+def make_templates(fields: int) -> Dict:
+    return {
+        "Item": {
+            "type": "simple",
+            "version": 1,
+            "properties": {
+                "index": {"type": "int", "key": True},
+                **{f"field_{i}": {"type": "int", "default": 0} for i in range(fields - 1)},
+            }
+        }
+    }
+
+
+def bytes_per_instance(entity_type: Type, instances: int) -> float:
+    values = list(range(len(entity_type.__dataclass_fields__)))  # small ints are shared, only instances are measured
+    objects = [None] * instances
+    gc.collect()
+    tracemalloc.start()
+    for i in range(instances):
+        objects[i] = entity_type(*values)
+    allocated, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return allocated / instances
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--instances", type=int, default=100_000)
+    parser.add_argument("--fields", type=int, default=10)
+    args = parser.parse_args()
+
+    templates = make_templates(args.fields)
+    regular = SimpleEntityFactory().load_entities(templates)["Item"]
+    slotted = SimpleEntityFactory(slots=True).load_entities(templates)["Item"]
+
+    print(f"Python {platform.python_version()}, {args.fields} fields, {args.instances} instances")
+    before = bytes_per_instance(regular, args.instances)
+    after = bytes_per_instance(slotted, args.instances)
+    print(f"regular: {before:.1f} bytes per instance")
+    print(f"slots:   {after:.1f} bytes per instance ({after - before:+.1f})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+"""
+Measures how `load_entities_parallel` scales with the number of worker processes, compared with `load_entities`.
+
+Usage: python benchmarks/parallel.py [--entities N] [--fields M] [--workers 1,2,4,8] [--fast-validation]
+                                     [--output results.json]
+"""
+import argparse
+import json
+import os
+import platform
+import time
+from typing import Callable, Dict
+
+from data_snack_dynamic_entity.factory import load_entities
+from data_snack_dynamic_entity.parallel import load_entities_parallel
+from generators import wide_templates
+
+
+def seconds(function: Callable[[], Dict]) -> float:
+    start = time.perf_counter()
+    function()
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--entities", type=int, default=10_000)
+    parser.add_argument("--fields", type=int, default=20)
+    parser.add_argument("--workers", type=lambda value: [int(n) for n in value.split(",")],
+                        default=sorted({1, 2, 4, 8, os.cpu_count() or 1}))
+    parser.add_argument("--fast-validation", action="store_true")
+    parser.add_argument("--output", help="write results to a JSON file")
+    args = parser.parse_args()
+
+    templates = wide_templates(args.entities, args.fields)
+    options = {"cache": None, "fast_validation": args.fast_validation}
+    print(f"Python {platform.python_version()}, {os.cpu_count()} CPUs, {args.entities} entities, {args.fields} fields")
+
+    sequential = seconds(lambda: load_entities(templates, **options))
+    print(f"load_entities: {sequential:.2f}s")
+    results = {"sequential_seconds": sequential, "parallel_seconds": {}}
+    for workers in args.workers:
+        parallel = seconds(lambda: load_entities_parallel(templates, max_workers=workers, **options))
+        results["parallel_seconds"][workers] = parallel
+        print(f"load_entities_parallel, {workers} workers: {parallel:.2f}s ({sequential / parallel:.2f}x)")
+
+    if args.output:
+        with open(args.output, "w") as f:
+            report = {"python": platform.python_version(), "cpus": os.cpu_count(), **vars(args), **results}
+            json.dump(report, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,208 @@
+"""
+Benchmarks of template validation, type creation and entity construction on synthetic templates.
+Results are printed and can be written as JSON, comparing them with a previous JSON file reports regressions.
+All metrics are "lower is better": times are in seconds per operation, memory in bytes.
+
+Usage: python benchmarks/suite.py [--preset quick|full] [--only wide,fan_in,chain] [--output results.json]
+                                  [--baseline previous.json] [--tolerance 0.2]
+"""
+import argparse
+import gc
+import json
+import platform
+import sys
+import timeit
+import tracemalloc
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, Iterator, List, Optional, Type
+
+from data_snack.entities import CompoundEntity
+
+from data_snack_dynamic_entity.cache import EntityCache
+from data_snack_dynamic_entity.factory import load_entities
+from data_snack_dynamic_entity.simple_entity.factory import SimpleEntityFactory
+from data_snack_dynamic_entity.types import EntityTemplates
+from data_snack_dynamic_entity.validate import validate_entity_templates
+from generators import chain_templates, fan_in_templates, sample_values, wide_templates
+from memory import bytes_per_instance
+
+Metrics = Dict[str, float]
+
+PRESETS = {
+    "quick": {
+        "wide": [(10, 10), (100, 10), (10, 100)],
+        "fan_in": [(2, 10), (8, 10)],
+        "chain": [(2, 10), (8, 10)],
+    },
+    "full": {
+        "wide": [(10, 10), (100, 10), (1000, 10), (10, 100), (100, 100), (1000, 50)],
+        "fan_in": [(2, 10), (8, 10), (32, 10), (8, 50)],
+        "chain": [(2, 10), (8, 10), (32, 10), (8, 50)],
+    },
+}
+INSTANCES = 10_000  # instances created to measure their memory
+
+
+def best_time(function: Callable[[], Any], repeat: int = 3, min_time: float = 0.05) -> float:
+    """Seconds per call, the best of `repeat` runs, each one calling the function for at least `min_time` seconds."""
+    timer = timeit.Timer(function)
+    number, elapsed = 1, timer.timeit(1)
+    while elapsed < min_time:
+        number = max(number * 2, int(number * min_time / max(elapsed, 1e-9) * 1.2))
+        elapsed = timer.timeit(number)
+    return min([elapsed, *timer.repeat(repeat=repeat - 1, number=number)]) / number
+
+
+def bytes_per_class(templates: EntityTemplates) -> float:
+    """Memory allocated while creating types of the templates, per created type."""
+    gc.collect()
+    tracemalloc.start()
+    entities = load_entities(templates, cache=None, validate=False)
+    allocated, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return allocated / len(entities)
+
+
+def loading_metrics(templates: EntityTemplates) -> Metrics:
+    cache = EntityCache()
+    load_entities(templates, cache=cache, validate=False)
+    return {
+        "validate_seconds": best_time(lambda: validate_entity_templates(templates)),
+        "fast_validate_seconds": best_time(lambda: validate_entity_templates(templates, fast=True)),
+        "load_seconds": best_time(lambda: load_entities(templates, cache=None, validate=False)),
+        "load_cached_seconds": best_time(lambda: load_entities(templates, cache=cache, validate=False)),
+        "class_bytes": bytes_per_class(templates),
+    }
+
+
+def construction_metrics(entity_type: Type, slotted_type: Type) -> Metrics:
+    values = sample_values(entity_type)
+    values_tuple = tuple(values)
+    return {
+        "construct_seconds": best_time(lambda: entity_type(*values)),
+        "from_tuple_seconds": best_time(lambda: entity_type.from_tuple(values_tuple)),
+        "instance_bytes": bytes_per_instance(entity_type, INSTANCES),
+        "slots_instance_bytes": bytes_per_instance(slotted_type, INSTANCES),
+    }
+
+
+def bench_wide(entities: int, fields: int) -> Metrics:
+    templates = wide_templates(entities, fields)
+    entity_type = load_entities(templates, cache=None)["Entity0"]
+    slotted_type = SimpleEntityFactory(slots=True).load_entity("Entity0", templates["Entity0"])
+    return {**loading_metrics(templates), **construction_metrics(entity_type, slotted_type)}
+
+
+def generic_assembly(compound_type: Type, source_entities: List[Any]) -> Callable[[], Any]:
+    """Creates the compound entity with the generic `data-snack` implementation, for reference."""
+    create = CompoundEntity.create_from_source_entities.__func__
+    mappings = [source.entity_fields_mapping for source in compound_type.Meta.sources]
+    compound = compound_type.from_sources(*source_entities)
+    key_values = [getattr(compound, key) for key in compound_type.get_keys()]
+    return lambda: create(compound_type, source_entities, mappings, key_values)
+
+
+def bench_fan_in(sources: int, fields: int) -> Metrics:
+    templates = fan_in_templates(sources, fields)
+    entities = load_entities(templates, cache=None)
+    compound_type = entities["Compound"]
+    source_entities = [entities[f"Source{i}"](*sample_values(entities[f"Source{i}"])) for i in range(sources)]
+    return {
+        **loading_metrics(templates),
+        "from_sources_seconds": best_time(lambda: compound_type.from_sources(*source_entities)),
+        "generic_assembly_seconds": best_time(generic_assembly(compound_type, source_entities)),
+    }
+
+
+def bench_chain(depth: int, fields: int) -> Metrics:
+    templates = chain_templates(depth, fields)
+    entities = load_entities(templates, cache=None)
+    levels = [entities[f"Level{level}"] for level in range(depth + 1)]
+    root = levels[0](*sample_values(levels[0]))
+
+    def assemble_chain() -> Any:
+        entity = root
+        for level in levels[1:]:
+            entity = level.from_sources(entity)
+        return entity
+
+    return {**loading_metrics(templates), "assemble_chain_seconds": best_time(assemble_chain)}
+
+
+BENCHMARKS = {
+    "wide": (bench_wide, ("entities", "fields")),
+    "fan_in": (bench_fan_in, ("sources", "fields")),
+    "chain": (bench_chain, ("depth", "fields")),
+}
+
+
+def run(preset: str, only: Optional[List[str]] = None) -> Iterator[Dict[str, Any]]:
+    for name, cases in PRESETS[preset].items():
+        if only and name not in only:
+            continue
+        bench, parameter_names = BENCHMARKS[name]
+        for case in cases:
+            yield {"benchmark": name, "params": dict(zip(parameter_names, case)), "metrics": bench(*case)}
+
+
+def result_id(result: Dict[str, Any]) -> str:
+    return result["benchmark"] + "".join(f" {name}={value}" for name, value in result["params"].items())
+
+
+def find_regressions(results: List[Dict], baseline: List[Dict], tolerance: float) -> List[str]:
+    """Describes metrics which are worse than in the baseline by more than `tolerance`, e.g. 0.2 for 20%."""
+    baseline_by_id = {result_id(result): result["metrics"] for result in baseline}
+    regressions = []
+    for result in results:
+        previous = baseline_by_id.get(result_id(result), {})
+        for metric, value in result["metrics"].items():
+            if previous.get(metric) and value > previous[metric] * (1 + tolerance):
+                change = f"{previous[metric]:.4g} -> {value:.4g} ({value / previous[metric] - 1:+.0%})"
+                regressions.append(f"{result_id(result)}: {metric} {change}")
+    return regressions
+
+
+def format_result(result: Dict[str, Any]) -> str:
+    metrics = ", ".join(
+        f"{metric}={value * 1e6:.2f}us" if metric.endswith("_seconds") else f"{metric}={value:.0f}"
+        for metric, value in result["metrics"].items()
+    )
+    return f"{result_id(result)}: {metrics}"
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--preset", choices=sorted(PRESETS), default="quick")
+    parser.add_argument("--only", type=lambda value: value.split(","), help="comma-separated benchmark names")
+    parser.add_argument("--output", help="write results to a JSON file")
+    parser.add_argument("--baseline", help="JSON results to compare with, exits with 1 on regressions")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="allowed relative slowdown, 0.2 by default")
+    args = parser.parse_args()
+
+    results = []
+    for result in run(args.preset, args.only):
+        print(format_result(result), flush=True)
+        results.append(result)
+
+    if args.output:
+        report = {
+            "created": datetime.now(timezone.utc).isoformat(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "preset": args.preset,
+            "results": results,
+        }
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            regressions = find_regressions(results, json.load(f)["results"], args.tolerance)
+        for regression in regressions:
+            print(f"REGRESSION {regression}", file=sys.stderr)
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -25,5 +25,6 @@ setuptools.setup(
     test_suite="tests",
     include_package_data=True,
     install_requires=read_requirements("requirements.txt"),
+    extras_require={"yaml": ["pyyaml"]},
     entry_points={},
 )
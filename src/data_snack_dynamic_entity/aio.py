@@ -0,0 +1,121 @@
+import asyncio
+from concurrent.futures import Executor
+from time import perf_counter
+from typing import Any, Dict, Iterable, Optional, Type, Union
+
+from data_snack_dynamic_entity.cache import EntityCache, entity_cache
+from data_snack_dynamic_entity.factory import EntityBuilder, split_templates_by_type
+from data_snack_dynamic_entity.loaders import PathLike, find_template_files, merge_templates, read_templates
+from data_snack_dynamic_entity.types import EntityTemplates
+from data_snack_dynamic_entity.validate import EntityTemplatesValidator, ValidationError
+
+DEFAULT_TIME_SLICE = 0.005  # seconds of work between giving control back to the event loop
+
+
+class _TimeSlice:
+    """Gives control back to the event loop once the current slice of work took long enough."""
+
+    def __init__(self, seconds: float):
+        self.seconds = seconds
+        self._started = perf_counter()
+
+    async def checkpoint(self) -> None:
+        if perf_counter() - self._started >= self.seconds:
+            await asyncio.sleep(0)
+            self._started = perf_counter()
+
+
+async def aload_entities(
+        templates: EntityTemplates,
+        types_mapping: Dict[str, Any] = None,
+        cache: Optional[EntityCache] = entity_cache,
+        validate: bool = True,
+        fast_validation: bool = False,
+        time_slice: float = DEFAULT_TIME_SLICE,
+) -> Dict[str, Type]:
+    """
+    Creates new Entity and CompoundEntity types like `load_entities`, without blocking the event loop for long.
+    Templates are validated and types are created entity by entity, control is given back to the event loop
+    after each `time_slice` seconds of work, so other tasks keep running in the meantime.
+    Types are returned only when all of them were created, so a cancelled load doesn't leave partial results.
+
+    :param templates: input config containing templates
+    :param types_mapping: custom types mapping, e.g. `{"numpy.float16": numpy.float16}`
+    :param cache: cache of created types, process-wide cache is used by default, `None` disables caching
+    :param validate: validate templates
+    :param fast_validation: use the hand-written validator instead of the generic jsonschema one
+    :param time_slice: maximum number of seconds of work between giving control back to the event loop,
+        a single entity is never split
+    :returns: a dictionary with all created types, see `load_entities`
+    :raises:
+        ValidationError: if templates don't follow the schema, errors are grouped by entity name.
+    """
+    work = _TimeSlice(time_slice)
+    if validate:
+        validator = EntityTemplatesValidator(fast=fast_validation)
+        if not isinstance(templates, dict):
+            validator.validate(templates)
+        errors = {}
+        for entity_name, entity_schema in templates.items():
+            if entity_errors := validator.collect_entity_errors(entity_name, entity_schema):
+                errors[entity_name] = entity_errors
+            await work.checkpoint()
+        if errors:
+            raise ValidationError(errors)
+
+    simple_entities, compound_entities = split_templates_by_type(templates)
+    entities = {}
+    for _ in EntityBuilder(types_mapping or {}, cache=cache).create_in_order(
+            templates, [*simple_entities, *compound_entities], entities
+    ):
+        await work.checkpoint()
+    return {name: entities[name] for name in [*simple_entities, *compound_entities]}
+
+
+async def aread_templates(
+        paths: Union[PathLike, Iterable[PathLike]], executor: Optional[Executor] = None
+) -> EntityTemplates:
+    """
+    Reads and merges templates of JSON or YAML files, files are listed and read in an executor.
+
+    :param paths: paths of template files, or directories containing them
+    :param executor: executor reading files, the default executor of the event loop is used by default
+    :returns: templates of all files
+    :raises:
+        DuplicateEntityException: if an entity is defined in more than one file.
+        InvalidTemplatesFileException: if a file doesn't contain a dictionary of templates.
+    """
+    loop = asyncio.get_running_loop()
+    files = await loop.run_in_executor(executor, find_template_files, paths)
+    file_templates = await asyncio.gather(*(loop.run_in_executor(executor, read_templates, path) for path in files))
+    return merge_templates(dict(zip(files, file_templates)))
+
+
+async def aload_entities_from_paths(
+        paths: Union[PathLike, Iterable[PathLike]],
+        types_mapping: Dict[str, Any] = None,
+        cache: Optional[EntityCache] = entity_cache,
+        validate: bool = True,
+        fast_validation: bool = False,
+        time_slice: float = DEFAULT_TIME_SLICE,
+        executor: Optional[Executor] = None,
+) -> Dict[str, Type]:
+    """
+    Creates new Entity and CompoundEntity types of template files like `load_entities_from_paths`,
+    reading files in an executor and creating types with `aload_entities`.
+
+    :param paths: paths of JSON or YAML template files, or directories containing them
+    :param types_mapping: custom types mapping, e.g. `{"numpy.float16": numpy.float16}`
+    :param cache: cache of created types, process-wide cache is used by default, `None` disables caching
+    :param validate: validate templates
+    :param fast_validation: use the hand-written validator instead of the generic jsonschema one
+    :param time_slice: maximum number of seconds of work between giving control back to the event loop
+    :param executor: executor reading files, the default executor of the event loop is used by default
+    :returns: a dictionary with all created types, see `load_entities`
+    :raises:
+        ValidationError: if templates don't follow the schema, errors are grouped by entity name.
+        DuplicateEntityException: if an entity is defined in more than one file.
+        InvalidTemplatesFileException: if a file doesn't contain a dictionary of templates.
+    """
+    templates = await aread_templates(paths, executor)
+    return await aload_entities(templates, types_mapping, cache, validate, fast_validation, time_slice)
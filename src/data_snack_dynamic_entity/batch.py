@@ -0,0 +1,206 @@
+from dataclasses import fields
+from operator import attrgetter
+from typing import Any, ClassVar, Dict, Iterable, Iterator, List, NamedTuple, Optional, Sequence, Tuple, Type, Union
+
+import numpy as np
+
+from data_snack_dynamic_entity.utils import unwrap_optional
+
+_BUILTIN_DTYPES = {int: np.dtype(np.int64), float: np.dtype(np.float64), bool: np.dtype(np.bool_)}
+_OBJECT_DTYPE = np.dtype(object)
+
+
+class ColumnSpec(NamedTuple):
+    dtype: np.dtype
+    optional: bool  # column has a validity mask
+
+
+def _column_spec(field_type: Any) -> ColumnSpec:
+    field_type, optional = unwrap_optional(field_type)
+    if field_type in _BUILTIN_DTYPES:
+        return ColumnSpec(_BUILTIN_DTYPES[field_type], optional)
+    if isinstance(field_type, type) and issubclass(field_type, np.generic):
+        return ColumnSpec(np.dtype(field_type), optional)
+    return ColumnSpec(_OBJECT_DTYPE, optional)
+
+
+def _to_column(values: Sequence[Any], spec: ColumnSpec) -> Tuple[np.ndarray, Optional[np.ndarray]]:
+    """Converts values to a column and, for optional columns, a validity mask."""
+    mask = None
+    if spec.optional:
+        mask = np.fromiter((value is not None for value in values), dtype=np.bool_, count=len(values))
+    if spec.dtype is _OBJECT_DTYPE:
+        column = np.empty(len(values), dtype=_OBJECT_DTYPE)
+        column[:] = values  # keeps sequences as single values instead of creating nested dimensions
+    elif mask is None or mask.all():
+        column = np.array(values, dtype=spec.dtype)
+    else:
+        column = np.zeros(len(values), dtype=spec.dtype)
+        column[mask] = [value for value in values if value is not None]
+    return column, mask
+
+
+class BatchRow:
+    """View of a single row of a batch, giving access to its values like the entity does."""
+    __slots__ = ("_batch", "_index")
+
+    def __init__(self, batch: "EntityBatch", index: int):
+        self._batch = batch
+        self._index = index
+
+    def __getattr__(self, name: str) -> Any:
+        batch = object.__getattribute__(self, "_batch")
+        if name not in batch.columns:
+            return getattr(batch.entity_type, name)
+        return batch.value(name, object.__getattribute__(self, "_index"))
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, BatchRow):
+            other = other.to_entity()
+        return self.to_entity() == other
+
+    def __repr__(self) -> str:
+        return f"{type(self._batch).__name__}Row({self.to_entity()!r})"
+
+    def to_entity(self) -> Any:
+        """Creates an entity instance from the row."""
+        return self._batch.entity_type(*(self._batch.value(name, self._index) for name in self._batch.columns))
+
+
+class EntityBatch:
+    """
+    Columnar container of entities of a single simple entity type, created with `batch_type`.
+    Each field is stored in a NumPy array, numeric builtins and NumPy scalar types get their own dtype and other
+    types are stored in object arrays. Optional fields also have a boolean validity mask, masked out values of numeric
+    columns are zeros.
+    """
+    entity_type: ClassVar[Type]
+    columns_spec: ClassVar[Dict[str, ColumnSpec]]
+
+    def __init__(self, columns: Dict[str, np.ndarray], masks: Optional[Dict[str, np.ndarray]] = None):
+        """
+        :param columns: arrays of all fields, in any order
+        :param masks: validity masks of optional fields, all values are valid by default
+        """
+        masks = masks or {}
+        self.columns = {name: np.asarray(columns[name], dtype=spec.dtype) for name, spec in self.columns_spec.items()}
+        self.masks = {
+            name: np.asarray(masks[name], dtype=np.bool_) if name in masks else np.ones(len(column), dtype=np.bool_)
+            for name, column in self.columns.items() if self.columns_spec[name].optional
+        }
+        if len({len(array) for array in [*self.columns.values(), *self.masks.values()]}) > 1:
+            raise ValueError(f"Columns of {type(self).__name__} have different lengths")
+
+    @classmethod
+    def from_records(cls, records: Iterable[Union[Sequence, Dict[str, Any]]]) -> "EntityBatch":
+        """
+        Creates a batch from records, tuples of values in the order of entity fields or dictionaries.
+
+        :param records: records of values
+        :returns: a batch
+        """
+        records = list(records)
+        names = list(cls.columns_spec)
+        if records and isinstance(records[0], dict):
+            values = [[record[name] for record in records] for name in names]
+        else:
+            values = list(zip(*records)) if records else [()] * len(names)
+        columns, masks = {}, {}
+        for name, column_values in zip(names, values):
+            columns[name], mask = _to_column(column_values, cls.columns_spec[name])
+            if mask is not None:
+                masks[name] = mask
+        return cls(columns, masks)
+
+    @classmethod
+    def from_entities(cls, entities: Iterable[Any]) -> "EntityBatch":
+        """
+        Creates a batch from entity instances.
+
+        :param entities: entity instances
+        :returns: a batch
+        """
+        getter = attrgetter(*cls.columns_spec)
+        if len(cls.columns_spec) == 1:
+            return cls.from_records((getter(entity),) for entity in entities)
+        return cls.from_records(map(getter, entities))
+
+    def __len__(self) -> int:
+        return len(next(iter(self.columns.values()), ()))
+
+    def __iter__(self) -> Iterator[BatchRow]:
+        return (BatchRow(self, index) for index in range(len(self)))
+
+    def __getitem__(self, item: Union[int, slice, np.ndarray, List]) -> Union[BatchRow, "EntityBatch"]:
+        """Gets a row view by its index, or a new batch of selected rows by a slice, indices or a boolean mask."""
+        if isinstance(item, (int, np.integer)):
+            index = range(len(self))[item]  # supports negative indices and checks bounds
+            return BatchRow(self, index)
+        return type(self)(
+            {name: column[item] for name, column in self.columns.items()},
+            {name: mask[item] for name, mask in self.masks.items()},
+        )
+
+    def column(self, name: str) -> np.ndarray:
+        """
+        Gets values of a field, optional fields are returned as masked arrays.
+
+        :param name: field name
+        :returns: an array
+        """
+        if name in self.masks:
+            return np.ma.MaskedArray(self.columns[name], mask=~self.masks[name])
+        return self.columns[name]
+
+    def value(self, name: str, index: int) -> Any:
+        """
+        Gets a single value as a Python object, None for masked out values.
+
+        :param name: field name
+        :param index: row index
+        :returns: the value
+        """
+        if name in self.masks and not self.masks[name][index]:
+            return None
+        value = self.columns[name][index]
+        return value.item() if self.columns_spec[name].dtype in _BUILTIN_DTYPES.values() else value
+
+    def to_entities(self) -> List[Any]:
+        """
+        Creates entity instances of all rows.
+
+        :returns: a list of entities
+        """
+        values = []
+        for name, column in self.columns.items():
+            column_values = column.tolist() if column.dtype in _BUILTIN_DTYPES.values() else list(column)
+            if name in self.masks:
+                column_values = [v if valid else None for v, valid in zip(column_values, self.masks[name].tolist())]
+            values.append(column_values)
+        return [self.entity_type(*row) for row in zip(*values)] if values else [self.entity_type()] * len(self)
+
+    @property
+    def nbytes(self) -> int:
+        """Memory used by columns and masks, not including objects referenced by object columns."""
+        return sum(array.nbytes for array in [*self.columns.values(), *self.masks.values()])
+
+
+def batch_type(entity_type: Type) -> Type[EntityBatch]:
+    """
+    Gets the batch type of a simple entity, the type is created once per entity.
+
+    :param entity_type: Entity type
+    :returns: EntityBatch subclass storing entities of given type
+    """
+    if (existing := vars(entity_type).get("_batch_type")) is not None:
+        return existing
+    columns_spec = {
+        entity_field.name: _column_spec(entity_field.type) for entity_field in fields(entity_type) if entity_field.init
+    }
+    created = type(
+        f"{entity_type.__name__}Batch",
+        (EntityBatch,),
+        {"entity_type": entity_type, "columns_spec": columns_spec, "__module__": entity_type.__module__},
+    )
+    entity_type._batch_type = created
+    return created
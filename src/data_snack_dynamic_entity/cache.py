@@ -0,0 +1,163 @@
+import hashlib
+import json
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from threading import Lock
+from typing import Any, Callable, Dict, Optional, Type
+
+from data_snack_dynamic_entity.compound_entity.types import CompoundEntitySchema
+from data_snack_dynamic_entity.simple_entity.type_resolution import type_names
+from data_snack_dynamic_entity.simple_entity.types import SimpleEntitySchema
+
+
+def _type_token(t: Any) -> str:
+    """
+    Builds a process-local token identifying a type object.
+    Object identity is included, so two different classes sharing a name never collide. Identities can't be reused
+    while an entry is cached, because the cached class keeps a reference to every type it was built from.
+    """
+    return f"{getattr(t, '__module__', '')}.{getattr(t, '__qualname__', repr(t))}@{id(t)}"
+
+
+def fingerprint(value: Any) -> str:
+    """
+    Computes a hash of a json-like value. Dictionary ordering is a part of the result, because the order
+    of `properties` decides the order of entity fields, which serializers storing values by position depend on.
+
+    :param value: json-like value, e.g. an entity template
+    :returns: hex digest of the value
+    """
+    dump = json.dumps(value, separators=(",", ":"), default=repr)
+    return hashlib.sha256(dump.encode()).hexdigest()
+
+
+def simple_entity_key(
+        entity_name: str,
+        entity_schema: SimpleEntitySchema,
+        types_mapping: Dict[str, Any],
+        options: Optional[Dict[str, Any]] = None,
+) -> str:
+    """
+    Builds a cache key of a simple entity.
+    Only `types_mapping` entries used by the entity are included, so unrelated mappings don't invalidate it.
+
+    :param entity_name: entity name
+    :param entity_schema: entity schema
+    :param types_mapping: custom types mapping used to create the entity
+    :param options: factory options affecting the created type
+    :returns: cache key
+    """
+    used_names = set()
+    for field_schema in entity_schema.get("properties", {}).values():
+        field_type = field_schema.get("type")
+        used_names.add(field_type)
+        try:
+            used_names |= type_names(field_type)  # names in parametrized types, e.g. `List[Money]`
+        except (AttributeError, ValueError):
+            pass
+    for name in [name for name in used_names if isinstance(name, str) and "." in name]:
+        parts = name.split(".")
+        used_names.update(".".join(parts[:end]) for end in range(1, len(parts)))  # mapped modules, e.g. `decimal`
+    used_mapping = {name: _type_token(types_mapping[name]) for name in sorted(used_names & types_mapping.keys())}
+    return fingerprint(["simple", entity_name, entity_schema, used_mapping, options or {}])
+
+
+def compound_entity_key(
+        entity_name: str,
+        entity_schema: CompoundEntitySchema,
+        source_entities: Dict[str, Type],
+        options: Optional[Dict[str, Any]] = None,
+) -> str:
+    """
+    Builds a cache key of a compound entity. Source entity classes are a part of the key.
+
+    :param entity_name: entity name
+    :param entity_schema: entity schema
+    :param source_entities: a dictionary with all source Entity types
+    :param options: factory options affecting the created type
+    :returns: cache key
+    """
+    source_names = {source.get("entity") for source in entity_schema.get("sources", [])}
+    used_sources = {name: _type_token(source_entities[name]) for name in sorted(source_names & source_entities.keys())}
+    return fingerprint(["compound", entity_name, entity_schema, used_sources, options or {}])
+
+
+@dataclass(eq=False)
+class EntityCache:
+    """
+    Thread-safe LRU cache of generated entity types, addressed by template content.
+    Unchanged templates resolve to the very same class objects, so `isinstance` checks and registries keep working
+    between reloads. It's unbounded by default: entries are addressed by content, so their number is bounded
+    by the loaded configs, while evicting classes of a config bigger than `maxsize` would make every reload miss.
+    """
+    maxsize: Optional[int] = None  # `None` disables eviction
+    hits: int = field(default=0, init=False)
+    misses: int = field(default=0, init=False)
+    _entries: "OrderedDict[str, Type]" = field(default_factory=OrderedDict, init=False, repr=False)
+    _lock: Lock = field(default_factory=Lock, init=False, repr=False)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._entries
+
+    def get(self, key: str) -> Optional[Type]:
+        """
+        Gets cached entity type and marks it as recently used.
+
+        :param key: cache key
+        :returns: cached entity type or None if missing
+        """
+        with self._lock:
+            entity_type = self._entries.get(key)
+            if entity_type is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self._entries.move_to_end(key)
+            return entity_type
+
+    def put(self, key: str, entity_type: Type) -> None:
+        """
+        Stores entity type, evicting the least recently used ones above `maxsize`.
+
+        :param key: cache key
+        :param entity_type: entity type to store
+        """
+        with self._lock:
+            self._store(key, entity_type)
+
+    def get_or_create(self, key: str, create: Callable[[], Type]) -> Type:
+        """
+        Gets cached entity type or creates and stores a new one.
+        Types are created outside of the lock. If another thread stored a type for the same key in the meantime,
+        the stored type is returned and the created one is dropped, so all callers get the same class.
+
+        :param key: cache key
+        :param create: callable creating the entity type on a cache miss
+        :returns: entity type
+        """
+        if (entity_type := self.get(key)) is not None:
+            return entity_type
+        entity_type = create()
+        with self._lock:
+            return self._store(key, self._entries.get(key, entity_type))
+
+    def _store(self, key: str, entity_type: Type) -> Type:
+        self._entries[key] = entity_type
+        self._entries.move_to_end(key)
+        if self.maxsize is not None:
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return entity_type
+
+    def clear(self) -> None:
+        """Removes all cached entity types and resets statistics."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+
+entity_cache = EntityCache()  # process-wide cache used by `load_entities` by default
@@ -0,0 +1,227 @@
+import ast
+import builtins
+import importlib
+import importlib.util
+import py_compile
+from dataclasses import MISSING, fields
+from pathlib import Path
+from typing import Any, Dict, List, Set, Type, Union, get_args
+
+from data_snack.entities.compound import CompoundEntity
+
+from data_snack_dynamic_entity.factory import load_entities
+from data_snack_dynamic_entity.graph import EntityGraph
+from data_snack_dynamic_entity.types import EntityTemplates
+
+_HEADER = '''# Generated by data_snack_dynamic_entity.codegen, do not edit.
+import typing
+
+from data_snack.entities import Entity
+from data_snack.entities.compound import CompoundEntity
+from data_snack.entities.models import EntityFieldMapping, SourceEntity
+'''
+
+
+def _import_path(t: Type) -> str:
+    """
+    Gets the path a type can be imported from in a generated module.
+
+    :param t: a class
+    :returns: dotted path of the class
+    :raises:
+        ValueError: if the class can't be imported by its module and name.
+    """
+    try:
+        obj = importlib.import_module(t.__module__)
+        for name in t.__qualname__.split("."):
+            obj = getattr(obj, name)
+    except (ImportError, AttributeError) as e:
+        raise ValueError(f"Type {t!r} can't be imported by a generated module") from e
+    if obj is not t:
+        raise ValueError(f"Type {t!r} can't be imported by a generated module")
+    return f"{t.__module__}.{t.__qualname__}"
+
+
+def _render_type(t: Any, imports: Set[str]) -> str:
+    """
+    Renders a type annotation as source code, collecting modules which need to be imported.
+
+    :param t: type annotation
+    :param imports: modules used by the annotation are added to this set
+    :returns: source code of the annotation
+    """
+    if t is type(None):
+        return "None"
+    if isinstance(t, type) and not get_args(t):
+        if t.__module__ == "builtins" and getattr(builtins, t.__qualname__, None) is t:
+            return t.__qualname__
+        path = _import_path(t)
+        imports.add(t.__module__)
+        return path
+    for arg in get_args(t):
+        _render_type(arg, imports)  # typing representation refers to arguments by their dotted path
+    return repr(t)
+
+
+def _render_default(value: Any) -> str:
+    source = repr(value)
+    try:
+        if ast.literal_eval(source) == value:
+            return source
+    except ValueError:
+        pass
+    raise ValueError(f"Default value {value!r} can't be rendered as a literal")
+
+
+def _render_tuple(items: List[str]) -> str:
+    return f"({items[0]},)" if len(items) == 1 else f"({', '.join(items)})"
+
+
+def _render_body(entity_type: Type, imports: Set[str]) -> List[str]:
+    """
+    Renders fields of a dataclass with the methods `dataclass` would generate for them, so importing
+    the module doesn't generate and compile them again. `add_dataclass_fields` adds the dataclass metadata.
+
+    :param entity_type: entity dataclass
+    :param imports: modules used by field annotations are added to this set
+    :returns: lines of the class body
+    """
+    slots = "__slots__" in vars(entity_type)
+    names = [entity_field.name for entity_field in fields(entity_type)]
+    lines, parameters = [], []
+    if slots:
+        lines.append(f"    __slots__ = {tuple(names)!r}")
+    for entity_field in fields(entity_type):
+        annotation = f"{entity_field.name}: {_render_type(entity_field.type, imports)}"
+        if entity_field.default is MISSING:
+            lines.append(f"    {annotation}")
+            parameters.append(annotation)
+        else:
+            default = _render_default(entity_field.default)
+            lines.append(f"    {annotation}" if slots else f"    {annotation} = {default}")
+            parameters.append(f"{annotation} = {default}")
+    fields_repr = ", ".join(f"{name}={{self.{name}!r}}" for name in names)
+    return [
+        *lines,
+        "",
+        f"    def __init__(self, {', '.join(parameters)}) -> None:",
+        *[f"        self.{name} = {name}" for name in names],
+        "",
+        "    def __repr__(self) -> str:",
+        f"        return f\"{{self.__class__.__qualname__}}({fields_repr})\"",
+        "",
+        "    def __eq__(self, other: typing.Any) -> bool:",
+        "        if other.__class__ is self.__class__:",
+        f"            return {_render_tuple([f'self.{name}' for name in names])}"
+        f" == {_render_tuple([f'other.{name}' for name in names])}",
+        "        return NotImplemented",
+        "",
+        "    __hash__ = None",
+        f"    __match_args__ = {tuple(names)!r}",
+    ]
+
+
+def _render_simple_entity(entity_name: str, entity_type: Type, imports: Set[str]) -> List[str]:
+    meta = entity_type.Meta
+    return [
+        f"class {entity_name}(Entity):",
+        *_render_body(entity_type, imports),
+        "",
+        "    class Meta:",
+        f"        keys = {list(meta.keys)!r}",
+        f"        excluded_fields = {list(meta.excluded_fields)!r}",
+        f"        version = {meta.version!r}",
+    ]
+
+
+def _render_compound_entity(entity_name: str, entity_type: Type, imports: Set[str]) -> List[str]:
+    lines = [
+        f"class {entity_name}(CompoundEntity):",
+        *_render_body(entity_type, imports),
+        "",
+        "    class Meta:",
+        "        sources = [",
+    ]
+    for source in entity_type.Meta.sources:
+        lines += [
+            "            SourceEntity(",
+            f"                entity={source.entity.__name__},",
+            "                entity_fields_mapping=[",
+            *[
+                f"                    EntityFieldMapping("
+                f"field={mapping.field!r}, source_field={mapping.source_field!r}),"
+                for mapping in source.entity_fields_mapping
+            ],
+            "                ],",
+            f"                optional={source.optional!r},",
+            "            ),",
+        ]
+    lines.append("        ]")
+    return lines
+
+
+def generate_module_source(templates: EntityTemplates, types_mapping: Dict[str, Any] = None) -> str:
+    """
+    Generates source code of a Python module defining all entities of provided config.
+    The module defines a class per entity and an `ENTITIES` dictionary in the format returned by `load_entities`.
+
+    :param templates: input config containing templates
+    :param types_mapping: custom types mapping, types need to be importable by their module and name
+    :returns: source code of the module
+    """
+    entities = load_entities(templates, types_mapping, cache=None)
+    imports, body = set(), []
+    helpers = {"from data_snack_dynamic_entity.utils import add_dataclass_fields"}
+    for entity_name in EntityGraph.from_templates(templates).topological_order():
+        entity_type = entities[entity_name]
+        is_compound = issubclass(entity_type, CompoundEntity)
+        render = _render_compound_entity if is_compound else _render_simple_entity
+        body += ["", "", *render(entity_name, entity_type, imports)]
+        body += ["", "", f"add_dataclass_fields({entity_name})"]
+        if is_compound:
+            body += ["", "", f"add_assembly_plan({entity_name})"]
+            helpers.add("from data_snack_dynamic_entity.compound_entity.assembly import add_assembly_plan")
+        body += ["", "", f"add_serializers({entity_name})"]
+        helpers.add("from data_snack_dynamic_entity.serializers import add_serializers")
+
+    lines = [_HEADER.rstrip("\n"), *sorted(helpers)]
+    lines += [f"import {module}" for module in sorted(imports)]
+    lines += body
+    lines += ["", "", "ENTITIES = {", *[f"    {name!r}: {name}," for name in entities], "}", ""]
+    return "\n".join(lines)
+
+
+def write_module(
+        templates: EntityTemplates,
+        path: Union[str, Path],
+        types_mapping: Dict[str, Any] = None,
+        compile: bool = False,
+) -> Path:
+    """
+    Writes a Python module defining all entities of provided config, see `generate_module_source`.
+
+    :param templates: input config containing templates
+    :param path: path of the created `.py` file
+    :param types_mapping: custom types mapping, types need to be importable by their module and name
+    :param compile: also write the bytecode cache (`.pyc`), so the first import doesn't compile the module
+    :returns: path of the created file
+    """
+    path = Path(path)
+    path.write_text(generate_module_source(templates, types_mapping))
+    if compile:
+        py_compile.compile(str(path), doraise=True)
+    return path
+
+
+def load_module_entities(path: Union[str, Path]) -> Dict[str, Type]:
+    """
+    Imports a module created by `write_module` from any location.
+
+    :param path: path of the `.py` file
+    :returns: a dictionary with all entity types defined in the module
+    """
+    path = Path(path)
+    spec = importlib.util.spec_from_file_location(path.stem, path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module.ENTITIES
@@ -0,0 +1,52 @@
+import keyword
+from typing import Any, Callable, Dict, Optional, Type
+
+
+def attribute(expression: str, name: str) -> str:
+    """
+    Renders attribute access as source code, names which aren't identifiers are accessed with `getattr`.
+
+    :param expression: source code of the object
+    :param name: attribute name
+    :returns: source code of the attribute access
+    """
+    if name.isidentifier() and not keyword.iskeyword(name):
+        return f"{expression}.{name}"
+    return f"getattr({expression}, {name!r})"
+
+
+def compile_function(name: str, source: str, namespace: Optional[Dict[str, Any]] = None) -> Callable:
+    """
+    Compiles source code defining a single function.
+
+    :param name: function name
+    :param source: source code of the function
+    :param namespace: globals available to the function
+    :returns: compiled function
+    """
+    namespace = dict(namespace or {})
+    exec(compile(source, f"<generated {name}>", "exec"), namespace)
+    return namespace[name]
+
+
+class CompiledMethod:
+    """
+    Method whose code is generated for the class it's accessed on. The code is generated on the first access and
+    the generated function replaces the descriptor in the class, so next calls cost as much as any other method.
+    """
+
+    def __init__(self, name: str, generate: Callable[[Type], Callable], is_classmethod: bool = False):
+        """
+        :param name: attribute name of the method
+        :param generate: creates the function for a class
+        :param is_classmethod: bind the function to the class instead of instances
+        """
+        self.name = name
+        self.generate = generate
+        self.is_classmethod = is_classmethod
+
+    def __get__(self, instance: Any, owner: Type) -> Callable:
+        function = self.generate(owner)
+        method = classmethod(function) if self.is_classmethod else function
+        setattr(owner, self.name, method)
+        return method.__get__(instance, owner)
@@ -0,0 +1,113 @@
+from dataclasses import fields
+from operator import attrgetter
+from typing import Any, Callable, List, NamedTuple, Tuple, Type
+
+from data_snack_dynamic_entity.compiled import CompiledMethod, attribute, compile_function
+
+
+class SourcePlan(NamedTuple):
+    source_fields: Tuple[str, ...]  # attributes read from the source entity, in mapping order
+    positions: Tuple[int, ...]  # positions of compound entity fields receiving them
+    getter: Callable[[Any], Tuple]  # reads all source fields at once
+
+
+class AssemblyPlan(NamedTuple):
+    """Flat, index-based description of how a compound entity is assembled from its source entities."""
+    fields: Tuple[str, ...]  # fields of the compound entity in the order of its constructor
+    sources: Tuple[SourcePlan, ...]
+    key_positions: Tuple[int, ...]  # positions of fields returned by `get_keys()`
+
+
+def _tuple_getter(names: Tuple[str, ...]) -> Callable[[Any], Tuple]:
+    if len(names) > 1:
+        return attrgetter(*names)
+    if names:
+        getter = attrgetter(names[0])
+        return lambda entity: (getter(entity),)
+    return lambda entity: ()
+
+
+def build_assembly_plan(entity_type: Type) -> AssemblyPlan:
+    """
+    Resolves field mappings of compound entity sources into constructor positions.
+
+    :param entity_type: CompoundEntity type
+    :returns: assembly plan
+    """
+    field_names = tuple(entity_field.name for entity_field in fields(entity_type) if entity_field.init)
+    position = {field_name: index for index, field_name in enumerate(field_names)}
+    sources = []
+    for source in entity_type.Meta.sources:
+        mapping = [
+            (source_field, position[field_name])
+            for field_name, source_field in source.fields_mapping.items() if field_name in position
+        ]
+        source_fields = tuple(source_field for source_field, _ in mapping)
+        sources.append(SourcePlan(source_fields, tuple(index for _, index in mapping), _tuple_getter(source_fields)))
+    return AssemblyPlan(field_names, tuple(sources), tuple(position[key] for key in entity_type.get_keys()))
+
+
+def _render_assignments(plan: AssemblyPlan) -> List[str]:
+    """
+    Renders assignments of source entity values to local variables, one per field.
+    Sources are visited in reversed order, so a field mapped from many sources takes the value of the first
+    existing one, like `CompoundEntity.create_from_source_entities` does.
+    """
+    lines = [f"    {' = '.join(f'v{index}' for index in range(len(plan.fields)))} = None"] if plan.fields else []
+    for source_index in reversed(range(len(plan.sources))):
+        source_plan = plan.sources[source_index]
+        if not source_plan.positions:
+            continue
+        lines.append(f"    if e{source_index} is not None:")
+        lines += [
+            f"        v{index} = {attribute(f'e{source_index}', source_field)}"
+            for source_field, index in zip(source_plan.source_fields, source_plan.positions)
+        ]
+    return lines
+
+
+def _render_constructor_call(plan: AssemblyPlan) -> str:
+    return f"    return cls({', '.join(f'v{index}' for index in range(len(plan.fields)))})"
+
+
+def _generate_from_sources(entity_type: Type) -> Callable:
+    plan = entity_type._assembly_plan
+    arguments = "".join(f", e{index}" for index in range(len(plan.sources)))
+    source = "\n".join([
+        f"def from_sources(cls{arguments}):",
+        *_render_assignments(plan),
+        _render_constructor_call(plan),
+    ])
+    return compile_function("from_sources", source)
+
+
+def _generate_create_from_source_entities(entity_type: Type) -> Callable:
+    plan = entity_type._assembly_plan
+    lines = ["def create_from_source_entities(cls, entities, entities_field_mappings, key_values):"]
+    if plan.sources:
+        lines.append(f"    {''.join(f'e{index}, ' for index in range(len(plan.sources)))}= entities")
+    lines += _render_assignments(plan)
+    if plan.key_positions:
+        lines.append(f"    {''.join(f'v{index}, ' for index in plan.key_positions)}= key_values")
+    lines.append(_render_constructor_call(plan))
+    return compile_function("create_from_source_entities", "\n".join(lines))
+
+
+def add_assembly_plan(entity_type: Type) -> Type:
+    """
+    Precomputes the assembly plan of a compound entity and adds constructors using it:
+    - `from_sources(*entities)` creates the entity from source entities given in the order of `Meta.sources`,
+      `None` stands for a missing source and fields without any existing source are set to None,
+    - `create_from_source_entities`, used by `Snack` while getting compound entities, is replaced with an
+      equivalent which doesn't walk field mappings on each call.
+    The code of both is generated on their first use.
+
+    :param entity_type: CompoundEntity type
+    :returns: the same type
+    """
+    entity_type._assembly_plan = build_assembly_plan(entity_type)
+    entity_type.from_sources = CompiledMethod("from_sources", _generate_from_sources, is_classmethod=True)
+    entity_type.create_from_source_entities = CompiledMethod(
+        "create_from_source_entities", _generate_create_from_source_entities, is_classmethod=True
+    )
+    return entity_type
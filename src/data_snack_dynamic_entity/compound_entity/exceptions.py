@@ -1,2 +1,10 @@
 class NonExistingSourceEntityException(Exception):
     ...
+
+
+class CyclicSourceEntityException(Exception):
+    ...
+
+
+class FieldsOrderException(Exception):
+    ...
@@ -1,12 +1,26 @@
-from dataclasses import dataclass, field, make_dataclass, MISSING
-from typing import Dict, Type, List
+from dataclasses import dataclass, field, make_dataclass, Field, MISSING
+from typing import Dict, Type, List, Optional
 
 from data_snack.entities.compound import CompoundEntity
 from data_snack.entities.exceptions import SourceEntityFieldException
 from data_snack.entities.models import SourceEntity, EntityFieldMapping
 
-from data_snack_dynamic_entity.compound_entity.exceptions import NonExistingSourceEntityException
-from data_snack_dynamic_entity.compound_entity.types import CompoundEntitySchema, CompoundEntityTemplates
+from data_snack_dynamic_entity.cache import EntityCache, compound_entity_key
+from data_snack_dynamic_entity.compound_entity.assembly import add_assembly_plan
+from data_snack_dynamic_entity.compound_entity.exceptions import (
+    FieldsOrderException,
+    NonExistingSourceEntityException,
+)
+from data_snack_dynamic_entity.compound_entity.types import (
+    CompoundEntitySchema,
+    CompoundEntitySpec,
+    CompoundEntityTemplates,
+    CompoundFieldSpec,
+)
+from data_snack_dynamic_entity.graph import EntityGraph
+from data_snack_dynamic_entity.profiling import COMPOUND_ENTITIES, LoadObserver, observe_entity
+from data_snack_dynamic_entity.serializers import add_serializers
+from data_snack_dynamic_entity.utils import add_slots
 from data_snack_dynamic_entity.validate import validate_entity_templates
 
 
@@ -40,37 +54,84 @@ def create_source_entities(source_entities: Dict[str, Type], entity_schema: Comp
 
 @dataclass
 class CompoundEntityFactory:
-    def load_entities(self, templates: CompoundEntityTemplates, source_entities: Dict[str, Type]) -> Dict[str, Type]:
+    cache: Optional[EntityCache] = None  # created types are reused from the cache if provided
+    slots: bool = False  # create all types with `__slots__`, can be enabled per entity in the template as well
+    observer: Optional[LoadObserver] = None  # notified about the time of creating each entity
+
+    def load_entities(
+            self, templates: CompoundEntityTemplates, source_entities: Dict[str, Type], validate: bool = True
+    ) -> Dict[str, Type]:
         """
         Creates new CompoundEntity types based on provided config.
         Config should contain a valid template that is created according to the schema (see README).
+        Compound entities can use other compound entities from the config as sources, they are created in
+        topological order of their dependencies.
 
         :param templates: input config containing templates
         :param source_entities: a dictionary with all source Entity types
+        :param validate: validate templates, can be disabled if they were already validated by the caller
         :returns: a dictionary with all created CompoundEntity types
         """
 
-        validate_entity_templates(templates)
-        return {
-            entity_name: self._create_compound_entity(entity_name, entity_schema, source_entities)
-            for entity_name, entity_schema in templates.items()
-        }
+        if validate:
+            validate_entity_templates(templates)
+        available_entities = dict(source_entities)
+        compound_entities = {}
+        for entity_name in EntityGraph.from_templates(templates).topological_order():
+            with observe_entity(self.observer, entity_name, COMPOUND_ENTITIES):
+                compound_entities[entity_name] = available_entities[entity_name] = self.load_entity(
+                    entity_name, templates[entity_name], available_entities
+                )
+        return {entity_name: compound_entities[entity_name] for entity_name in templates}
 
-    def _create_compound_entity(
-            self, entity_name: str, entity_schema: CompoundEntitySchema, source_entities: Dict[str, Type]
+    def load_entity(
+            self,
+            entity_name: str,
+            entity_schema: CompoundEntitySchema,
+            source_entities: Dict[str, Type],
+            spec: Optional[CompoundEntitySpec] = None,
     ) -> Type:
         """
-        Creates compound entity of given name according to given schema.
+        Gets compound entity of given name from the cache or creates it if the template wasn't loaded before.
         :param entity_name: new entity name
         :param entity_schema: new entity schema
         :param source_entities: a dictionary with all source Entity types
+        :param spec: normalized schema, if it was already built by `build_spec`
         :return: new entity type
         """
+        def create() -> Type:
+            return self.create_from_spec(
+                spec or self.build_spec(entity_name, entity_schema, source_entities), source_entities
+            )
+
+        if self.cache is None:
+            return create()
+        return self.cache.get_or_create(
+            compound_entity_key(entity_name, entity_schema, source_entities, {"slots": self.slots}), create
+        )
+
+    @staticmethod
+    def build_spec(
+            entity_name: str, entity_schema: CompoundEntitySchema, source_entities: Dict[str, Type]
+    ) -> CompoundEntitySpec:
+        """
+        Normalizes compound entity schema: resolves fields of source entities and splits them into the ones with
+        and without defaults. The result is json-serializable.
+        Fields follow the order of sources and then the order of their mappings, fields shared between sources
+        are placed where they're mapped first. Fields listed in `fields_order` come first, in the listed order.
+        Fields with defaults always follow the ones without, as dataclasses require.
+        :param entity_name: new entity name
+        :param entity_schema: new entity schema
+        :param source_entities: a dictionary with all source Entity types
+        :return: normalized entity schema
+        :raises:
+            FieldsOrderException: if `fields_order` lists a field which isn't mapped from any source.
+        """
         sources = create_source_entities(source_entities, entity_schema)
 
-        fields = set()
-        fields_with_defaults = set()
-        for source in sources:
+        fields = {}
+        fields_with_defaults = {}
+        for source_index, source in enumerate(sources):
             for entity_field, source_field in source.fields_mapping.items():
                 try:
                     class_field = source.entity.__dataclass_fields__[source_field]
@@ -78,18 +139,71 @@ class CompoundEntityFactory:
                     raise SourceEntityFieldException(
                         f"Source entity {source.entity.__name__} field {e.args[0]} does not exist."
                     )
+                if entity_field in fields or entity_field in fields_with_defaults:
+                    continue  # fields shared between sources, e.g. keys, are defined by the first source
+                field_spec = {"name": entity_field, "source": source_index, "source_field": source_field}
                 if isinstance(class_field.default, type(MISSING)):
-                    fields.add((entity_field, class_field.type))
+                    fields[entity_field] = field_spec
                 else:
-                    fields_with_defaults.add((entity_field, class_field.type, field(default=class_field.default)))
+                    fields_with_defaults[entity_field] = field_spec
+
+        fields_order = entity_schema.get("fields_order", [])
+        if unknown_fields := [name for name in fields_order if name not in fields and name not in fields_with_defaults]:
+            raise FieldsOrderException(f"Fields {unknown_fields} of {entity_name} fields order do not exist.")
+        position = {name: index for index, name in enumerate(fields_order)}
+
+        def ordered(field_specs: Dict[str, CompoundFieldSpec]) -> List[CompoundFieldSpec]:
+            return sorted(field_specs.values(), key=lambda x: position.get(x["name"], len(position)))
+
+        return {
+            "name": entity_name,
+            "sources": entity_schema["sources"],
+            "fields": ordered(fields),
+            "fields_with_defaults": ordered(fields_with_defaults),
+            "slots": entity_schema.get("slots", False),
+        }
+
+    def create_from_spec(self, spec: CompoundEntitySpec, source_entities: Dict[str, Type]) -> Type:
+        """
+        Creates compound entity according to given normalized schema.
+        :param spec: normalized entity schema
+        :param source_entities: a dictionary with all source Entity types
+        :return: new entity type
+        """
+        sources = create_source_entities(source_entities, spec)
+
+        def get_class_field(field_spec: CompoundFieldSpec) -> Field:
+            return sources[field_spec["source"]].entity.__dataclass_fields__[field_spec["source_field"]]
 
-        entity_template = self._create_compound_entity_template(entity_name=entity_name, sources=sources)
-        return make_dataclass(
-            entity_name,
-            list(fields) + list(fields_with_defaults),
+        fields = []
+        for field_spec in spec["fields"]:
+            fields.append((field_spec["name"], get_class_field(field_spec).type))
+        for field_spec in spec["fields_with_defaults"]:
+            class_field = get_class_field(field_spec)
+            fields.append((field_spec["name"], class_field.type, field(default=class_field.default)))
+
+        entity_template = self._create_compound_entity_template(entity_name=spec["name"], sources=sources)
+        entity_type = make_dataclass(
+            spec["name"],
+            fields,
             bases=(entity_template,),
             namespace={"__module__": __name__},
         )
+        if self.slots or spec["slots"]:
+            entity_type = add_slots(entity_type)
+        return add_serializers(add_assembly_plan(entity_type))
+
+    def _create_compound_entity(
+            self, entity_name: str, entity_schema: CompoundEntitySchema, source_entities: Dict[str, Type]
+    ) -> Type:
+        """
+        Creates compound entity of given name according to given schema.
+        :param entity_name: new entity name
+        :param entity_schema: new entity schema
+        :param source_entities: a dictionary with all source Entity types
+        :return: new entity type
+        """
+        return self.create_from_spec(self.build_spec(entity_name, entity_schema, source_entities), source_entities)
 
     @staticmethod
     def _create_compound_entity_template(entity_name: str, sources: List[SourceEntity]) -> Type:
@@ -15,6 +15,23 @@ class SourceEntitySchema(TypedDict):
 class CompoundEntitySchema(TypedDict):
     type: str
     sources: List[SourceEntitySchema]
+    slots: bool
+    fields_order: List[str]
 
 
 CompoundEntityTemplates = Dict[str, CompoundEntitySchema]
+
+
+class CompoundFieldSpec(TypedDict):
+    name: str
+    source: int  # index of the source entity in `sources`
+    source_field: str
+
+
+class CompoundEntitySpec(TypedDict):
+    """Normalized compound entity template, ready to create a type from."""
+    name: str
+    sources: List[SourceEntitySchema]
+    fields: List[CompoundFieldSpec]
+    fields_with_defaults: List[CompoundFieldSpec]
+    slots: bool
@@ -0,0 +1,198 @@
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import List, Optional
+
+from data_snack_dynamic_entity.compound_entity.types import CompoundEntitySchema
+from data_snack_dynamic_entity.simple_entity.factory import SimpleEntityFactory
+from data_snack_dynamic_entity.simple_entity.types import SimpleEntitySchema, SimpleEntitySpec
+from data_snack_dynamic_entity.types import EntityTemplates
+from data_snack_dynamic_entity.utils import same_template
+
+
+class ChangeKind(str, Enum):
+    ENTITY_ADDED = "entity_added"
+    ENTITY_REMOVED = "entity_removed"
+    ENTITY_TYPE_CHANGE = "entity_type_change"
+    VERSION_CHANGE = "version_change"
+    KEY_CHANGE = "key_change"
+    FIELD_ADDED = "field_added"
+    FIELD_ADDED_WITH_DEFAULT = "field_added_with_default"
+    FIELD_REMOVED = "field_removed"
+    FIELD_ORDER_CHANGE = "field_order_change"
+    TYPE_CHANGE = "type_change"
+    OPTIONAL_TOGGLE = "optional_toggle"
+    DEFAULT_CHANGE = "default_change"
+    EXCLUDED_TOGGLE = "excluded_toggle"
+    SLOTS_TOGGLE = "slots_toggle"
+    COMPOUND_SOURCE_REMAP = "compound_source_remap"
+
+
+@dataclass(frozen=True)
+class TemplateChange:
+    entity: str
+    kind: ChangeKind
+    field: Optional[str] = None
+    compatible: bool = True  # keys and payloads stored with the previous template can still be read
+    description: str = ""
+
+
+@dataclass
+class TemplatesDiff:
+    """
+    Changes between two configs, see `diff_templates`.
+    Entities are stored under keys containing their name and version, and their payloads hold values of fields
+    by position: `DataclassSerializer` stores all fields, `TupleSerializer` skips excluded ones. A change is
+    incompatible if keys or payloads stored before it can't be read correctly afterwards by either serializer,
+    such an entity needs a version bump. Compatible changes keep the cached data valid.
+    """
+    changes: List[TemplateChange] = field(default_factory=list)
+
+    def for_entity(self, entity_name: str) -> List[TemplateChange]:
+        """
+        Gets changes of a single entity.
+
+        :param entity_name: entity name
+        :returns: a list of changes
+        """
+        return [change for change in self.changes if change.entity == entity_name]
+
+    @property
+    def changed_entities(self) -> List[str]:
+        """Names of all changed entities."""
+        return list(dict.fromkeys(change.entity for change in self.changes))
+
+    @property
+    def incompatible_entities(self) -> List[str]:
+        """Names of entities with at least one change incompatible with their cached data."""
+        return list(dict.fromkeys(change.entity for change in self.changes if not change.compatible))
+
+    @property
+    def version_bumped(self) -> List[str]:
+        """Names of entities whose version was changed."""
+        return [change.entity for change in self.changes if change.kind == ChangeKind.VERSION_CHANGE]
+
+    @property
+    def version_bump_required(self) -> List[str]:
+        """Names of entities with incompatible changes whose version wasn't changed."""
+        bumped = set(self.version_bumped)
+        return [entity_name for entity_name in self.incompatible_entities if entity_name not in bumped]
+
+    @property
+    def unnecessary_version_bumps(self) -> List[str]:
+        """Names of entities whose version was changed even though all their changes are compatible."""
+        incompatible = set(self.incompatible_entities)
+        return [entity_name for entity_name in self.version_bumped if entity_name not in incompatible]
+
+
+def _payload_order(spec: SimpleEntitySpec) -> List[str]:
+    """Order of values in stored payloads, fields with defaults are placed after the ones without."""
+    return [field_spec["name"] for field_spec in [*spec["fields"], *spec["fields_with_defaults"]]]
+
+
+def _diff_simple_entity(
+        entity_name: str,
+        old_schema: SimpleEntitySchema,
+        new_schema: SimpleEntitySchema,
+) -> List[TemplateChange]:
+    old_spec = SimpleEntityFactory.build_spec(entity_name, old_schema)
+    new_spec = SimpleEntityFactory.build_spec(entity_name, new_schema)
+    old_fields, new_fields = old_schema["properties"], new_schema["properties"]
+    changes = []
+
+    if old_spec["version"] != new_spec["version"]:
+        changes.append(TemplateChange(
+            entity_name, ChangeKind.VERSION_CHANGE, description=f"{old_spec['version']} -> {new_spec['version']}"
+        ))
+    if old_spec["keys"] != new_spec["keys"]:
+        changes.append(TemplateChange(
+            entity_name, ChangeKind.KEY_CHANGE, compatible=False,
+            description=f"{old_spec['keys']} -> {new_spec['keys']}",
+        ))
+    if old_spec["slots"] != new_spec["slots"]:
+        changes.append(TemplateChange(entity_name, ChangeKind.SLOTS_TOGGLE))
+
+    old_order, new_order = _payload_order(old_spec), _payload_order(new_spec)
+    appended = new_order[:len(old_order)] == old_order  # old payloads fill a prefix of new fields
+    for field_name in old_order:
+        if field_name not in new_fields:
+            changes.append(TemplateChange(entity_name, ChangeKind.FIELD_REMOVED, field_name, compatible=False))
+    for field_name in new_order:
+        if field_name in old_fields:
+            continue
+        if "default" in new_fields[field_name]:
+            changes.append(TemplateChange(
+                entity_name, ChangeKind.FIELD_ADDED_WITH_DEFAULT, field_name, compatible=appended,
+                description="" if appended else "shifts positions of stored values",
+            ))
+        else:
+            changes.append(TemplateChange(entity_name, ChangeKind.FIELD_ADDED, field_name, compatible=False))
+    common_old = [field_name for field_name in old_order if field_name in new_fields]
+    common_new = [field_name for field_name in new_order if field_name in old_fields]
+    if common_old != common_new:
+        changes.append(TemplateChange(
+            entity_name, ChangeKind.FIELD_ORDER_CHANGE, compatible=False, description=f"{common_old} -> {common_new}"
+        ))
+
+    for field_name in common_new:
+        old_field, new_field = old_fields[field_name], new_fields[field_name]
+        if old_field["type"] != new_field["type"]:
+            changes.append(TemplateChange(
+                entity_name, ChangeKind.TYPE_CHANGE, field_name, compatible=False,
+                description=f"{old_field['type']} -> {new_field['type']}",
+            ))
+        if old_field.get("optional", False) != new_field.get("optional", False):
+            changes.append(TemplateChange(entity_name, ChangeKind.OPTIONAL_TOGGLE, field_name))
+        if old_field.get("default") != new_field.get("default") or ("default" in old_field) != ("default" in new_field):
+            changes.append(TemplateChange(entity_name, ChangeKind.DEFAULT_CHANGE, field_name))
+        if old_field.get("excluded", False) != new_field.get("excluded", False):
+            changes.append(TemplateChange(
+                entity_name, ChangeKind.EXCLUDED_TOGGLE, field_name, compatible=False,
+                description="shifts positions of values stored by `TupleSerializer`",
+            ))
+    return changes
+
+
+def _diff_compound_entity(
+        entity_name: str,
+        old_schema: CompoundEntitySchema,
+        new_schema: CompoundEntitySchema,
+) -> List[TemplateChange]:
+    changes = []
+    if old_schema["sources"] != new_schema["sources"]:
+        changes.append(TemplateChange(entity_name, ChangeKind.COMPOUND_SOURCE_REMAP))
+    if old_schema.get("fields_order", []) != new_schema.get("fields_order", []):
+        changes.append(TemplateChange(entity_name, ChangeKind.FIELD_ORDER_CHANGE))
+    if old_schema.get("slots", False) != new_schema.get("slots", False):
+        changes.append(TemplateChange(entity_name, ChangeKind.SLOTS_TOGGLE))
+    return changes
+
+
+def diff_templates(old_templates: EntityTemplates, new_templates: EntityTemplates) -> TemplatesDiff:
+    """
+    Compares two valid configs and classifies changes of each entity by their compatibility with cached data.
+    Compound entities are assembled from their sources on read and are never stored, so all their changes
+    are compatible.
+
+    :param old_templates: config used to store cached data
+    :param new_templates: changed config
+    :returns: classified changes
+    """
+    changes = []
+    for entity_name, old_schema in old_templates.items():
+        if entity_name not in new_templates:
+            changes.append(TemplateChange(entity_name, ChangeKind.ENTITY_REMOVED))
+    for entity_name, new_schema in new_templates.items():
+        old_schema = old_templates.get(entity_name)
+        if old_schema is None:
+            changes.append(TemplateChange(entity_name, ChangeKind.ENTITY_ADDED))
+        elif same_template(old_schema, new_schema):  # `==` would ignore reordered properties
+            continue
+        elif old_schema["type"] != new_schema["type"]:
+            changes.append(TemplateChange(
+                entity_name, ChangeKind.ENTITY_TYPE_CHANGE, description=f"{old_schema['type']} -> {new_schema['type']}"
+            ))
+        elif new_schema["type"] == "simple":
+            changes += _diff_simple_entity(entity_name, old_schema, new_schema)
+        else:
+            changes += _diff_compound_entity(entity_name, old_schema, new_schema)
+    return TemplatesDiff(changes)
@@ -0,0 +1,169 @@
+import json
+import os
+from dataclasses import dataclass
+from importlib.metadata import PackageNotFoundError, version
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, Type, TypedDict, Union
+
+from data_snack_dynamic_entity.cache import EntityCache, entity_cache, fingerprint
+from data_snack_dynamic_entity.compound_entity.factory import CompoundEntityFactory
+from data_snack_dynamic_entity.compound_entity.types import CompoundEntitySpec
+from data_snack_dynamic_entity.factory import split_templates_by_type
+from data_snack_dynamic_entity.graph import EntityGraph
+from data_snack_dynamic_entity.simple_entity.factory import SimpleEntityFactory
+from data_snack_dynamic_entity.simple_entity.types import SimpleEntitySpec
+from data_snack_dynamic_entity.types import EntityTemplates
+from data_snack_dynamic_entity.validate import validate_entity_templates
+
+PLAN_FORMAT_VERSION = 1  # bump whenever the plan structure or its meaning changes
+
+
+class BuildPlan(TypedDict):
+    """Everything resolved from templates before creating types: normalized schemas and their build order."""
+    order: List[str]
+    simple_entities: Dict[str, SimpleEntitySpec]
+    compound_entities: Dict[str, CompoundEntitySpec]
+
+
+def _package_version() -> str:
+    try:
+        return version("data-snack-dynamic-entity")
+    except PackageNotFoundError:
+        return "unknown"
+
+
+@dataclass
+class DiskCache:
+    """
+    Stores build plans of templates in a local directory, one file per templates fingerprint.
+    The fingerprint covers the templates, the package version and the plan format,
+    so a plan is never used for a config or a package version it wasn't created with.
+    """
+    directory: Union[str, Path]
+
+    def __post_init__(self):
+        self.directory = Path(self.directory)
+
+    def key(self, templates: EntityTemplates) -> str:
+        """
+        Computes fingerprint of provided templates. The order of properties is a part of it, as plans store fields
+        in that order.
+
+        :param templates: input config containing templates
+        :returns: fingerprint used as the cache key
+        """
+        return fingerprint([PLAN_FORMAT_VERSION, _package_version(), templates])
+
+    def load(self, key: str) -> Optional[BuildPlan]:
+        """
+        Reads a stored build plan.
+
+        :param key: templates fingerprint
+        :returns: build plan or None if it's missing or unreadable
+        """
+        try:
+            return json.loads((self.directory / f"{key}.json").read_text())
+        except (OSError, ValueError):
+            return None
+
+    def store(self, key: str, plan: BuildPlan) -> None:
+        """
+        Writes a build plan. The file is replaced atomically, so concurrent processes never read a partial plan.
+
+        :param key: templates fingerprint
+        :param plan: build plan
+        """
+        self.directory.mkdir(parents=True, exist_ok=True)
+        path = self.directory / f"{key}.json"
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        tmp_path.write_text(json.dumps(plan))
+        os.replace(tmp_path, path)
+
+    def clear(self) -> None:
+        """Removes all stored build plans."""
+        for path in self.directory.glob("*.json"):
+            path.unlink()
+
+
+def _create_plan(
+        templates: EntityTemplates,
+        simple_entity_factory: SimpleEntityFactory,
+        compound_entity_factory: CompoundEntityFactory,
+) -> Tuple[BuildPlan, Dict[str, Type]]:
+    simple_entities_templates, compound_entities_templates = split_templates_by_type(templates)
+    plan = {
+        "order": [
+            *simple_entities_templates,
+            *EntityGraph.from_templates(compound_entities_templates).topological_order(),
+        ],
+        "simple_entities": {},
+        "compound_entities": {},
+    }
+    entities = {}
+    for entity_name in plan["order"]:
+        entity_schema = templates[entity_name]
+        if entity_name in simple_entities_templates:
+            spec = plan["simple_entities"][entity_name] = simple_entity_factory.build_spec(entity_name, entity_schema)
+            entities[entity_name] = simple_entity_factory.load_entity(entity_name, entity_schema, spec)
+        else:
+            spec = plan["compound_entities"][entity_name] = compound_entity_factory.build_spec(
+                entity_name, entity_schema, entities
+            )
+            entities[entity_name] = compound_entity_factory.load_entity(entity_name, entity_schema, entities, spec)
+    return plan, entities
+
+
+def _create_entities(
+        plan: BuildPlan,
+        templates: EntityTemplates,
+        simple_entity_factory: SimpleEntityFactory,
+        compound_entity_factory: CompoundEntityFactory,
+) -> Dict[str, Type]:
+    entities = {}
+    for entity_name in plan["order"]:
+        entity_schema = templates[entity_name]
+        if spec := plan["simple_entities"].get(entity_name):
+            entities[entity_name] = simple_entity_factory.load_entity(entity_name, entity_schema, spec)
+        else:
+            entities[entity_name] = compound_entity_factory.load_entity(
+                entity_name, entity_schema, entities, plan["compound_entities"][entity_name]
+            )
+    return entities
+
+
+def load_entities_with_disk_cache(
+        templates: EntityTemplates,
+        disk_cache: DiskCache,
+        types_mapping: Dict[str, Any] = None,
+        cache: Optional[EntityCache] = entity_cache,
+        validate: bool = True,
+        fast_validation: bool = False,
+) -> Dict[str, Type]:
+    """
+    Creates new Entity and CompoundEntity types like `load_entities`, persisting the build plan on disk.
+    If a plan of the same templates is already stored, validation and normalization are skipped entirely.
+
+    :param templates: input config containing templates
+    :param disk_cache: storage of build plans
+    :param types_mapping: custom types mapping, e.g. `{"numpy.float16": numpy.float16}`
+    :param cache: cache of created types, process-wide cache is used by default, `None` disables caching
+    :param validate: validate templates if the plan isn't stored yet
+    :param fast_validation: use the hand-written validator instead of the generic jsonschema one
+    :returns: a dictionary with all created types
+    """
+    simple_entity_factory = SimpleEntityFactory(types_mapping or {}, cache=cache)
+    compound_entity_factory = CompoundEntityFactory(cache=cache)
+    key = disk_cache.key(templates)
+
+    if (plan := disk_cache.load(key)) is not None:
+        entities = _create_entities(plan, templates, simple_entity_factory, compound_entity_factory)
+    else:
+        if validate:
+            validate_entity_templates(templates, fast=fast_validation)
+        plan, entities = _create_plan(templates, simple_entity_factory, compound_entity_factory)
+        disk_cache.store(key, plan)
+
+    return {
+        **{name: entities[name] for name in templates if name in plan["simple_entities"]},
+        **{name: entities[name] for name in templates if name in plan["compound_entities"]},
+    }
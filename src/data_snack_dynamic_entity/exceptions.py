@@ -0,0 +1,6 @@
+class DuplicateEntityException(Exception):
+    ...
+
+
+class InvalidTemplatesFileException(Exception):
+    ...
@@ -1,10 +1,22 @@
-from typing import Dict, Any, Type, Tuple
+from dataclasses import dataclass, field
+from typing import Dict, Any, Iterable, Iterator, Mapping, Type, Tuple, Optional
 
+from data_snack_dynamic_entity.cache import EntityCache, entity_cache
 from data_snack_dynamic_entity.compound_entity.factory import CompoundEntityFactory
 from data_snack_dynamic_entity.compound_entity.types import CompoundEntityTemplates
+from data_snack_dynamic_entity.graph import EntityGraph
+from data_snack_dynamic_entity.profiling import (
+    COMPOUND_ENTITIES,
+    SIMPLE_ENTITIES,
+    SPLIT,
+    VALIDATION,
+    LoadObserver,
+    observe_phase,
+)
 from data_snack_dynamic_entity.simple_entity.factory import SimpleEntityFactory
 from data_snack_dynamic_entity.simple_entity.types import SimpleEntityTemplates
 from data_snack_dynamic_entity.types import EntityTemplates
+from data_snack_dynamic_entity.validate import EntityTemplatesValidator, validate_entity_templates
 
 
 def split_templates_by_type(templates: EntityTemplates) -> Tuple[SimpleEntityTemplates, CompoundEntityTemplates]:
@@ -17,12 +29,112 @@ def split_templates_by_type(templates: EntityTemplates) -> Tuple[SimpleEntityTem
     return simple_entities, compound_entities
 
 
-def load_entities(templates: EntityTemplates, types_mapping: Dict[str, Any] = None) -> Dict[str, Type]:
+@dataclass
+class EntityBuilder:
+    """
+    Creates types of single entities of a config, e.g. to create again only entities affected by changed templates
+    and reuse all other types. Templates aren't validated.
+    """
+    types_mapping: Dict[str, Any] = field(default_factory=dict)
+    cache: Optional[EntityCache] = entity_cache
+
+    def __post_init__(self):
+        self._simple_entity_factory = SimpleEntityFactory(self.types_mapping, cache=self.cache)
+        self._compound_entity_factory = CompoundEntityFactory(cache=self.cache)
+
+    def create(self, entity_name: str, entity_schema: Dict, entities: Mapping[str, Type]) -> Type:
+        """
+        Creates the type of a single entity.
+
+        :param entity_name: name of the entity
+        :param entity_schema: template of the entity
+        :param entities: already created types, sources of compound entities are taken from them
+        :returns: created type
+        """
+        if entity_schema["type"] == "simple":
+            return self._simple_entity_factory.load_entity(entity_name, entity_schema)
+        return self._compound_entity_factory.load_entity(entity_name, entity_schema, entities)
+
+    def create_in_order(
+            self, templates: EntityTemplates, entity_names: Iterable[str], entities: Dict[str, Type]
+    ) -> Iterator[str]:
+        """
+        Creates types of given entities in topological order of their dependencies, adding them to `entities`.
+        Yields the name of each entity once it was created, so callers can do other work in the meantime.
+
+        :param templates: input config containing templates
+        :param entity_names: names of entities to create
+        :param entities: already created types, updated with created ones
+        :returns: iterator of names of created entities
+        """
+        for entity_name in EntityGraph.from_templates(templates).topological_order(entity_names):
+            entities[entity_name] = self.create(entity_name, templates[entity_name], entities)
+            yield entity_name
+
+    def rebuild(
+            self, templates: EntityTemplates, outdated: Iterable[str], previous: Mapping[str, Type]
+    ) -> Dict[str, Type]:
+        """
+        Creates types of outdated entities again, reusing previous types of all other entities.
+        Outdated entities need to include compound entities depending on them, see `EntityGraph.downstream`.
+
+        :param templates: input config containing templates
+        :param outdated: names of entities to create again
+        :param previous: previous types of entities, types of entities missing in templates are dropped
+        :returns: a dictionary with all types, see `load_entities`
+        """
+        outdated = set(outdated)
+        entities = {name: t for name, t in previous.items() if name in templates and name not in outdated}
+        for _ in self.create_in_order(templates, outdated, entities):
+            pass
+        simple_entities, compound_entities = split_templates_by_type(templates)
+        return {name: entities[name] for name in [*simple_entities, *compound_entities]}
+
+
+def load_entities(
+        templates: EntityTemplates,
+        types_mapping: Dict[str, Any] = None,
+        cache: Optional[EntityCache] = entity_cache,
+        validate: bool = True,
+        fast_validation: bool = False,
+        validator: Optional[EntityTemplatesValidator] = None,
+        observer: Optional[LoadObserver] = None,
+) -> Dict[str, Type]:
+    """
+    Creates new Entity and CompoundEntity types based on provided config.
+    Types of unchanged templates are reused from the cache, so repeated loads return the same class objects.
+    Simple entities are created first, then compound entities in topological order of their sources.
+    Templates are validated once for the whole config, factories don't repeat the validation.
+
+    :param templates: input config containing templates
+    :param types_mapping: custom types mapping, e.g. `{"numpy.float16": numpy.float16}`
+    :param cache: cache of created types, process-wide cache is used by default, `None` disables caching
+    :param validate: validate templates, can be disabled if they were already validated by the caller
+    :param fast_validation: use the hand-written validator instead of the generic jsonschema one
+    :param validator: incremental validator used instead of validating the whole config,
+        reusing it between loads skips entities that were already validated
+    :param observer: notified about the time of each phase and of creating each entity,
+        see `profiling.ProfileCollector`
+    :returns: a dictionary with all created types
+    """
     if not types_mapping:
         types_mapping = {}
+    if validate:
+        with observe_phase(observer, VALIDATION):
+            if validator is not None:
+                validator.validate(templates)
+            else:
+                validate_entity_templates(templates, fast=fast_validation)
 
-    simple_entities_templates, compound_entities_templates = split_templates_by_type(templates)
-    simple_entities = SimpleEntityFactory(types_mapping).load_entities(simple_entities_templates)
-    compound_entities = CompoundEntityFactory().load_entities(compound_entities_templates, simple_entities)
+    with observe_phase(observer, SPLIT):
+        simple_entities_templates, compound_entities_templates = split_templates_by_type(templates)
+    with observe_phase(observer, SIMPLE_ENTITIES):
+        simple_entities = SimpleEntityFactory(types_mapping, cache=cache, observer=observer).load_entities(
+            simple_entities_templates, validate=False
+        )
+    with observe_phase(observer, COMPOUND_ENTITIES):
+        compound_entities = CompoundEntityFactory(cache=cache, observer=observer).load_entities(
+            compound_entities_templates, simple_entities, validate=False
+        )
     return {**simple_entities, **compound_entities}
 
@@ -0,0 +1,114 @@
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional, Set
+
+from data_snack_dynamic_entity.compound_entity.exceptions import CyclicSourceEntityException
+from data_snack_dynamic_entity.types import EntityTemplates
+
+
+@dataclass
+class EntityGraph:
+    """
+    Dependency graph of entities, compound entities depend on their source entities.
+    Dependencies which are not defined in the graph are kept, but ignored while ordering.
+    """
+    dependencies: Dict[str, List[str]] = field(default_factory=dict)
+
+    @classmethod
+    def from_templates(cls, templates: EntityTemplates) -> "EntityGraph":
+        """
+        Builds the graph from `sources[].entity` references of provided templates.
+
+        :param templates: input config containing templates
+        :returns: entity graph
+        """
+        dependencies = {}
+        for entity_name, entity_schema in templates.items():
+            sources = entity_schema.get("sources", []) if isinstance(entity_schema, dict) else []
+            dependencies[entity_name] = list(dict.fromkeys(
+                source["entity"] for source in sources if isinstance(source, dict) and "entity" in source
+            ))
+        return cls(dependencies)
+
+    @property
+    def dependents(self) -> Dict[str, List[str]]:
+        """Reversed graph, maps each entity to entities using it as a source."""
+        dependents = {entity_name: [] for entity_name in self.dependencies}
+        for entity_name, dependencies in self.dependencies.items():
+            for dependency in dependencies:
+                if dependency in dependents:
+                    dependents[dependency].append(entity_name)
+        return dependents
+
+    def upstream(self, entity_names: Iterable[str]) -> Set[str]:
+        """
+        Finds given entities together with all entities they depend on, directly or indirectly.
+
+        :param entity_names: names of entities
+        :returns: names of found entities
+        """
+        return self._walk(entity_names, self.dependencies)
+
+    def downstream(self, entity_names: Iterable[str]) -> Set[str]:
+        """
+        Finds given entities together with all entities depending on them, directly or indirectly.
+
+        :param entity_names: names of entities
+        :returns: names of found entities
+        """
+        return self._walk(entity_names, self.dependents)
+
+    def topological_order(self, entity_names: Optional[Iterable[str]] = None) -> List[str]:
+        """
+        Orders entities, so each entity comes after all of its dependencies.
+        Entities without mutual dependencies keep the order of the graph definition.
+
+        :param entity_names: names of entities to order, all entities by default
+        :returns: ordered names of entities
+        :raises:
+            CyclicSourceEntityException: if entities depend on each other.
+        """
+        selected = set(self.dependencies if entity_names is None else entity_names) & self.dependencies.keys()
+        nodes = [entity_name for entity_name in self.dependencies if entity_name in selected]
+        in_degree = {
+            entity_name: sum(dependency in selected for dependency in self.dependencies[entity_name])
+            for entity_name in nodes
+        }
+        dependents = self.dependents
+        queue = deque(entity_name for entity_name in nodes if not in_degree[entity_name])
+        order = []
+        while queue:
+            entity_name = queue.popleft()
+            order.append(entity_name)
+            for dependent in dependents[entity_name]:
+                if dependent in selected:
+                    in_degree[dependent] -= 1
+                    if not in_degree[dependent]:
+                        queue.append(dependent)
+
+        if len(order) < len(nodes):
+            raise CyclicSourceEntityException(
+                f"Cyclic source entities: {' -> '.join(self._find_cycle(set(nodes) - set(order)))}"
+            )
+        return order
+
+    def _find_cycle(self, entity_names: Set[str]) -> List[str]:
+        path, visited = [], set()
+        entity_name = min(entity_names)
+        while entity_name not in visited:
+            visited.add(entity_name)
+            path.append(entity_name)
+            entity_name = next(d for d in self.dependencies[entity_name] if d in entity_names)
+        return path[path.index(entity_name):] + [entity_name]
+
+    @staticmethod
+    def _walk(entity_names: Iterable[str], edges: Dict[str, List[str]]) -> Set[str]:
+        found = set()
+        stack = list(entity_names)
+        while stack:
+            entity_name = stack.pop()
+            if entity_name in found:
+                continue
+            found.add(entity_name)
+            stack.extend(edges.get(entity_name, []))
+        return found
@@ -0,0 +1,120 @@
+from dataclasses import dataclass, field
+from hashlib import md5
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Type, Union
+
+import numpy as np
+from data_snack.key_factories import ClusterKey, HashKey, Key, NonClusterKey
+
+from data_snack_dynamic_entity.compiled import compile_function
+
+Columns = Union[Dict[str, Sequence[Any]], Sequence[Sequence[Any]]]
+
+if hasattr(np, "strings"):  # NumPy 2: variable-width strings and string ufuncs
+    _STRING_DTYPE, _add_strings = np.dtypes.StringDType(), np.strings.add
+else:
+    _STRING_DTYPE, _add_strings = np.dtype(str), np.char.add
+
+
+def _compile_join(prefix: str, size: int) -> Callable[..., List[str]]:
+    """Compiles a function building key strings from `size` columns, like `Key.keystring` does for a single key."""
+    columns = ", ".join(f"c{index}" for index in range(size))
+    values = "".join(f"v{index}, " for index in range(size))
+    pattern = prefix.replace("{", "{{").replace("}", "}}") + "_".join(f"{{v{index}!s}}" for index in range(size))
+    source = "\n".join([
+        f"def join({columns}):",
+        f"    return [f{pattern!r} for {values}in zip({columns})]",
+    ])
+    return compile_function("join", source)
+
+
+@dataclass
+class KeyBuilder:
+    """
+    Builds key strings of many entities of a single type at once, equal to `key_factory(...).keystring`.
+    The constant part of keys, containing the entity name and version, is computed once. `NonClusterKey`, `ClusterKey`
+    and `HashKey` are built in batches, other key factories fall back to creating a key object per entity.
+    """
+    entity_type: Type
+    key_factory: Type[Key] = NonClusterKey
+    _join: Optional[Callable[..., List[str]]] = field(default=None, init=False, repr=False)
+
+    def __post_init__(self):
+        self.keys = list(self.entity_type.get_keys())
+        if self.key_factory in (NonClusterKey, ClusterKey, HashKey):  # subclasses may change the key format
+            self.prefix = self._prefix()
+            self._join = _compile_join(self.prefix, len(self.keys))
+
+    def _prefix(self) -> str:
+        """Key string of empty key values, i.e. everything before them."""
+        if self.key_factory is HashKey:
+            return f"{self.entity_type.__name__}-{self.entity_type.version}-"  # hashed after joining key values
+        return self.key_factory(self.entity_type, []).get_pattern("")
+
+    def from_columns(self, columns: Columns, use_numpy: bool = False) -> Union[List[str], np.ndarray]:
+        """
+        Builds key strings from columns of key values.
+
+        :param columns: a dictionary of key field columns or columns in the order of `get_keys()`
+        :param use_numpy: concatenate strings with NumPy, returns a NumPy array of strings instead of a list;
+            saves converting columns which already are NumPy arrays, e.g. columns of a batch
+        :returns: key strings
+        """
+        if isinstance(columns, dict):
+            columns = [columns[key] for key in self.keys]
+        if self._join is None:
+            return [self.key_factory(self.entity_type, list(values)).keystring for values in zip(*columns)]
+        if use_numpy:
+            return self._from_columns_numpy(columns)
+        keystrings = self._join(*columns)
+        if self.key_factory is HashKey:
+            return [md5(keystring.encode()).hexdigest() for keystring in keystrings]
+        return keystrings
+
+    def _from_columns_numpy(self, columns: Sequence[Sequence[Any]]) -> np.ndarray:
+        keystrings = np.full(len(columns[0]) if columns else 0, self.prefix, dtype=_STRING_DTYPE)
+        for index, column in enumerate(columns):
+            if index:
+                keystrings = _add_strings(keystrings, "_")
+            keystrings = _add_strings(keystrings, np.asarray(column).astype(_STRING_DTYPE))
+        if self.key_factory is HashKey:
+            return np.array([md5(keystring.encode()).hexdigest() for keystring in keystrings.tolist()])
+        return keystrings
+
+    def from_rows(self, rows: Iterable[Sequence[Any]]) -> List[str]:
+        """
+        Builds key strings from rows of key values, each in the order of `get_keys()`.
+
+        :param rows: key values of entities
+        :returns: key strings
+        """
+        rows = list(rows)
+        if self._join is None:
+            return [self.key_factory(self.entity_type, list(values)).keystring for values in rows]
+        return self.from_columns(list(zip(*rows)) if rows else [[] for _ in self.keys])
+
+    def from_entities(self, entities: Iterable[Any]) -> List[str]:
+        """
+        Builds key strings of entity instances.
+
+        :param entities: entities
+        :returns: key strings
+        """
+        entities = list(entities)
+        return self.from_columns([[getattr(entity, key) for entity in entities] for key in self.keys])
+
+
+def key_builder(entity_type: Type, key_factory: Type[Key] = NonClusterKey) -> KeyBuilder:
+    """
+    Gets the key builder of an entity, builders are created once per entity and key factory.
+
+    :param entity_type: Entity type
+    :param key_factory: data-snack key factory, the same one as used by `Snack`
+    :returns: key builder
+    """
+    builders = vars(entity_type).get("_key_builders")
+    if builders is None:
+        builders = {}
+        entity_type._key_builders = builders
+    if (builder := builders.get(key_factory)) is None:
+        builder = builders[key_factory] = KeyBuilder(entity_type, key_factory)
+    return builder
@@ -0,0 +1,99 @@
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+from threading import RLock
+from typing import Any, Dict, Iterator, List, Optional, Type
+
+from data_snack_dynamic_entity.cache import EntityCache, entity_cache
+from data_snack_dynamic_entity.factory import EntityBuilder
+from data_snack_dynamic_entity.graph import EntityGraph
+from data_snack_dynamic_entity.types import EntityTemplates
+from data_snack_dynamic_entity.validate import EntityTemplatesValidator, ValidationError, validate_entity_templates
+
+
+@dataclass(eq=False)
+class LazyEntities(Mapping):
+    """
+    Read-only mapping of entity types which are created on the first lookup.
+    Resolving a compound entity creates only the source entities it depends on, directly or indirectly.
+    If `validator` is provided, each template is validated right before its entity is created.
+    """
+    templates: EntityTemplates
+    types_mapping: Dict[str, Any] = field(default_factory=dict)
+    cache: Optional[EntityCache] = entity_cache
+    validator: Optional[EntityTemplatesValidator] = None
+    _entities: Dict[str, Type] = field(default_factory=dict, init=False, repr=False)
+    _lock: RLock = field(default_factory=RLock, init=False, repr=False)
+
+    def __post_init__(self):
+        self.graph = EntityGraph.from_templates(self.templates)
+        self._builder = EntityBuilder(self.types_mapping, cache=self.cache)
+
+    def __getitem__(self, entity_name: str) -> Type:
+        if (entity_type := self._entities.get(entity_name)) is not None:
+            return entity_type
+        if entity_name not in self.templates:
+            raise KeyError(entity_name)
+        with self._lock:
+            return self._resolve(entity_name)
+
+    def __contains__(self, entity_name: Any) -> bool:
+        return entity_name in self.templates
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.templates)
+
+    def __len__(self) -> int:
+        return len(self.templates)
+
+    @property
+    def loaded(self) -> List[str]:
+        """Names of entities created so far."""
+        return list(self._entities)
+
+    def load_all(self) -> Dict[str, Type]:
+        """
+        Creates all remaining entities.
+
+        :returns: a dictionary with all created types
+        """
+        return {entity_name: self[entity_name] for entity_name in self.templates}
+
+    def _validate(self, entity_name: str) -> None:
+        if self.validator is None:
+            return
+        if errors := self.validator.collect_entity_errors(entity_name, self.templates[entity_name]):
+            raise ValidationError({entity_name: errors})
+
+    def _resolve(self, entity_name: str) -> Type:
+        for name in self.graph.topological_order(self.graph.upstream([entity_name]) - self._entities.keys()):
+            self._validate(name)
+            self._entities[name] = self._builder.create(name, self.templates[name], self._entities)
+        return self._entities[entity_name]
+
+
+def load_entities_lazy(
+        templates: EntityTemplates,
+        types_mapping: Dict[str, Any] = None,
+        cache: Optional[EntityCache] = entity_cache,
+        validate: bool = True,
+        validate_on_demand: bool = False,
+        fast_validation: bool = False,
+) -> LazyEntities:
+    """
+    Creates a mapping of Entity and CompoundEntity types based on provided config, each type is created on its
+    first lookup. Useful if only a small part of a big config is used.
+
+    :param templates: input config containing templates
+    :param types_mapping: custom types mapping, e.g. `{"numpy.float16": numpy.float16}`
+    :param cache: cache of created types, process-wide cache is used by default, `None` disables caching
+    :param validate: validate templates
+    :param validate_on_demand: validate each template on lookup instead of validating the whole config upfront
+    :param fast_validation: use the hand-written validator instead of the generic jsonschema one
+    :returns: a lazy mapping with all types
+    """
+    validator = None
+    if validate and validate_on_demand:
+        validator = EntityTemplatesValidator(fast=fast_validation)
+    elif validate:
+        validate_entity_templates(templates, fast=fast_validation)
+    return LazyEntities(templates, types_mapping or {}, cache=cache, validator=validator)
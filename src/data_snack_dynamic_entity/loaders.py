@@ -0,0 +1,333 @@
+import json
+from collections import defaultdict
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, IO, Iterable, Iterator, List, Optional, TextIO, Tuple, Type, Union
+
+from data_snack_dynamic_entity.cache import EntityCache, entity_cache
+from data_snack_dynamic_entity.compound_entity.exceptions import NonExistingSourceEntityException
+from data_snack_dynamic_entity.compound_entity.factory import CompoundEntityFactory
+from data_snack_dynamic_entity.exceptions import DuplicateEntityException, InvalidTemplatesFileException
+from data_snack_dynamic_entity.factory import load_entities
+from data_snack_dynamic_entity.graph import EntityGraph
+from data_snack_dynamic_entity.simple_entity.factory import SimpleEntityFactory
+from data_snack_dynamic_entity.types import EntityTemplates
+from data_snack_dynamic_entity.validate import EntityTemplatesValidator, SchemaError, ValidationError, detach_errors
+
+PathLike = Union[str, Path]
+DEFAULT_CHUNK_SIZE = 1 << 16
+YAML_SUFFIXES = (".yaml", ".yml")
+
+_WHITESPACE = " \t\n\r"
+
+
+class _JsonObjectReader:
+    """Reads members of a top-level JSON object one by one, keeping only the current member in memory."""
+
+    def __init__(self, file: TextIO, chunk_size: int = DEFAULT_CHUNK_SIZE):
+        self._file = file
+        self._chunk_size = chunk_size
+        self._decoder = json.JSONDecoder()
+        self._buffer = ""
+        self._pos = 0
+        self._eof = False
+
+    def _fill(self, size: int) -> None:
+        self._buffer = self._buffer[self._pos:]
+        self._pos = 0
+        chunk = self._file.read(size)
+        self._eof = not chunk
+        self._buffer += chunk
+
+    def _peek(self) -> str:
+        while True:
+            while self._pos < len(self._buffer) and self._buffer[self._pos] in _WHITESPACE:
+                self._pos += 1
+            if self._pos < len(self._buffer) or self._eof:
+                return self._buffer[self._pos:self._pos + 1]
+            self._fill(self._chunk_size)
+
+    def _expect(self, chars: str) -> str:
+        char = self._peek()
+        if not char or char not in chars:
+            raise json.JSONDecodeError(f"Expecting one of {chars!r}", self._buffer, self._pos)
+        self._pos += 1
+        return char
+
+    def _decode(self) -> Any:
+        self._peek()
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buffer, self._pos)
+                if end < len(self._buffer) or self._eof:  # a value ending with the buffer might be truncated
+                    self._pos = end
+                    return value
+            except json.JSONDecodeError:
+                if self._eof:
+                    raise
+            # growing reads proportionally to the buffer keep re-decoding of big values linear
+            self._fill(max(self._chunk_size, len(self._buffer) - self._pos))
+
+    def __iter__(self) -> Iterator[Tuple[str, Any]]:
+        self._expect("{")
+        if self._peek() == "}":
+            return
+        while True:
+            key = self._decode()
+            if not isinstance(key, str):
+                raise json.JSONDecodeError("Expecting property name", self._buffer, self._pos)
+            self._expect(":")
+            yield key, self._decode()
+            if self._expect(",}") == "}":
+                return
+
+
+def _import_yaml() -> Any:
+    try:
+        import yaml
+    except ImportError as e:
+        raise ImportError("Reading YAML templates requires PyYAML, install it with `pip install pyyaml`.") from e
+    return yaml
+
+
+def iter_json_templates(file: IO, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[Tuple[str, Any]]:
+    """
+    Reads entity templates from a JSON file one at a time.
+
+    :param file: text file containing a JSON object of templates
+    :param chunk_size: number of characters read at once
+    :returns: iterator of `(entity_name, entity_schema)` pairs
+    """
+    return iter(_JsonObjectReader(file, chunk_size))
+
+
+def iter_yaml_templates(file: IO) -> Iterator[Tuple[str, Any]]:
+    """
+    Reads entity templates from a YAML file one at a time. Requires `PyYAML`.
+    Anchors can't be shared between entities, since each entity is parsed on its own.
+
+    :param file: text file containing a YAML mapping of templates
+    :returns: iterator of `(entity_name, entity_schema)` pairs
+    """
+    yaml = _import_yaml()
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    events = yaml.parse(file, Loader=loader)
+    for event in events:
+        if isinstance(event, yaml.MappingStartEvent):
+            break
+    for key_event in events:
+        if isinstance(key_event, yaml.MappingEndEvent):
+            return
+        value_events, depth = [], 0
+        for event in events:
+            value_events.append(event)
+            if isinstance(event, (yaml.MappingStartEvent, yaml.SequenceStartEvent)):
+                depth += 1
+            elif isinstance(event, (yaml.MappingEndEvent, yaml.SequenceEndEvent)):
+                depth -= 1
+            if not depth:
+                break
+        document = yaml.emit([
+            yaml.StreamStartEvent(), yaml.DocumentStartEvent(), *value_events, yaml.DocumentEndEvent(),
+            yaml.StreamEndEvent(),
+        ])
+        yield key_event.value, yaml.load(document, Loader=loader)
+
+
+def iter_templates(path: PathLike, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[Tuple[str, Any]]:
+    """
+    Reads entity templates from a JSON or YAML file (based on the file suffix) one at a time.
+
+    :param path: path of the templates file
+    :param chunk_size: number of characters read at once from JSON files
+    :returns: iterator of `(entity_name, entity_schema)` pairs
+    """
+    path = Path(path)
+    with path.open() as file:
+        if path.suffix.lower() in YAML_SUFFIXES:
+            yield from iter_yaml_templates(file)
+        else:
+            yield from iter_json_templates(file, chunk_size)
+
+
+def stream_entities(
+        path: PathLike,
+        types_mapping: Dict[str, Any] = None,
+        cache: Optional[EntityCache] = entity_cache,
+        validate: bool = True,
+        fast_validation: bool = False,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> Iterator[Tuple[str, Type]]:
+    """
+    Creates Entity and CompoundEntity types while reading a templates file.
+    Each template is validated and created as soon as it's read, compound entities are created once all their
+    sources are available. Only created types and compound templates waiting for their sources are kept in memory.
+
+    :param path: path of the JSON or YAML templates file
+    :param types_mapping: custom types mapping, e.g. `{"numpy.float16": numpy.float16}`
+    :param cache: cache of created types, process-wide cache is used by default, `None` disables caching
+    :param validate: validate each template
+    :param fast_validation: use the hand-written validator instead of the generic jsonschema one
+    :param chunk_size: number of characters read at once from JSON files
+    :returns: iterator of `(entity_name, entity_type)` pairs, in the order the types are created
+    :raises:
+        ValidationError: if a template doesn't follow the schema.
+        DuplicateEntityException: if an entity is defined more than once.
+        NonExistingSourceEntityException: if a source entity isn't defined in the file.
+        CyclicSourceEntityException: if compound entities depend on each other.
+    """
+    simple_entity_factory = SimpleEntityFactory(types_mapping or {}, cache=cache)
+    compound_entity_factory = CompoundEntityFactory(cache=cache)
+    validator = EntityTemplatesValidator(fast=fast_validation) if validate else None
+    entities: Dict[str, Type] = {}
+    pending: Dict[str, Dict] = {}  # compound templates waiting for their sources
+    waiting: Dict[str, List[str]] = defaultdict(list)  # source entity name -> names of pending compound entities
+
+    def created(entity_name: str, entity_type: Type) -> Iterator[Tuple[str, Type]]:
+        ready = [(entity_name, entity_type)]
+        while ready:
+            name, created_type = ready.pop()
+            entities[name] = created_type
+            yield name, created_type
+            for dependent in waiting.pop(name, []):
+                if dependent in pending and not _missing_sources(pending[dependent], entities):
+                    dependent_type = compound_entity_factory.load_entity(dependent, pending.pop(dependent), entities)
+                    ready.append((dependent, dependent_type))
+
+    for entity_name, entity_schema in iter_templates(path, chunk_size):
+        if entity_name in entities or entity_name in pending:
+            raise DuplicateEntityException(f"Entity {entity_name} is defined more than once")
+        if validator is not None and (errors := validator.collect_entity_errors(entity_name, entity_schema)):
+            raise ValidationError({entity_name: errors})
+
+        if entity_schema["type"] == "simple":
+            yield from created(entity_name, simple_entity_factory.load_entity(entity_name, entity_schema))
+        elif missing_sources := _missing_sources(entity_schema, entities):
+            pending[entity_name] = entity_schema
+            for source_name in missing_sources:
+                waiting[source_name].append(entity_name)
+        else:
+            yield from created(entity_name, compound_entity_factory.load_entity(entity_name, entity_schema, entities))
+
+    if pending:
+        EntityGraph.from_templates(pending).topological_order()  # reports cycles
+        missing = sorted({name for schema in pending.values() for name in _missing_sources(schema, entities)})
+        raise NonExistingSourceEntityException(f"Source entities {missing} do not exist")
+
+
+def _missing_sources(entity_schema: Dict, entities: Dict[str, Type]) -> List[str]:
+    return list(dict.fromkeys(
+        source["entity"] for source in entity_schema["sources"] if source["entity"] not in entities
+    ))
+
+
+def read_templates(path: PathLike) -> EntityTemplates:
+    """
+    Reads all entity templates of a JSON or YAML file (based on the file suffix).
+
+    :param path: path of the templates file
+    :returns: templates config
+    """
+    path = Path(path)
+    with path.open() as file:
+        if path.suffix.lower() in YAML_SUFFIXES:
+            yaml = _import_yaml()
+            return yaml.load(file, Loader=getattr(yaml, "CSafeLoader", yaml.SafeLoader))
+        return json.load(file)
+
+
+def find_template_files(paths: Union[PathLike, Iterable[PathLike]]) -> List[Path]:
+    """
+    Lists template files, directories are searched recursively for JSON and YAML files.
+
+    :param paths: paths of template files or directories
+    :returns: paths of template files, files of each directory are sorted
+    """
+    paths = [paths] if isinstance(paths, (str, Path)) else paths
+    files = []
+    for path in map(Path, paths):
+        if path.is_dir():
+            files += sorted(
+                file for file in path.rglob("*") if file.is_file() and file.suffix.lower() in (".json", *YAML_SUFFIXES)
+            )
+        else:
+            files.append(path)
+    return files
+
+
+def merge_templates(templates_by_path: Dict[Path, EntityTemplates]) -> EntityTemplates:
+    """
+    Merges templates read from many files.
+    A file which doesn't contain a dictionary, e.g. an empty YAML file caught in the middle of a write, is an error
+    rather than a file without entities, otherwise all its entities would be reported as removed.
+
+    :param templates_by_path: templates of each file
+    :returns: templates config
+    :raises:
+        DuplicateEntityException: if an entity is defined in more than one file.
+        InvalidTemplatesFileException: if a file doesn't contain a dictionary of templates.
+    """
+    templates, origins = {}, {}
+    for path, file_templates in templates_by_path.items():
+        if not isinstance(file_templates, dict):
+            raise InvalidTemplatesFileException(f"File {path} doesn't contain a dictionary of entity templates")
+        for entity_name, entity_schema in file_templates.items():
+            if entity_name in origins:
+                raise DuplicateEntityException(
+                    f"Entity {entity_name} is defined in both {origins[entity_name]} and {path}"
+                )
+            origins[entity_name] = path
+            templates[entity_name] = entity_schema
+    return templates
+
+
+def _read_and_validate(
+        path: Path,
+        validate: bool,
+        fast_validation: bool,
+) -> Tuple[EntityTemplates, Dict[str, List[SchemaError]]]:
+    templates = read_templates(path)
+    errors = EntityTemplatesValidator(fast=fast_validation).collect_errors(templates) if validate else {}
+    if "" in errors:  # the file doesn't contain a dictionary
+        errors = {str(path): errors.pop("")}
+    return templates, detach_errors(errors)  # sent back from worker processes
+
+
+def load_entities_from_paths(
+        paths: Union[PathLike, Iterable[PathLike]],
+        types_mapping: Dict[str, Any] = None,
+        cache: Optional[EntityCache] = entity_cache,
+        validate: bool = True,
+        fast_validation: bool = False,
+        max_workers: Optional[int] = None,
+        processes: bool = False,
+) -> Dict[str, Type]:
+    """
+    Creates new Entity and CompoundEntity types based on templates split into many files.
+    Files are read, parsed and validated concurrently, then merged and created in dependency order.
+    Threads are enough when reading files dominates; with `processes=True` parsing and validation of big configs
+    run in parallel too, at the cost of sending templates back to the main process.
+
+    :param paths: paths of JSON or YAML template files, or directories containing them
+    :param types_mapping: custom types mapping, e.g. `{"numpy.float16": numpy.float16}`
+    :param cache: cache of created types, process-wide cache is used by default, `None` disables caching
+    :param validate: validate templates
+    :param fast_validation: use the hand-written validator instead of the generic jsonschema one
+    :param max_workers: size of the pool, see `concurrent.futures`
+    :param processes: use a process pool instead of a thread pool
+    :returns: a dictionary with all created types, see `load_entities`
+    :raises:
+        ValidationError: if templates don't follow the schema, errors of all files are grouped by entity name.
+        DuplicateEntityException: if an entity is defined in more than one file.
+        InvalidTemplatesFileException: if a file doesn't contain a dictionary of templates and `validate` is False.
+    """
+    files = find_template_files(paths)
+    executor: Executor = (ProcessPoolExecutor if processes else ThreadPoolExecutor)(max_workers=max_workers)
+    with executor:
+        results = list(executor.map(_read_and_validate, files, [validate] * len(files), [fast_validation] * len(files)))
+
+    errors = {entity_name: e for _, file_errors in results for entity_name, e in file_errors.items()}
+    if errors:
+        raise ValidationError(errors)
+    templates = merge_templates(dict(zip(files, (file_templates for file_templates, _ in results))))
+    return load_entities(templates, types_mapping, cache=cache, validate=False)
@@ -0,0 +1,102 @@
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor
+from itertools import repeat
+from typing import Any, Dict, List, Optional, Tuple, Type
+
+from data_snack_dynamic_entity.cache import EntityCache, entity_cache
+from data_snack_dynamic_entity.compound_entity.factory import CompoundEntityFactory
+from data_snack_dynamic_entity.factory import load_entities, split_templates_by_type
+from data_snack_dynamic_entity.simple_entity.factory import SimpleEntityFactory
+from data_snack_dynamic_entity.simple_entity.types import SimpleEntitySpec
+from data_snack_dynamic_entity.types import EntityTemplates
+from data_snack_dynamic_entity.validate import (
+    EntityTemplatesValidator,
+    SchemaError,
+    ValidationError,
+    detach_errors,
+    validate_entity_templates,
+)
+
+CHUNKS_PER_WORKER = 4  # more chunks than workers balance uneven templates
+
+
+def _normalize_chunk(
+        chunk: List[Tuple[str, Any]],
+        validate: bool,
+        fast_validation: bool,
+) -> Tuple[Dict[str, SimpleEntitySpec], Dict[str, List[SchemaError]]]:
+    """Validates templates of a chunk and builds specs of its valid simple entities, runs in a worker process."""
+    errors = EntityTemplatesValidator(fast=fast_validation).collect_errors(dict(chunk)) if validate else {}
+    specs = {
+        entity_name: SimpleEntityFactory.build_spec(entity_name, entity_schema)
+        for entity_name, entity_schema in chunk
+        if entity_name not in errors and entity_schema["type"] == "simple"
+    }
+    return specs, detach_errors(errors)  # errors of the jsonschema validator can't be pickled
+
+
+def _split_into_chunks(templates: EntityTemplates, workers: int) -> List[List[Tuple[str, Any]]]:
+    items = list(templates.items())
+    size = max(1, -(-len(items) // (workers * CHUNKS_PER_WORKER)))
+    return [items[start:start + size] for start in range(0, len(items), size)]
+
+
+def load_entities_parallel(
+        templates: EntityTemplates,
+        types_mapping: Dict[str, Any] = None,
+        cache: Optional[EntityCache] = entity_cache,
+        validate: bool = True,
+        fast_validation: bool = False,
+        max_workers: Optional[int] = None,
+        executor: Optional[Executor] = None,
+) -> Dict[str, Type]:
+    """
+    Creates new Entity and CompoundEntity types like `load_entities`, validating and normalizing templates in
+    worker processes. Workers return json-like specs of simple entities (see `SimpleEntityFactory.build_spec`),
+    classes can't be sent between processes, so they're created from the specs in this process, in dependency order.
+    Compound entities are normalized here as well, because their specs depend on classes of their sources.
+    Worth it for configs of thousands of entities on several CPUs, especially with the generic jsonschema validation.
+    Computing cache keys and creating classes isn't parallelized, and sending templates and specs between processes
+    has its own cost, so with a single worker process it would be slower than `load_entities`, which is used instead.
+
+    :param templates: input config containing templates
+    :param types_mapping: custom types mapping, e.g. `{"numpy.float16": numpy.float16}`
+    :param cache: cache of created types, process-wide cache is used by default, `None` disables caching
+    :param validate: validate templates
+    :param fast_validation: use the hand-written validator instead of the generic jsonschema one
+    :param max_workers: number of worker processes, the number of CPUs by default,
+        `load_entities` is used if it's 1 and no executor is provided
+    :param executor: executor used instead of creating a process pool, e.g. one shared by the application
+    :returns: a dictionary with all created types, see `load_entities`
+    :raises:
+        ValidationError: if templates don't follow the schema, errors are grouped by entity name.
+    """
+    if validate and not isinstance(templates, dict):
+        validate_entity_templates(templates, fast=fast_validation)
+
+    workers = max_workers or os.cpu_count() or 1
+    if executor is None and workers == 1:
+        validator = EntityTemplatesValidator(fast=fast_validation)  # errors grouped by entity name, like below
+        return load_entities(templates, types_mapping, cache=cache, validate=validate, validator=validator)
+
+    chunks = _split_into_chunks(templates, workers)
+    if executor is None:
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            results = list(executor.map(_normalize_chunk, chunks, repeat(validate), repeat(fast_validation)))
+    else:
+        results = list(executor.map(_normalize_chunk, chunks, repeat(validate), repeat(fast_validation)))
+
+    specs = {entity_name: spec for chunk_specs, _ in results for entity_name, spec in chunk_specs.items()}
+    if errors := {entity_name: e for _, chunk_errors in results for entity_name, e in chunk_errors.items()}:
+        raise ValidationError(errors)
+
+    simple_entities_templates, compound_entities_templates = split_templates_by_type(templates)
+    simple_entity_factory = SimpleEntityFactory(types_mapping or {}, cache=cache)
+    simple_entities = {
+        entity_name: simple_entity_factory.load_entity(entity_name, entity_schema, specs[entity_name])
+        for entity_name, entity_schema in simple_entities_templates.items()
+    }
+    compound_entities = CompoundEntityFactory(cache=cache).load_entities(
+        compound_entities_templates, simple_entities, validate=False
+    )
+    return {**simple_entities, **compound_entities}
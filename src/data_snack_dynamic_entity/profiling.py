@@ -0,0 +1,173 @@
+import tracemalloc
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from time import perf_counter
+from typing import Any, Dict, Iterator, List, Optional, Protocol, Tuple
+
+from data_snack_dynamic_entity.types import EntityTemplates
+
+VALIDATION = "validation"
+SPLIT = "split"
+SIMPLE_ENTITIES = "simple_entities"
+COMPOUND_ENTITIES = "compound_entities"
+
+
+class LoadObserver(Protocol):
+    """
+    Receives timings of `load_entities`. Allocated bytes are measured only while `tracemalloc` is tracing,
+    otherwise they're None. They're the growth of traced memory, so memory freed in the meantime is subtracted.
+    """
+
+    def phase_finished(self, phase: str, seconds: float, allocated_bytes: Optional[int]) -> None:
+        """Called after each phase: validation, splitting templates, creating simple and compound entities."""
+
+    def entity_created(self, entity_name: str, phase: str, seconds: float, allocated_bytes: Optional[int]) -> None:
+        """Called after each entity type is created, or got from the cache, during a phase."""
+
+
+@dataclass
+class Measurement:
+    seconds: float = 0.0
+    allocated_bytes: Optional[int] = None
+
+
+@contextmanager
+def measure() -> Iterator[Measurement]:
+    """Measures wall time and, if `tracemalloc` is tracing, allocated memory of the code block."""
+    measurement = Measurement()
+    tracing = tracemalloc.is_tracing()
+    memory_before = tracemalloc.get_traced_memory()[0] if tracing else 0
+    start = perf_counter()
+    try:
+        yield measurement
+    finally:
+        measurement.seconds = perf_counter() - start
+        if tracing and tracemalloc.is_tracing():
+            measurement.allocated_bytes = tracemalloc.get_traced_memory()[0] - memory_before
+
+
+@contextmanager
+def observe_phase(observer: Optional[LoadObserver], phase: str) -> Iterator[None]:
+    if observer is None:
+        yield
+        return
+    with measure() as measurement:
+        yield
+    observer.phase_finished(phase, measurement.seconds, measurement.allocated_bytes)
+
+
+@contextmanager
+def observe_entity(observer: Optional[LoadObserver], entity_name: str, phase: str) -> Iterator[None]:
+    if observer is None:
+        yield
+        return
+    with measure() as measurement:
+        yield
+    observer.entity_created(entity_name, phase, measurement.seconds, measurement.allocated_bytes)
+
+
+@dataclass(frozen=True)
+class Timing:
+    name: str  # phase or entity name
+    phase: str
+    seconds: float
+    allocated_bytes: Optional[int] = None
+
+
+def count_fields(entity_schema: Dict) -> int:
+    """Number of fields of an entity template, fields mapped from many sources are counted once."""
+    if entity_schema.get("type") == "compound":
+        return len({mapping["field"] for source in entity_schema["sources"] for mapping in source["fields"]})
+    return len(entity_schema.get("properties", {}))
+
+
+@dataclass
+class LoadReport:
+    phases: List[Timing]
+    entities: List[Timing]
+    fields_count: Dict[str, int] = field(default_factory=dict)  # fields of each template, if templates were given
+
+    @property
+    def total_seconds(self) -> float:
+        return sum(timing.seconds for timing in self.phases)
+
+    def phase(self, phase: str) -> Optional[Timing]:
+        """Gets timing of a phase, the last one if `load_entities` was observed many times."""
+        return next((timing for timing in reversed(self.phases) if timing.phase == phase), None)
+
+    def slowest_entities(self, limit: int = 10) -> List[Timing]:
+        """Entities which took the most time to create, the slowest first."""
+        return sorted(self.entities, key=lambda timing: timing.seconds, reverse=True)[:limit]
+
+    def largest_templates(self, limit: int = 10) -> List[Tuple[str, int]]:
+        """Names and numbers of fields of templates with the most fields, the largest first."""
+        return sorted(self.fields_count.items(), key=lambda item: item[1], reverse=True)[:limit]
+
+    def to_dict(self, limit: int = 10) -> Dict[str, Any]:
+        """
+        Summarizes the report as a json-serializable dictionary, e.g. for a metrics pipeline.
+
+        :param limit: number of the slowest entities and the largest templates included
+        :returns: a dictionary of phases timings, total time, the slowest entities and the largest templates
+        """
+        return {
+            "total_seconds": self.total_seconds,
+            "phases": {
+                timing.phase: {"seconds": timing.seconds, "allocated_bytes": timing.allocated_bytes}
+                for timing in self.phases
+            },
+            "slowest_entities": [
+                {"entity": timing.name, "phase": timing.phase, "seconds": timing.seconds,
+                 "allocated_bytes": timing.allocated_bytes}
+                for timing in self.slowest_entities(limit)
+            ],
+            "largest_templates": [
+                {"entity": entity_name, "fields": fields} for entity_name, fields in self.largest_templates(limit)
+            ],
+        }
+
+
+@dataclass
+class ProfileCollector:
+    """
+    Observer collecting all timings of `load_entities`, e.g.:
+
+        collector = ProfileCollector()
+        entities = load_entities(templates, observer=collector)
+        report = collector.report(templates)
+    """
+    phases: List[Timing] = field(default_factory=list)
+    entities: List[Timing] = field(default_factory=list)
+
+    def phase_finished(self, phase: str, seconds: float, allocated_bytes: Optional[int]) -> None:
+        self.phases.append(Timing(phase, phase, seconds, allocated_bytes))
+
+    def entity_created(self, entity_name: str, phase: str, seconds: float, allocated_bytes: Optional[int]) -> None:
+        self.entities.append(Timing(entity_name, phase, seconds, allocated_bytes))
+
+    def report(self, templates: Optional[EntityTemplates] = None) -> LoadReport:
+        """
+        Creates a report of collected timings.
+
+        :param templates: loaded templates, used to find templates with the most fields
+        :returns: load report
+        """
+        fields_count = {name: count_fields(schema) for name, schema in (templates or {}).items()}
+        return LoadReport(list(self.phases), list(self.entities), fields_count)
+
+    def clear(self) -> None:
+        self.phases.clear()
+        self.entities.clear()
+
+
+@contextmanager
+def tracing_allocations() -> Iterator[None]:
+    """Traces allocations with `tracemalloc` in the code block, unless it's already tracing."""
+    if tracemalloc.is_tracing():
+        yield
+        return
+    tracemalloc.start()
+    try:
+        yield
+    finally:
+        tracemalloc.stop()
@@ -0,0 +1,80 @@
+from collections.abc import Mapping
+from dataclasses import InitVar, dataclass, field
+from threading import Lock
+from types import MappingProxyType
+from typing import Any, Dict, Iterable, Iterator, Optional, Type
+
+from data_snack_dynamic_entity.factory import load_entities
+from data_snack_dynamic_entity.types import EntityTemplates
+
+
+@dataclass(eq=False)
+class EntityRegistry(Mapping):
+    """
+    Read-only mapping of entity types whose whole content is replaced at once, safe to share between threads.
+    Each published set of types is an immutable snapshot, readers never lock and always see either the old or the new
+    snapshot. Use `snapshot()` to look up many entities in the same snapshot, e.g. for the whole request.
+    Writers build new types first and only hold a lock, which readers never wait for, while publishing them.
+    """
+    entities: InitVar[Optional[Dict[str, Type]]] = None  # initially published entity types
+    generation: int = field(default=0, init=False)  # number of published snapshots
+    _lock: Lock = field(default_factory=Lock, init=False, repr=False)
+
+    def __post_init__(self, entities: Optional[Dict[str, Type]]):
+        self._snapshot = MappingProxyType(dict(entities or {}))
+
+    def __getitem__(self, entity_name: str) -> Type:
+        return self._snapshot[entity_name]
+
+    def __contains__(self, entity_name: Any) -> bool:
+        return entity_name in self._snapshot
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._snapshot)
+
+    def __len__(self) -> int:
+        return len(self._snapshot)
+
+    def snapshot(self) -> Mapping:
+        """
+        Gets the current set of entity types, which never changes, even if new types are published in the meantime.
+
+        :returns: read-only mapping of entity types
+        """
+        return self._snapshot
+
+    def replace(self, entities: Dict[str, Type]) -> None:
+        """
+        Publishes a new set of entity types.
+
+        :param entities: a dictionary with all entity types
+        """
+        snapshot = MappingProxyType(dict(entities))
+        with self._lock:
+            self._publish(snapshot)
+
+    def update(self, entities: Dict[str, Type], removed: Iterable[str] = ()) -> None:
+        """
+        Publishes current entity types with some of them added, replaced or removed.
+
+        :param entities: a dictionary with added or replaced entity types
+        :param removed: names of removed entities
+        """
+        removed = set(removed)
+        with self._lock:
+            current = {name: entity_type for name, entity_type in self._snapshot.items() if name not in removed}
+            self._publish(MappingProxyType({**current, **entities}))
+
+    def load(self, templates: EntityTemplates, **kwargs: Any) -> None:
+        """
+        Creates entity types of provided config with `load_entities` and publishes them once all were created.
+        Readers keep using the previous snapshot in the meantime, and if loading fails.
+
+        :param templates: input config containing templates
+        :param kwargs: other arguments of `load_entities`
+        """
+        self.replace(load_entities(templates, **kwargs))
+
+    def _publish(self, snapshot: MappingProxyType) -> None:
+        self._snapshot = snapshot  # a single reference assignment, atomic for readers
+        self.generation += 1
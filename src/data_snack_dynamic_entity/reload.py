@@ -0,0 +1,153 @@
+from dataclasses import dataclass, field
+from pathlib import Path
+from threading import Event, Lock, Thread
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Union
+
+from data_snack_dynamic_entity.cache import EntityCache, entity_cache
+from data_snack_dynamic_entity.factory import EntityBuilder
+from data_snack_dynamic_entity.graph import EntityGraph
+from data_snack_dynamic_entity.loaders import PathLike, find_template_files, merge_templates, read_templates
+from data_snack_dynamic_entity.registry import EntityRegistry
+from data_snack_dynamic_entity.types import EntityTemplates
+from data_snack_dynamic_entity.utils import same_template
+from data_snack_dynamic_entity.validate import EntityTemplatesValidator
+
+FileSignature = Tuple[int, int]  # modification time in nanoseconds and size
+
+
+@dataclass
+class ChangeReport:
+    """Entities affected by a reload."""
+    added: List[str] = field(default_factory=list)
+    removed: List[str] = field(default_factory=list)
+    changed: List[str] = field(default_factory=list)
+    rebuilt: List[str] = field(default_factory=list)  # created again: added, changed and compounds depending on them
+
+    @property
+    def has_changes(self) -> bool:
+        return bool(self.added or self.removed or self.changed)
+
+
+@dataclass(eq=False)
+class EntityReloader:
+    """
+    Keeps entity types of template files up to date in a registry.
+    Files are polled for changes of their modification time and size, only modified files are read again.
+    Templates are compared entity by entity, only changed entities and compound entities depending on them
+    are created again. New types are published to the registry at once, after all of them were created.
+    If reading, validating or creating fails, the registry keeps serving the previous types.
+    """
+    paths: Union[PathLike, Iterable[PathLike]]
+    registry: EntityRegistry = field(default_factory=EntityRegistry)
+    types_mapping: Dict[str, Any] = field(default_factory=dict)
+    cache: Optional[EntityCache] = entity_cache
+    validate: bool = True
+    fast_validation: bool = False
+    _templates: EntityTemplates = field(default_factory=dict, init=False, repr=False)
+    _files: Dict[Path, Tuple[FileSignature, EntityTemplates]] = field(default_factory=dict, init=False, repr=False)
+    _lock: Lock = field(default_factory=Lock, init=False, repr=False)
+    _stopped: Event = field(default_factory=Event, init=False, repr=False)
+
+    def __post_init__(self):
+        self._builder = EntityBuilder(self.types_mapping, cache=self.cache)
+        self._validator = EntityTemplatesValidator(fast=self.fast_validation)
+
+    @property
+    def templates(self) -> EntityTemplates:
+        """Templates of entities currently published to the registry."""
+        return self._templates
+
+    def apply(self, templates: EntityTemplates) -> ChangeReport:
+        """
+        Updates the registry to provided templates, creating only types of changed entities.
+
+        :param templates: input config containing templates
+        :returns: report of affected entities
+        :raises:
+            ValidationError: if changed templates don't follow the schema.
+        """
+        with self._lock:
+            old_templates = self._templates
+            report = ChangeReport(
+                added=[name for name in templates if name not in old_templates],
+                removed=[name for name in old_templates if name not in templates],
+                changed=[
+                    name for name in templates
+                    if name in old_templates and not same_template(old_templates[name], templates[name])
+                ],
+            )
+            if not report.has_changes:
+                return report
+            if self.validate:
+                self._validator.validate({name: templates[name] for name in report.added + report.changed})
+
+            graph = EntityGraph.from_templates(templates)
+            outdated = graph.downstream(report.added + report.changed)
+            outdated |= EntityGraph.from_templates(old_templates).downstream(report.removed) - set(report.removed)
+            entities = self._builder.rebuild(templates, outdated, self.registry)
+            report.rebuilt = [name for name in templates if name in outdated]
+            self.registry.replace(entities)
+            self._templates = templates
+            return report
+
+    def check(self) -> ChangeReport:
+        """
+        Reads modified template files and applies their templates.
+        Nothing is applied if any file can't be read, e.g. a file caught in the middle of a write, so its entities
+        are never unpublished. The file is read again on the next check.
+
+        :returns: report of affected entities, empty if no file was modified
+        :raises:
+            ValidationError: if changed templates don't follow the schema.
+            DuplicateEntityException: if an entity is defined in more than one file.
+            InvalidTemplatesFileException: if a file doesn't contain a dictionary of templates.
+        """
+        files = {}
+        for path in find_template_files(self.paths):
+            stat = path.stat()
+            signature = (stat.st_mtime_ns, stat.st_size)
+            if (cached := self._files.get(path)) is not None and cached[0] == signature:
+                files[path] = cached
+            else:
+                files[path] = (signature, read_templates(path))
+        if files == self._files:
+            return ChangeReport()
+
+        report = self.apply(merge_templates({path: file_templates for path, (_, file_templates) in files.items()}))
+        self._files = files
+        return report
+
+    def watch(
+            self,
+            interval: float = 1.0,
+            on_change: Optional[Callable[[ChangeReport], None]] = None,
+            on_error: Optional[Callable[[Exception], None]] = None,
+    ) -> Thread:
+        """
+        Starts a daemon thread checking template files every `interval` seconds, until `stop` is called.
+
+        :param interval: number of seconds between checks
+        :param on_change: called with the report of each reload which changed entities
+        :param on_error: called with exceptions raised by failed reloads, the thread keeps polling
+        :returns: started thread
+        """
+        self._stopped.clear()
+
+        def run() -> None:
+            while not self._stopped.wait(interval):
+                try:
+                    report = self.check()
+                except Exception as e:
+                    if on_error is not None:
+                        on_error(e)
+                    continue
+                if report.has_changes and on_change is not None:
+                    on_change(report)
+
+        thread = Thread(target=run, name="entity-reloader", daemon=True)
+        thread.start()
+        return thread
+
+    def stop(self) -> None:
+        """Stops the thread started by `watch`."""
+        self._stopped.set()
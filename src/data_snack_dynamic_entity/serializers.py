@@ -0,0 +1,182 @@
+import json
+from dataclasses import MISSING, Field, dataclass, fields
+from datetime import date, time
+from enum import Enum
+from typing import Any, Callable, Dict, List, Optional, Tuple, Type, Union, get_origin
+
+from data_snack.entities import Entity
+from data_snack.serializers import Serializer
+
+from data_snack_dynamic_entity.compiled import CompiledMethod, attribute, compile_function
+from data_snack_dynamic_entity.utils import unwrap_optional
+
+_JSON_TYPES = {int, float, str, bool, list, dict, type(None)}  # stored by json as they are
+_encode_json = json.JSONEncoder(ensure_ascii=False, separators=(",", ":")).encode
+
+
+def _render_tuple(names: List[str]) -> str:
+    return f"({''.join(f'{name}, ' for name in names)})"
+
+
+def _plan(entity_type: Type) -> Tuple[List[str], List[str], Dict[str, Any]]:
+    """
+    Prepares code generation: stored fields, constructor arguments and globals used by them.
+    Excluded fields aren't stored, they are created with their default or None.
+    """
+    excluded_fields = set(entity_type.get_excluded_fields())
+    stored, arguments, namespace = [], [], {}
+    for index, entity_field in enumerate(field for field in fields(entity_type) if field.init):
+        if entity_field.name not in excluded_fields:
+            stored.append(entity_field.name)
+            arguments.append(f"v{len(stored) - 1}")
+        elif entity_field.default is not MISSING:
+            namespace[f"default{index}"] = entity_field.default
+            arguments.append(f"default{index}")
+        elif entity_field.default_factory is not MISSING:
+            namespace[f"default_factory{index}"] = entity_field.default_factory
+            arguments.append(f"default_factory{index}()")
+        else:
+            arguments.append("None")
+    return stored, arguments, namespace
+
+
+def _stored_fields(entity_type: Type) -> List[Field]:
+    excluded_fields = set(entity_type.get_excluded_fields())
+    return [field for field in fields(entity_type) if field.init and field.name not in excluded_fields]
+
+
+def _json_codec(field_type: Any) -> Tuple[str, str]:
+    """
+    Expressions converting a value of given type to a json value and back, `{value}` stands for the value
+    and `{type}` for the field class. Other classes are stored as strings, e.g. `Decimal`.
+    """
+    field_class = get_origin(field_type) or field_type
+    if not isinstance(field_class, type) or field_class in _JSON_TYPES:
+        return "{value}", "{value}"
+    if issubclass(field_class, Enum):
+        return "{type}({value}).value", "{type}({value})"
+    if issubclass(field_class, (list, dict)):
+        return "{value}", "{type}({value})"
+    if issubclass(field_class, (tuple, set, frozenset)):
+        return "list({value})", "{type}({value})"
+    if issubclass(field_class, (bytes, bytearray)):
+        return "{value}.hex()", "{type}.fromhex({value})"
+    if issubclass(field_class, (date, time)):
+        return "{value}.isoformat()", "{type}.fromisoformat({value})"
+    if callable(getattr(field_class, "item", None)):  # NumPy scalar types
+        return "{type}({value}).item()", "{type}({value})"
+    return "str({value})", "{type}({value})"
+
+
+def _generate_to_tuple(entity_type: Type) -> Callable:
+    stored, _, _ = _plan(entity_type)
+    values = _render_tuple([attribute("self", name) for name in stored])
+    return compile_function("to_tuple", f"def to_tuple(self):\n    return {values}")
+
+
+def _generate_to_bytes(entity_type: Type) -> Callable:
+    values, namespace = [], {"encode": _encode_json}
+    for index, entity_field in enumerate(_stored_fields(entity_type)):
+        field_type, _ = unwrap_optional(entity_field.type)
+        namespace[f"t{index}"] = get_origin(field_type) or field_type
+        value = attribute("self", entity_field.name)
+        encode, _ = _json_codec(field_type)
+        if encode != "{value}":  # fields of compound entities may be None even if they aren't optional
+            value = f"(None if {value} is None else {encode.format(value=value, type=f't{index}')})"
+        values.append(value)
+    source = f"def to_bytes(self):\n    return encode({_render_tuple(values)}).encode()"
+    return compile_function("to_bytes", source, namespace)
+
+
+def _generate_from_tuple(entity_type: Type) -> Callable:
+    stored, arguments, namespace = _plan(entity_type)
+    source = "\n".join([
+        "def from_tuple(cls, values):",
+        f"    {_render_tuple([f'v{index}' for index in range(len(stored))])} = values",
+        f"    return cls({', '.join(arguments)})",
+    ])
+    return compile_function("from_tuple", source, namespace)
+
+
+def _generate_from_bytes(entity_type: Type) -> Callable:
+    """
+    Generates code reading a json array of stored values. Trailing fields with defaults may be missing,
+    e.g. in data stored before such a field was added, they get their defaults.
+    """
+    _, arguments, namespace = _plan(entity_type)
+    stored_fields = _stored_fields(entity_type)
+    trailing_defaults = len(stored_fields)
+    while trailing_defaults and (
+            stored_fields[trailing_defaults - 1].default is not MISSING
+            or stored_fields[trailing_defaults - 1].default_factory is not MISSING
+    ):
+        trailing_defaults -= 1
+
+    lines = ["def from_bytes(cls, data):", "    values = loads(data)", "    count = len(values)"]
+    namespace = {**namespace, "loads": json.loads}
+    for index, entity_field in enumerate(stored_fields):
+        field_type, _ = unwrap_optional(entity_field.type)
+        namespace[f"t{index}"] = get_origin(field_type) or field_type
+        value = f"values[{index}]"
+        _, decode = _json_codec(field_type)
+        if decode != "{value}":
+            value = f"(None if {value} is None else {decode.format(value=value, type=f't{index}')})"
+        if index >= trailing_defaults:
+            if entity_field.default is not MISSING:
+                namespace[f"d{index}"] = entity_field.default
+                value = f"{value} if count > {index} else d{index}"
+            else:
+                namespace[f"f{index}"] = entity_field.default_factory
+                value = f"{value} if count > {index} else f{index}()"
+        lines.append(f"    v{index} = {value}")
+    lines.append(f"    return cls({', '.join(arguments)})")
+    return compile_function("from_bytes", "\n".join(lines), namespace)
+
+
+def add_serializers(entity_type: Type) -> Type:
+    """
+    Adds serialization methods specialized for the fields of an entity:
+    - `to_tuple()` / `from_tuple(values)` convert the entity to a tuple of its values and back,
+    - `to_bytes()` / `from_bytes(data)` do the same with a json array. Values which json doesn't support are converted
+      according to their field type, e.g. NumPy scalars, enums, dates, tuples or `Decimal`. Reading data never runs
+      code, unlike `pickle`.
+    Values are read and passed by position, without `dataclasses.asdict` or serializing the entity object.
+    Excluded fields aren't stored, they are set to their default or None when the entity is created back.
+    The code of each method is generated on its first use. Methods named like a field of the entity are skipped.
+
+    :param entity_type: Entity or CompoundEntity type
+    :returns: the same type
+    """
+    field_names = {entity_field.name for entity_field in fields(entity_type)}
+    methods = {
+        "to_tuple": CompiledMethod("to_tuple", _generate_to_tuple),
+        "from_tuple": CompiledMethod("from_tuple", _generate_from_tuple, is_classmethod=True),
+        "to_bytes": CompiledMethod("to_bytes", _generate_to_bytes),
+        "from_bytes": CompiledMethod("from_bytes", _generate_from_bytes, is_classmethod=True),
+    }
+    for name, method in methods.items():
+        if name not in field_names:
+            setattr(entity_type, name, method)
+    return entity_type
+
+
+@dataclass
+class TupleSerializer(Serializer):
+    """
+    data-snack serializer using methods added by `add_serializers`,
+    e.g. `snack.register_entity(Car, TupleSerializer(Car))`.
+    Unlike `DataclassSerializer` it doesn't store excluded fields and works with entities using `__slots__`.
+    """
+
+    def serialize(self, entity: Union[Entity, List[Entity]], many: bool = False) -> Union[bytes, List[bytes]]:
+        if many:
+            return [e.to_bytes() for e in entity]
+        return entity.to_bytes()
+
+    def deserialize(
+            self, data: Union[Optional[bytes], List[Optional[bytes]]], many: bool = False
+    ) -> Union[Optional[Entity], List[Optional[Entity]]]:
+        from_bytes = self.entity_type.from_bytes
+        if many:
+            return [from_bytes(d) if d else None for d in data]
+        return from_bytes(data) if data else None
@@ -1,10 +1,19 @@
-import builtins
-
 from data_snack.entities import Entity
 from dataclasses import dataclass, field, make_dataclass
 from typing import Dict, Type, Any, List, Optional
 
-from data_snack_dynamic_entity.simple_entity.types import SimpleEntitySchema, SimpleEntityTemplates
+from data_snack_dynamic_entity.cache import EntityCache, simple_entity_key
+from data_snack_dynamic_entity.profiling import SIMPLE_ENTITIES, LoadObserver, observe_entity
+from data_snack_dynamic_entity.serializers import add_serializers
+from data_snack_dynamic_entity.simple_entity.parsing import add_parsers
+from data_snack_dynamic_entity.simple_entity.type_resolution import TypeResolver
+from data_snack_dynamic_entity.simple_entity.types import (
+    FieldSpec,
+    SimpleEntitySchema,
+    SimpleEntitySpec,
+    SimpleEntityTemplates,
+)
+from data_snack_dynamic_entity.utils import add_slots
 from data_snack_dynamic_entity.validate import validate_entity_templates
 
 
@@ -13,69 +22,138 @@ class SimpleEntityFactory:
     types_mapping: Dict[str, Any] = field(
         default_factory=dict
     )  # this will store custom mappings
+    cache: Optional[EntityCache] = None  # created types are reused from the cache if provided
+    slots: bool = False  # create all types with `__slots__`, can be enabled per entity in the template as well
+    coerce: bool = False  # add `parse` and `parse_many` constructors checking and converting field values
+    observer: Optional[LoadObserver] = None  # notified about the time of creating each entity
+    _types: TypeResolver = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self._types = TypeResolver(self.types_mapping)
 
-    def load_entities(self, templates: SimpleEntityTemplates) -> Dict[str, Type]:
+    def load_entities(self, templates: SimpleEntityTemplates, validate: bool = True) -> Dict[str, Type]:
         """
         Creates new Entity types based on provided config.
         Config should contain a valid template that is created according to the schema (see README).
 
         :param templates: input config containing templates
+        :param validate: validate templates, can be disabled if they were already validated by the caller
         :returns: a dictionary with all created Entity types
         """
 
-        validate_entity_templates(templates)
-        return {
-            entity_name: self._create_simple_entity(entity_name, entity_schema)
-            for entity_name, entity_schema in templates.items()
-        }
+        if validate:
+            validate_entity_templates(templates)
+        entities = {}
+        for entity_name, entity_schema in templates.items():
+            with observe_entity(self.observer, entity_name, SIMPLE_ENTITIES):
+                entities[entity_name] = self.load_entity(entity_name, entity_schema)
+        return entities
 
-    def _create_simple_entity(self, entity_name: str, entity_schema: SimpleEntitySchema) -> Type:
+    def load_entity(
+            self, entity_name: str, entity_schema: SimpleEntitySchema, spec: Optional[SimpleEntitySpec] = None
+    ) -> Type:
         """
-        Creates entity of given name according to given schema.
+        Gets entity of given name from the cache or creates it if the template wasn't loaded before.
         :param entity_name: new entity name
         :param entity_schema: new entity schema
+        :param spec: normalized schema, if it was already built by `build_spec`
         :return: new entity type
         """
+        def create() -> Type:
+            return self.create_from_spec(spec or self.build_spec(entity_name, entity_schema))
+
+        if self.cache is None:
+            return create()
+        return self.cache.get_or_create(
+            simple_entity_key(entity_name, entity_schema, self.types_mapping, self._options), create
+        )
+
+    @staticmethod
+    def build_spec(entity_name: str, entity_schema: SimpleEntitySchema) -> SimpleEntitySpec:
+        """
+        Normalizes entity schema: splits fields into the ones with and without defaults, extracts keys
+        and excluded fields. The result is json-serializable and doesn't depend on `types_mapping`.
+        :param entity_name: new entity name
+        :param entity_schema: new entity schema
+        :return: normalized entity schema
+        """
         fields = []
         fields_with_defaults = []
         keys = []
         excluded_fields = []
         for field_name, field_schema in entity_schema["properties"].items():
-            field_type = self._get_entity_type(field_schema["type"])
-
+            field_spec = {
+                "name": field_name,
+                "type": field_schema["type"],
+                "optional": field_schema.get("optional", False),
+            }
             if field_schema.get("key"):
                 keys.append(field_name)
             if field_schema.get("excluded"):
                 excluded_fields.append(field_name)
-            if field_schema.get("optional"):
-                field_type = Optional[field_type]
             if "default" in field_schema:
-                fields_with_defaults.append(
-                    (field_name, field_type, field(default=field_schema["default"]))
-                )
+                fields_with_defaults.append({**field_spec, "default": field_schema["default"]})
             else:
-                fields.append((field_name, field_type))
+                fields.append(field_spec)
 
+        return {
+            "name": entity_name,
+            "version": entity_schema["version"],
+            "keys": keys,
+            "excluded_fields": excluded_fields,
+            "fields": fields,
+            "fields_with_defaults": fields_with_defaults,
+            "slots": entity_schema.get("slots", False),
+        }
+
+    def create_from_spec(self, spec: SimpleEntitySpec) -> Type:
+        """
+        Creates entity according to given normalized schema.
+        :param spec: normalized entity schema
+        :return: new entity type
+        """
+        fields = [(field_spec["name"], self._get_field_type(field_spec)) for field_spec in spec["fields"]]
+        fields_with_defaults = [
+            (field_spec["name"], self._get_field_type(field_spec), field(default=field_spec["default"]))
+            for field_spec in spec["fields_with_defaults"]
+        ]
         entity_template = self._create_simple_entity_template(
-            entity_name=entity_name, keys=keys, excluded_fields=excluded_fields, version=entity_schema["version"]
+            entity_name=spec["name"],
+            keys=list(spec["keys"]),
+            excluded_fields=list(spec["excluded_fields"]),
+            version=spec["version"],
         )
-        return make_dataclass(
-            entity_name,
+        entity_type = make_dataclass(
+            spec["name"],
             fields + fields_with_defaults,
             bases=(entity_template,),
             namespace={"__module__": __name__},
         )
+        if self.slots or spec["slots"]:
+            entity_type = add_slots(entity_type)
+        if self.coerce:
+            entity_type = add_parsers(entity_type)
+        return add_serializers(entity_type)
+
+    @property
+    def _options(self) -> Dict[str, Any]:
+        """Factory options affecting created types, a part of their cache keys."""
+        return {"slots": self.slots, "coerce": self.coerce}
+
+    def _create_simple_entity(self, entity_name: str, entity_schema: SimpleEntitySchema) -> Type:
+        """
+        Creates entity of given name according to given schema.
+        :param entity_name: new entity name
+        :param entity_schema: new entity schema
+        :return: new entity type
+        """
+        return self.create_from_spec(self.build_spec(entity_name, entity_schema))
+
+    def _get_field_type(self, field_spec: FieldSpec) -> Type:
+        return self._types.resolve(field_spec["type"], field_spec["optional"])
 
     def _get_entity_type(self, name: str) -> Type:
-        try:
-            t = getattr(builtins, name)
-            if not isinstance(t, type):
-                raise ValueError(name)
-            return t
-        except AttributeError as e:
-            if t := self.types_mapping.get(name):
-                return t
-            raise ValueError(name) from e
+        return self._types.resolve(name)
 
     @staticmethod
     def _create_simple_entity_template(
@@ -0,0 +1,176 @@
+from dataclasses import MISSING, fields
+from typing import Any, Callable, Dict, Optional, Type, get_origin
+
+from data_snack_dynamic_entity.compiled import CompiledMethod, compile_function
+from data_snack_dynamic_entity.simple_entity.exceptions import EntityParseException
+from data_snack_dynamic_entity.utils import unwrap_optional
+
+_TRUE_STRINGS = {"true", "1", "yes", "y", "t"}
+_FALSE_STRINGS = {"false", "0", "no", "n", "f"}
+
+
+def _error(entity_type: Type, field_name: str, value: Any, expected: str) -> EntityParseException:
+    return EntityParseException(f"{entity_type.__name__}.{field_name}: {value!r} is not a valid {expected}")
+
+
+def _to_int(entity_type: Type, field_name: str, value: Any) -> int:
+    if isinstance(value, int) and not isinstance(value, bool):
+        return int(value)
+    if isinstance(value, float) and value.is_integer():
+        return int(value)
+    if isinstance(value, str):
+        try:
+            return int(value.strip())
+        except ValueError:
+            pass
+    raise _error(entity_type, field_name, value, "int")
+
+
+def _to_float(entity_type: Type, field_name: str, value: Any) -> float:
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return float(value)
+    if isinstance(value, str):
+        try:
+            return float(value)
+        except ValueError:
+            pass
+    raise _error(entity_type, field_name, value, "float")
+
+
+def _to_str(entity_type: Type, field_name: str, value: Any) -> str:
+    if isinstance(value, str):
+        return str(value)
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return str(value)
+    raise _error(entity_type, field_name, value, "str")
+
+
+def _to_bool(entity_type: Type, field_name: str, value: Any) -> bool:
+    if isinstance(value, str):
+        if value.strip().lower() in _TRUE_STRINGS:
+            return True
+        if value.strip().lower() in _FALSE_STRINGS:
+            return False
+    elif isinstance(value, (int, float)) and value in (0, 1):
+        return bool(value)
+    raise _error(entity_type, field_name, value, "bool")
+
+
+_COERCERS = {int: _to_int, float: _to_float, str: _to_str, bool: _to_bool}
+
+
+def _checker(field_type: type) -> Callable[[Type, str, Any], Any]:
+    def check(entity_type: Type, field_name: str, value: Any) -> Any:
+        if isinstance(value, field_type):
+            return value
+        raise _error(entity_type, field_name, value, field_type.__name__)
+
+    return check
+
+
+def _coercer(field_type: Any, container: bool = False) -> Callable[[Type, str, Any], Any]:
+    """
+    Gets a function converting a value of a wrong type, custom types are called with the value. Values of containers,
+    e.g. `List[int]`, are only checked to be instances of their class, as calling it would accept e.g. `list("abc")`.
+    """
+    if field_type in _COERCERS:
+        return _COERCERS[field_type]
+    if container:
+        return _checker(field_type)
+
+    def coerce(entity_type: Type, field_name: str, value: Any) -> Any:
+        if not callable(field_type):
+            raise _error(entity_type, field_name, value, repr(field_type))
+        try:
+            return field_type(value)
+        except (TypeError, ValueError) as e:
+            raise _error(entity_type, field_name, value, getattr(field_type, "__name__", repr(field_type))) from e
+
+    return coerce
+
+
+def _checked_class(field_type: Any) -> Optional[type]:
+    """
+    Class which values of a field need to have, e.g. `list` for `List[int]`. Items of containers aren't checked.
+    Returns None if values can't be checked by their class, e.g. for `Union` or `Any`.
+    """
+    if field_type is Any:  # a class since Python 3.11
+        return None
+    field_type = get_origin(field_type) or field_type
+    return field_type if isinstance(field_type, type) else None
+
+
+def _generate_parse(entity_type: Type) -> Callable:
+    """
+    Generates straight-line code reading, checking and converting each field. Values which already have the exact
+    field type are only checked with a single class comparison.
+    """
+    namespace: Dict[str, Any] = {"missing": MISSING, "EntityParseException": EntityParseException}
+    lines = ["def parse(cls, data):"]
+    arguments = []
+    for index, entity_field in enumerate(field for field in fields(entity_type) if field.init):
+        field_type, optional = unwrap_optional(entity_field.type)
+        field_class = _checked_class(field_type)
+        value, name = f"v{index}", entity_field.name
+        namespace[f"t{index}"] = field_class
+        namespace[f"c{index}"] = _coercer(field_class, container=get_origin(field_type) is not None)
+        if entity_field.default is not MISSING:
+            namespace[f"d{index}"] = entity_field.default
+            lines.append(f"    {value} = data.get({name!r}, d{index})")
+        elif optional:
+            lines.append(f"    {value} = data.get({name!r})")
+        else:
+            lines += [
+                f"    {value} = data.get({name!r}, missing)",
+                f"    if {value} is missing:",
+                f"        raise EntityParseException('{entity_type.__name__}.{name}: missing value')",
+            ]
+        if field_class is None:
+            if not optional:
+                lines += [
+                    f"    if {value} is None:",
+                    f"        raise EntityParseException('{entity_type.__name__}.{name}: value is required')",
+                ]
+        elif optional:
+            lines += [
+                f"    if {value} is not None and {value}.__class__ is not t{index}:",
+                f"        {value} = c{index}(cls, {name!r}, {value})",
+            ]
+        else:
+            lines += [
+                f"    if {value}.__class__ is not t{index}:",
+                f"        if {value} is None:",
+                f"            raise EntityParseException('{entity_type.__name__}.{name}: value is required')",
+                f"        {value} = c{index}(cls, {name!r}, {value})",
+            ]
+        arguments.append(value)
+    lines.append(f"    return cls({', '.join(arguments)})")
+    return compile_function("parse", "\n".join(lines), namespace)
+
+
+def _generate_parse_many(entity_type: Type) -> Callable:
+    def parse_many(cls, items):
+        parse = cls.parse
+        return [parse(data) for data in items]
+
+    return parse_many
+
+
+def add_parsers(entity_type: Type) -> Type:
+    """
+    Adds constructors checking and converting values to the field types of an entity:
+    - `parse(data)` creates an entity from a dictionary,
+    - `parse_many(items)` creates a list of entities from an iterable of dictionaries.
+    Missing fields get their default, optional fields get None. Builtin types are converted from compatible values,
+    e.g. `"1"` to `int`, values of containers, e.g. `List[int]`, need to be instances of their class and other types
+    are created by calling them with the value. Unknown keys are ignored.
+    The code of `parse` is generated for the fields of the entity on its first use.
+
+    :param entity_type: Entity type
+    :returns: the same type
+    :raises:
+        EntityParseException: raised by the constructors if a value is missing or can't be converted.
+    """
+    entity_type.parse = CompiledMethod("parse", _generate_parse, is_classmethod=True)
+    entity_type.parse_many = CompiledMethod("parse_many", _generate_parse_many, is_classmethod=True)
+    return entity_type
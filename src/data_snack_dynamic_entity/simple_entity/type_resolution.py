@@ -0,0 +1,181 @@
+import builtins
+import re
+import typing
+from dataclasses import dataclass, field
+from functools import lru_cache
+from types import ModuleType
+from typing import Any, Dict, FrozenSet, Optional, Tuple
+
+_TOKEN = re.compile(r"\s*(?:([A-Za-z_][\w.]*)|(\.\.\.)|(.))")
+_TYPING_NAMES = frozenset({
+    "Any", "Dict", "FrozenSet", "Iterable", "List", "Mapping", "Optional", "Sequence", "Set", "Tuple", "Union",
+})
+_PARSE_CACHE_SIZE = 4096
+
+# Parsed type expression: a name or `...`, and arguments if the type is parametrized, e.g. `("Dict", (("str", ()),
+# ("float", ())))` for `Dict[str, float]`.
+TypeExpression = Tuple[str, Tuple["TypeExpression", ...]]
+
+
+@lru_cache(maxsize=_PARSE_CACHE_SIZE)
+def parse_type_expression(expression: str) -> TypeExpression:
+    """
+    Parses a type string, e.g. `int`, `decimal.Decimal`, `List[int]` or `Dict[str, Tuple[int, ...]]`.
+    Results are memoized, templates usually repeat the same few type strings.
+
+    :param expression: type string from a template
+    :returns: parsed expression
+    :raises:
+        ValueError: if the string isn't a valid type expression.
+    """
+    tokens = []
+    for match in _TOKEN.finditer(expression.rstrip()):
+        name, ellipsis, symbol = match.groups()
+        if symbol is not None and symbol not in "[],":
+            raise ValueError(expression)
+        tokens.append(name or ellipsis or symbol)
+    parsed, position = _parse_tokens(expression, tokens, 0)
+    if position != len(tokens):
+        raise ValueError(expression)
+    return parsed
+
+
+def _parse_tokens(expression: str, tokens: list, position: int) -> Tuple[TypeExpression, int]:
+    if position >= len(tokens) or tokens[position] in ("[", "]", ","):
+        raise ValueError(expression)
+    name, position = tokens[position], position + 1
+    if position == len(tokens) or tokens[position] != "[":
+        return (name, ()), position
+    arguments = []
+    while True:
+        argument, position = _parse_tokens(expression, tokens, position + 1)
+        arguments.append(argument)
+        if position < len(tokens) and tokens[position] == ",":
+            continue
+        if position < len(tokens) and tokens[position] == "]":
+            return (name, tuple(arguments)), position + 1
+        raise ValueError(expression)
+
+
+@lru_cache(maxsize=_PARSE_CACHE_SIZE)
+def type_names(expression: str) -> FrozenSet[str]:
+    """
+    Gets all names used by a type string, e.g. `{"Dict", "str", "Money"}` for `Dict[str, Money]`.
+
+    :param expression: type string from a template
+    :returns: names used by the expression
+    :raises:
+        ValueError: if the string isn't a valid type expression.
+    """
+    def collect(parsed: TypeExpression) -> FrozenSet[str]:
+        name, arguments = parsed
+        return frozenset({name}).union(*map(collect, arguments))
+
+    return collect(parse_type_expression(expression))
+
+
+def _is_type(obj: Any) -> bool:
+    return isinstance(obj, type) or typing.get_origin(obj) is not None
+
+
+@lru_cache(maxsize=_PARSE_CACHE_SIZE)
+def _resolve_global_name(name: str) -> Any:
+    """Resolves a name which isn't mapped by `types_mapping`: a builtin type or a `typing` alias."""
+    if name == "None":
+        return type(None)
+    if name == "...":
+        return Ellipsis
+    if isinstance(t := getattr(builtins, name, None), type):
+        return t
+    if name in _TYPING_NAMES:
+        return getattr(typing, name)
+    raise ValueError(name)
+
+
+_shared_types: Dict[Tuple[str, bool], Any] = {}  # types of expressions which don't depend on any `types_mapping`
+
+
+@dataclass
+class TypeResolver:
+    """
+    Resolves type strings of templates into types, with memoization shared by all entities of a factory.
+    Each name is looked up in builtins first, then in `types_mapping` and finally in `typing` (e.g. `List`).
+    Dotted paths, e.g. `decimal.Decimal`, are resolved only in modules mapped by `types_mapping`
+    (e.g. `{"decimal": decimal}`), templates never import modules. Parametrized types, e.g. `Dict[str, Money]`,
+    are resolved from their parts. Types which don't depend on `types_mapping` are also shared between resolvers.
+    """
+    types_mapping: Dict[str, Any] = field(default_factory=dict)
+    _resolved: Dict[Tuple[str, bool], Any] = field(default_factory=dict, init=False, repr=False)
+
+    def resolve(self, expression: str, optional: bool = False) -> Any:
+        """
+        Gets the type of a type string.
+
+        :param expression: type string from a template
+        :param optional: wrap the type in `Optional`
+        :returns: the type
+        :raises:
+            ValueError: if a name can't be resolved or the expression isn't a valid type.
+        """
+        key = (expression, optional)
+        if (resolved := self._resolved.get(key)) is not None:
+            return resolved
+        shared = self._is_shared(expression)
+        if not shared or (resolved := _shared_types.get(key)) is None:
+            resolved = self._resolve_expression(expression)
+            if optional:
+                resolved = Optional[resolved]
+            if shared:
+                _shared_types[key] = resolved
+        self._resolved[key] = resolved
+        return resolved
+
+    def _is_shared(self, expression: str) -> bool:
+        if expression in self.types_mapping:
+            return False
+        try:
+            names = type_names(expression)
+        except ValueError:
+            return False
+        return names.isdisjoint(self.types_mapping) and all("." not in name or name == "..." for name in names)
+
+    def _resolve_expression(self, expression: str) -> Any:
+        if isinstance(t := getattr(builtins, expression, None), type):
+            return t
+        if t := self.types_mapping.get(expression):  # mapping keys may look like expressions, e.g. `numpy.float16`
+            return t
+        resolved = self._resolve_parsed(expression, parse_type_expression(expression))
+        if resolved is Ellipsis:
+            raise ValueError(expression)
+        return resolved
+
+    def _resolve_parsed(self, expression: str, parsed: TypeExpression) -> Any:
+        name, arguments = parsed
+        base = self._resolve_name(name)
+        if not arguments:
+            return base
+        resolved_arguments = tuple(self._resolve_parsed(expression, argument) for argument in arguments)
+        try:
+            return base[resolved_arguments if len(resolved_arguments) > 1 else resolved_arguments[0]]
+        except TypeError as e:
+            raise ValueError(expression) from e
+
+    def _resolve_name(self, name: str) -> Any:
+        if isinstance(t := getattr(builtins, name, None), type):
+            return t
+        if t := self.types_mapping.get(name):
+            return t
+        if "." in name and name != "...":
+            return self._resolve_module_attribute(name)
+        return _resolve_global_name(name)
+
+    def _resolve_module_attribute(self, name: str) -> Any:
+        parts = name.split(".")
+        for split in range(len(parts) - 1, 0, -1):
+            if isinstance(obj := self.types_mapping.get(".".join(parts[:split])), ModuleType):
+                for attribute in parts[split:]:
+                    obj = getattr(obj, attribute, None)
+                if _is_type(obj):
+                    return obj
+                break
+        raise ValueError(name)
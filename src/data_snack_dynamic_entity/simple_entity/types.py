@@ -1,4 +1,4 @@
-from typing import TypedDict, Dict, Any
+from typing import TypedDict, Dict, Any, List
 
 
 class FieldSchema(TypedDict):
@@ -13,6 +13,28 @@ class SimpleEntitySchema(TypedDict):
     properties: Dict[str, FieldSchema]
     version: int
     type: str
+    slots: bool
 
 
 SimpleEntityTemplates = Dict[str, SimpleEntitySchema]
+
+
+class FieldSpec(TypedDict):
+    name: str
+    type: str
+    optional: bool
+
+
+class DefaultFieldSpec(FieldSpec):
+    default: Any
+
+
+class SimpleEntitySpec(TypedDict):
+    """Normalized entity template, ready to create a type from."""
+    name: str
+    version: int
+    keys: List[str]
+    excluded_fields: List[str]
+    fields: List[FieldSpec]
+    fields_with_defaults: List[DefaultFieldSpec]
+    slots: bool
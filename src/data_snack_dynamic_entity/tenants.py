@@ -0,0 +1,124 @@
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+from threading import Lock
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Type
+
+from data_snack_dynamic_entity.cache import EntityCache, entity_cache
+from data_snack_dynamic_entity.factory import EntityBuilder, load_entities
+from data_snack_dynamic_entity.graph import EntityGraph
+from data_snack_dynamic_entity.registry import EntityRegistry
+from data_snack_dynamic_entity.types import EntityTemplates
+from data_snack_dynamic_entity.utils import same_template
+from data_snack_dynamic_entity.validate import EntityTemplatesValidator
+
+TemplateOverrides = Dict[str, Optional[Dict]]  # entity name to its template, None removes the entity
+
+
+@dataclass(eq=False)
+class TenantRegistry(Mapping):
+    """
+    Entity types of many tenants sharing the same base templates, each tenant can override, add or remove entities.
+    Maps tenant names to read-only registries of their entity types, e.g. `tenants["acme"]["Car"]`.
+
+    Tenants share types of the base templates (copy-on-write): only overridden entities and compound entities
+    depending on them are created for a tenant. Types are created through the cache, which is addressed by template
+    content, so tenants with identical overrides share the same classes as well.
+    """
+    templates: EntityTemplates  # base templates
+    types_mapping: Dict[str, Any] = field(default_factory=dict)
+    cache: Optional[EntityCache] = entity_cache
+    validate: bool = True
+    fast_validation: bool = False
+    _tenants: Dict[str, Tuple[TemplateOverrides, EntityRegistry]] = field(default_factory=dict, init=False, repr=False)
+    _lock: Lock = field(default_factory=Lock, init=False, repr=False)
+
+    def __post_init__(self):
+        self._builder = EntityBuilder(self.types_mapping, cache=self.cache)
+        self._validator = EntityTemplatesValidator(fast=self.fast_validation)
+        self._graph = EntityGraph.from_templates(self.templates)
+        self._base = load_entities(
+            self.templates, self.types_mapping, cache=self.cache, validate=self.validate, validator=self._validator
+        )
+
+    def __getitem__(self, tenant: str) -> EntityRegistry:
+        return self._tenants[tenant][1]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._tenants)
+
+    def __len__(self) -> int:
+        return len(self._tenants)
+
+    @property
+    def base(self) -> Dict[str, Type]:
+        """Entity types of the base templates."""
+        return dict(self._base)
+
+    def overrides(self, tenant: str) -> TemplateOverrides:
+        """Gets template overrides of a tenant."""
+        return dict(self._tenants[tenant][0])
+
+    def tenant_templates(self, tenant: str) -> EntityTemplates:
+        """Gets all templates of a tenant: base templates with its overrides applied."""
+        return self._merge(self._tenants[tenant][0])
+
+    def set_tenant(self, tenant: str, overrides: Optional[TemplateOverrides] = None) -> EntityRegistry:
+        """
+        Adds a tenant or replaces overrides of an existing one. The registry of an existing tenant is updated in place,
+        all its types are published at once after they were created. On errors the tenant keeps its previous types.
+
+        :param tenant: tenant name
+        :param overrides: templates of entities overridden or added by the tenant, None for removed entities
+        :returns: registry of tenant entity types
+        :raises:
+            ValidationError: if overridden templates don't follow the schema.
+            NonExistingSourceEntityException: if a compound entity uses a removed entity.
+        """
+        overrides = dict(overrides or {})
+        entities = self._load(overrides)
+        with self._lock:
+            if tenant in self._tenants:
+                registry = self._tenants[tenant][1]
+                registry.replace(entities)
+            else:
+                registry = EntityRegistry(entities)
+            self._tenants[tenant] = (overrides, registry)
+        return registry
+
+    def remove_tenant(self, tenant: str) -> None:
+        """
+        Removes a tenant, its registry isn't updated anymore.
+
+        :param tenant: tenant name
+        """
+        with self._lock:
+            del self._tenants[tenant]
+
+    def unique_types(self) -> List[Type]:
+        """Gets all distinct entity types of the base templates and all tenants, e.g. to check their memory usage."""
+        types = {id(t): t for t in self._base.values()}
+        for _, registry in list(self._tenants.values()):
+            types.update({id(t): t for t in registry.values()})
+        return list(types.values())
+
+    def _merge(self, overrides: TemplateOverrides) -> EntityTemplates:
+        templates = {name: overrides.get(name, schema) for name, schema in self.templates.items()}
+        templates.update({name: schema for name, schema in overrides.items() if name not in templates})
+        return {name: schema for name, schema in templates.items() if schema is not None}
+
+    def _load(self, overrides: TemplateOverrides) -> Dict[str, Type]:
+        """Creates types of overridden entities and compound entities depending on them, reusing all other types."""
+        changed = [
+            name for name, schema in overrides.items()
+            if schema is not None and not same_template(self.templates.get(name), schema)
+        ]
+        removed = [name for name, schema in overrides.items() if schema is None and name in self.templates]
+        if not changed and not removed:
+            return self._base
+        templates = self._merge(overrides)
+        if self.validate:
+            self._validator.validate({name: templates[name] for name in changed})
+
+        graph = EntityGraph.from_templates(templates)
+        outdated = graph.downstream(changed) | (self._graph.downstream(removed) - set(removed))
+        return self._builder.rebuild(templates, outdated, self._base)
@@ -0,0 +1,72 @@
+from dataclasses import field, fields, make_dataclass
+from typing import Any, Tuple, Type, Union, get_args, get_origin
+
+
+def add_slots(cls: Type) -> Type:
+    """
+    Recreates a dataclass with `__slots__` holding its fields, like `dataclass(slots=True)` available since Python 3.10.
+    Notice `Entity` base classes don't define `__slots__`, so instances still have a `__dict__` attribute,
+    but it stays empty and isn't allocated by the interpreter unless used.
+
+    :param cls: dataclass to recreate
+    :returns: new dataclass using slots
+    """
+    field_names = tuple(f.name for f in fields(cls))
+    cls_dict = dict(cls.__dict__)
+    cls_dict["__slots__"] = field_names
+    for field_name in field_names:
+        cls_dict.pop(field_name, None)  # class attributes holding defaults would conflict with slots
+    cls_dict.pop("__dict__", None)
+    cls_dict.pop("__weakref__", None)
+    return type(cls)(cls.__name__, cls.__bases__, cls_dict)
+
+
+def add_dataclass_fields(cls: Type) -> Type:
+    """
+    Turns a class defining its own dataclass methods, e.g. in a module written by `codegen`, into a dataclass
+    without generating the methods again. Fields are read from class annotations and their defaults from
+    `__init__` defaults, so `dataclasses.fields`, `asdict` and `replace` work like for a class created by `dataclass`.
+    Dataclass parameters are inherited from `Entity` / `CompoundEntity`.
+
+    :param cls: class with annotated fields and `__init__` taking them in the same order
+    :returns: the same class
+    """
+    annotations = cls.__dict__.get("__annotations__", {})
+    defaults = cls.__init__.__defaults__ or ()
+    first_default = len(annotations) - len(defaults)
+    field_specs = [
+        (field_name, field_type, field(default=defaults[index - first_default]) if index >= first_default else field())
+        for index, (field_name, field_type) in enumerate(annotations.items())
+    ]
+    # `dataclass` sets up the fields of a bare class, which doesn't get any generated methods
+    spec = make_dataclass(cls.__name__, field_specs, init=False, repr=False, eq=False, match_args=False)
+    cls.__dataclass_fields__ = spec.__dataclass_fields__
+    return cls
+
+
+def unwrap_optional(field_type: Any) -> Tuple[Any, bool]:
+    """
+    Extracts the type wrapped in `Optional`.
+
+    :param field_type: type annotation
+    :returns: the wrapped type and True, or the original type and False if it isn't optional
+    """
+    if get_origin(field_type) is not Union or type(None) not in get_args(field_type):
+        return field_type, False
+    args = tuple(arg for arg in get_args(field_type) if arg is not type(None))
+    return (args[0] if len(args) == 1 else Union[args]), True
+
+
+def same_template(old_schema: Any, new_schema: Any) -> bool:
+    """
+    Compares two entity templates like `==`, but also by the order of their properties,
+    which decides the order of fields and of values stored by position.
+
+    :param old_schema: entity template
+    :param new_schema: entity template
+    :returns: True if the templates create the same entity type
+    """
+    if old_schema != new_schema:
+        return False
+    properties = old_schema.get("properties") if isinstance(old_schema, dict) else None
+    return not isinstance(properties, dict) or list(properties) == list(new_schema["properties"])
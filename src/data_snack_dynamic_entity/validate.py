@@ -1,26 +1,270 @@
 import json
+import re
+from dataclasses import dataclass, field
 from jsonschema import Draft7Validator
+from jsonschema.exceptions import ValidationError as SchemaError
 from pathlib import Path
+from typing import Any, Dict, Iterator, List, Set
 
+from data_snack_dynamic_entity.cache import fingerprint
 from data_snack_dynamic_entity.types import EntityTemplates
 
-_SCHEMA = json.load(
-    open(Path(__file__).resolve().parent / "./entityTemplates.schema.json")
+_SCHEMA = json.loads(
+    (Path(__file__).resolve().parent / "./entityTemplates.schema.json").read_text()
 )
+_VALIDATOR = Draft7Validator(_SCHEMA)  # compiled once, validators are stateless and can be shared
+
+_ENTITY_NAME_PATTERN = next(iter(_SCHEMA["patternProperties"]))
+_ENTITY_NAME_REGEX = re.compile(_ENTITY_NAME_PATTERN)
+_ENTITY_VALIDATOR = Draft7Validator(_SCHEMA["patternProperties"][_ENTITY_NAME_PATTERN])
+_FIELD_NAME_REGEX = re.compile("^[a-zA-Z0-9_]+$")
+_FIELD_PROPERTIES = {"type", "default", "key", "optional", "excluded"}
+_KEY_FIELD_PROPERTIES = {"type", "key", "optional", "excluded"}
+_SOURCE_PROPERTIES = {"entity", "fields", "optional"}
+_SOURCE_FIELD_PROPERTIES = {"field", "source_field"}
 
 
 class ValidationError(Exception):
     ...
 
 
-def validate_entity_templates(templates: EntityTemplates) -> None:
+def _is_bool(value: Any) -> bool:
+    return isinstance(value, bool)
+
+
+def _is_str(value: Any) -> bool:
+    return isinstance(value, str)
+
+
+def _is_integer(value: Any) -> bool:
+    return (isinstance(value, int) and not isinstance(value, bool)) or (
+        isinstance(value, float) and value.is_integer()
+    )
+
+
+def _is_default(value: Any) -> bool:
+    return isinstance(value, (str, int, float))  # bool is a subclass of int
+
+
+def _is_valid_field(field_schema: Any) -> bool:
+    if not isinstance(field_schema, dict):
+        return False
+    if "type" in field_schema and not _is_str(field_schema["type"]):
+        return False
+    if "excluded" in field_schema and not _is_bool(field_schema["excluded"]):
+        return False
+    key = field_schema.get("key", False)
+    if key is True:
+        return field_schema.keys() <= _KEY_FIELD_PROPERTIES and field_schema.get("optional", False) is False
+    if key is not False or not field_schema.keys() <= _FIELD_PROPERTIES:
+        return False
+    if "optional" in field_schema and not _is_bool(field_schema["optional"]):
+        return False
+    return "default" not in field_schema or _is_default(field_schema["default"])
+
+
+def _is_valid_simple_entity(entity_schema: Dict) -> bool:
+    if not {"properties", "version", "type"} <= entity_schema.keys():
+        return False
+    if entity_schema["type"] != "simple" or not _is_integer(entity_schema["version"]):
+        return False
+    if not _is_bool(entity_schema.get("slots", False)):
+        return False
+    properties = entity_schema["properties"]
+    return isinstance(properties, dict) and all(
+        _FIELD_NAME_REGEX.search(field_name) and _is_valid_field(field_schema)
+        for field_name, field_schema in properties.items()
+    )
+
+
+def _is_valid_source_field(source_field: Any) -> bool:
+    return (
+        isinstance(source_field, dict)
+        and source_field.keys() == _SOURCE_FIELD_PROPERTIES
+        and _is_str(source_field["field"])
+        and _is_str(source_field["source_field"])
+    )
+
+
+def _is_valid_source(source: Any) -> bool:
+    return (
+        isinstance(source, dict)
+        and {"entity", "fields"} <= source.keys() <= _SOURCE_PROPERTIES
+        and _is_str(source["entity"])
+        and _is_bool(source.get("optional", False))
+        and isinstance(source["fields"], list)
+        and all(_is_valid_source_field(source_field) for source_field in source["fields"])
+    )
+
+
+def _is_valid_compound_entity(entity_schema: Dict) -> bool:
+    if not {"type", "sources"} <= entity_schema.keys() or entity_schema["type"] != "compound":
+        return False
+    if not _is_bool(entity_schema.get("slots", False)):
+        return False
+    fields_order = entity_schema.get("fields_order", [])
+    if not isinstance(fields_order, list) or not all(map(_is_str, fields_order)):
+        return False
+    if len(set(fields_order)) != len(fields_order):
+        return False
+    sources = entity_schema["sources"]
+    return isinstance(sources, list) and all(_is_valid_source(source) for source in sources)
+
+
+def _entity_names_error(names: List[str], instance: Any) -> SchemaError:
+    verb = "does" if len(names) == 1 else "do"
+    return SchemaError(
+        f"{', '.join(map(repr, names))} {verb} not match any of the regexes: {_ENTITY_NAME_PATTERN!r}",
+        validator="additionalProperties",
+        instance=instance,
+    )
+
+
+def _iter_fast_entity_errors(entity_name: str, entity_schema: Any) -> Iterator[SchemaError]:
+    if not isinstance(entity_schema, dict) or not (
+        _is_valid_simple_entity(entity_schema) or _is_valid_compound_entity(entity_schema)
+    ):
+        yield SchemaError(
+            f"{entity_schema!r} is not valid under any of the given schemas",
+            validator="anyOf",
+            path=[entity_name],
+            instance=entity_schema,
+        )
+
+
+def _iter_entity_errors(entity_name: str, entity_schema: Any) -> Iterator[SchemaError]:
+    for error in _ENTITY_VALIDATOR.iter_errors(entity_schema):
+        error.path.appendleft(entity_name)
+        yield error
+
+
+def _iter_fast_errors(templates: EntityTemplates) -> Iterator[SchemaError]:
+    """
+    Hand-written equivalent of `Draft7Validator(_SCHEMA).iter_errors`.
+    Yields errors with the same messages and paths, skipping the costly generic schema traversal.
+    """
+    if not isinstance(templates, dict):
+        yield SchemaError(f"{templates!r} is not of type 'object'", validator="type", instance=templates)
+        return
+    if extras := sorted(name for name in templates if not _ENTITY_NAME_REGEX.search(name)):
+        yield _entity_names_error(extras, templates)
+    for entity_name, entity_schema in templates.items():
+        if _ENTITY_NAME_REGEX.search(entity_name):
+            yield from _iter_fast_entity_errors(entity_name, entity_schema)
+
+
+def collect_validation_errors(templates: EntityTemplates, fast: bool = False) -> List[SchemaError]:
+    """
+    Collects all schema errors of provided templates config, sorted by their path.
+
+    :param templates: input config containing templates
+    :param fast: use the hand-written checker instead of the generic jsonschema validator
+    :returns: a list of schema errors
+    """
+    errors = _iter_fast_errors(templates) if fast else _VALIDATOR.iter_errors(templates)
+    return sorted(errors, key=lambda x: x.path)
+
+
+def validate_entity_templates(templates: EntityTemplates, fast: bool = False) -> None:
     """
     Validates if provided templates config follows the right schema.
 
     :param templates: input config containing templates
+    :param fast: use the hand-written checker instead of the generic jsonschema validator, both report the same errors
     :raises:
         ValidationError: if templates don't follow the schema.
     """
-    validator = Draft7Validator(_SCHEMA)
-    if errors := sorted(validator.iter_errors(templates), key=lambda x: x.path):
+    if errors := collect_validation_errors(templates, fast):
         raise ValidationError(errors)
+
+
+def detach_errors(errors: Dict[str, List[SchemaError]]) -> Dict[str, List[SchemaError]]:
+    """
+    Copies schema errors without references to the validator which reported them, e.g. to send them between
+    processes: errors of the jsonschema validator hold its type checker, which can't be pickled.
+    Messages, paths and instances are kept, sub-errors of `anyOf` / `oneOf` are dropped.
+
+    :param errors: errors grouped by entity name
+    :returns: picklable copies of the errors
+    """
+    return {
+        entity_name: [
+            SchemaError(
+                error.message,
+                validator=error.validator,
+                path=error.path,
+                schema_path=error.schema_path,
+                instance=error.instance,
+                validator_value=error.validator_value,
+                schema=error.schema,
+            )
+            for error in entity_errors
+        ]
+        for entity_name, entity_errors in errors.items()
+    }
+
+
+@dataclass
+class EntityTemplatesValidator:
+    """
+    Validates templates entity by entity, each one against its own sub-schema.
+    Templates which were already validated successfully are remembered by their hash and skipped,
+    so validating a reloaded config costs only as much as the changed entities.
+    Errors are reported as a dictionary `{entity_name: [errors]}`.
+    """
+    fast: bool = False  # use the hand-written checker instead of the generic jsonschema validator
+    fail_fast: bool = False  # stop at the first invalid entity
+    _validated: Set[str] = field(default_factory=set, init=False, repr=False)
+
+    def collect_errors(self, templates: EntityTemplates) -> Dict[str, List[SchemaError]]:
+        """
+        Collects schema errors of provided templates config grouped by entity name.
+
+        :param templates: input config containing templates
+        :returns: a dictionary with errors of each invalid entity
+        """
+        if not isinstance(templates, dict):
+            return {"": collect_validation_errors(templates, self.fast)}
+
+        errors = {}
+        for entity_name, entity_schema in templates.items():
+            if entity_errors := self.collect_entity_errors(entity_name, entity_schema):
+                errors[entity_name] = entity_errors
+                if self.fail_fast:
+                    break
+        return errors
+
+    def collect_entity_errors(self, entity_name: str, entity_schema: Any) -> List[SchemaError]:
+        """
+        Collects schema errors of a single entity template.
+
+        :param entity_name: entity name
+        :param entity_schema: entity schema
+        :returns: a list of schema errors sorted by their path
+        """
+        entity_hash = fingerprint([entity_name, entity_schema])
+        if entity_hash in self._validated:
+            return []
+        if not _ENTITY_NAME_REGEX.search(entity_name):
+            return [_entity_names_error([entity_name], {entity_name: entity_schema})]
+
+        iter_errors = _iter_fast_entity_errors if self.fast else _iter_entity_errors
+        if errors := sorted(iter_errors(entity_name, entity_schema), key=lambda x: x.path):
+            return errors
+        self._validated.add(entity_hash)
+        return []
+
+    def validate(self, templates: EntityTemplates) -> None:
+        """
+        Validates if provided templates config follows the right schema.
+
+        :param templates: input config containing templates
+        :raises:
+            ValidationError: if templates don't follow the schema, errors are grouped by entity name.
+        """
+        if errors := self.collect_errors(templates):
+            raise ValidationError(errors)
+
+    def clear(self) -> None:
+        """Forgets all validated templates."""
+        self._validated.clear()
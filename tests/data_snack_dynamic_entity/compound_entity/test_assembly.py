@@ -0,0 +1,76 @@
+from typing import Dict, Type
+
+import pytest
+from data_snack.entities.compound import CompoundEntity
+
+from data_snack_dynamic_entity.compound_entity.assembly import build_assembly_plan
+from data_snack_dynamic_entity.compound_entity.factory import CompoundEntityFactory
+from data_snack_dynamic_entity.compound_entity.types import CompoundEntityTemplates
+from tests.data_snack_dynamic_entity.compound_entity.conftest import Car, CarOwner
+
+
+@pytest.fixture
+def registration_type(compound_entity_templates: CompoundEntityTemplates, source_entities: Dict[str, Type]) -> Type:
+    return CompoundEntityFactory().load_entities(compound_entity_templates, source_entities)["Registration"]
+
+
+def _create_generic(entity_type: Type, *entities, key_values=None):
+    return CompoundEntity.create_from_source_entities.__func__(
+        entity_type,
+        list(entities),
+        [source.entity_fields_mapping for source in entity_type.Meta.sources],
+        key_values if key_values is not None else [],
+    )
+
+
+def test__build_assembly_plan(registration_type: Type) -> None:
+    plan = build_assembly_plan(registration_type)
+
+    assert plan.fields == ("car_index", "person_index", "brand", "name")
+    assert [(source.source_fields, source.positions) for source in plan.sources] == [
+        (("index", "brand"), (0, 2)),
+        (("index", "car_index", "name"), (1, 0, 3)),
+    ]
+    assert plan.key_positions == tuple(plan.fields.index(key) for key in registration_type.get_keys())
+    assert plan.sources[1].getter(CarOwner("owner", "car", "John")) == ("owner", "car", "John")
+
+
+@pytest.mark.parametrize("car, owner", [
+    (Car("car", "BMW"), CarOwner("owner", "other car", "John")),
+    (Car("car", "BMW"), None),
+    (None, CarOwner("owner", "car", "John")),
+    (None, None),
+])
+def test__from_sources(registration_type: Type, car: Car, owner: CarOwner) -> None:
+    """Testing if the generated constructor assembles the same entity as data-snack does."""
+    assert registration_type.from_sources(car, owner) == _create_generic(registration_type, car, owner)
+
+
+def test__create_from_source_entities(registration_type: Type) -> None:
+    car, owner = Car("car", "BMW"), None
+    key_values = ["car", "owner"]
+    sources_mappings = [source.entity_fields_mapping for source in registration_type.Meta.sources]
+
+    registration = registration_type.create_from_source_entities([car, owner], sources_mappings, key_values)
+
+    assert registration == _create_generic(registration_type, car, owner, key_values=key_values)
+    assert registration.person_index == "owner"
+
+
+def test__from_sources__compiled_once(registration_type: Type) -> None:
+    registration_type.from_sources(None, None)
+    from_sources = registration_type.from_sources
+
+    assert "from_sources" in vars(registration_type)
+    assert registration_type.from_sources == from_sources
+
+
+def test__from_sources__slots(
+        compound_entity_templates: CompoundEntityTemplates, source_entities: Dict[str, Type]
+) -> None:
+    Registration = CompoundEntityFactory(slots=True).load_entities(compound_entity_templates, source_entities)[
+        "Registration"
+    ]
+    registration = Registration.from_sources(Car("car", "BMW"), None)
+
+    assert (registration.car_index, registration.brand, registration.name) == ("car", "BMW", None)
@@ -8,7 +8,10 @@ from data_snack.entities.models import EntityFieldMapping
 
 from data_snack_dynamic_entity.compound_entity.factory import CompoundEntityFactory
 from data_snack_dynamic_entity.compound_entity.types import CompoundEntityTemplates
-from data_snack_dynamic_entity.compound_entity.exceptions import NonExistingSourceEntityException
+from data_snack_dynamic_entity.compound_entity.exceptions import (
+    FieldsOrderException,
+    NonExistingSourceEntityException,
+)
 from data_snack_dynamic_entity.factory import load_entities
 from tests.data_snack_dynamic_entity.compound_entity.conftest import Car, CarOwner
 from tests.data_snack_dynamic_entity.utils import _is_optional
@@ -130,4 +133,52 @@ def test__compound_load_entities__executing_load_entities(
     source_entities_mock = MagicMock()
     simple_load_entities_mock.return_value = source_entities_mock
     load_entities(compound_entity_templates)
-    compound_load_entities_mock.assert_called_with(compound_entity_templates, source_entities_mock)
+    compound_load_entities_mock.assert_called_with(
+        compound_entity_templates, source_entities_mock, validate=False
+    )
+
+
+def test__compound_entity_factory__load_entities_with_slots(
+        compound_entity_templates: CompoundEntityTemplates,
+        source_entities: Dict[str, Type],
+) -> None:
+    compound_entities = CompoundEntityFactory(slots=True).load_entities(compound_entity_templates, source_entities)
+    Registration = compound_entities["Registration"]
+
+    assert set(Registration.__slots__) == {"car_index", "brand", "person_index", "name"}
+    registration = Registration(car_index=1, person_index=2)
+    assert registration.brand is None
+    assert not registration.__dict__
+
+
+def test__compound_entity_factory__fields_order(
+        compound_entity_factory: CompoundEntityFactory,
+        compound_entity_templates: CompoundEntityTemplates,
+        source_entities: Dict[str, Type],
+) -> None:
+    """Testing if fields follow the order of sources and their mappings, with fields with defaults last."""
+    Registration = compound_entity_factory.load_entities(compound_entity_templates, source_entities)["Registration"]
+
+    assert list(Registration.__dataclass_fields__) == ["car_index", "person_index", "brand", "name"]
+
+
+def test__compound_entity_factory__explicit_fields_order(
+        compound_entity_factory: CompoundEntityFactory,
+        compound_entity_templates: CompoundEntityTemplates,
+        source_entities: Dict[str, Type],
+) -> None:
+    compound_entity_templates["Registration"]["fields_order"] = ["person_index", "name"]
+    Registration = compound_entity_factory.load_entities(compound_entity_templates, source_entities)["Registration"]
+
+    assert list(Registration.__dataclass_fields__) == ["person_index", "car_index", "name", "brand"]
+    assert Registration("person", "car").car_index == "car"
+
+
+def test__compound_entity_factory__explicit_fields_order_unknown_field(
+        compound_entity_factory: CompoundEntityFactory,
+        compound_entity_templates: CompoundEntityTemplates,
+        source_entities: Dict[str, Type],
+) -> None:
+    compound_entity_templates["Registration"]["fields_order"] = ["owner_name"]
+    with pytest.raises(FieldsOrderException):
+        compound_entity_factory.load_entities(compound_entity_templates, source_entities)
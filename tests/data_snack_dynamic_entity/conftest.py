@@ -0,0 +1,37 @@
+import pytest
+from typing import Dict
+
+
+@pytest.fixture
+def entity_templates() -> Dict:
+    return {
+        "Car": {
+            "type": "simple",
+            "version": 1,
+            "properties": {
+                "index": {"type": "int", "key": True},
+                "brand": {"type": "str"},
+            }
+        },
+        "Person": {
+            "type": "simple",
+            "version": 1,
+            "properties": {
+                "index": {"type": "int", "key": True},
+                "name": {"type": "str"},
+            }
+        },
+        "Registration": {
+            "type": "compound",
+            "sources": [
+                {
+                    "entity": "Car",
+                    "fields": [
+                        {"field": "car_index", "source_field": "index"},
+                        {"field": "brand", "source_field": "brand"},
+                    ]
+                },
+                {"entity": "Person", "fields": [{"field": "person_index", "source_field": "index"}]},
+            ]
+        },
+    }
@@ -5,6 +5,7 @@ from data_snack.entities import Entity
 from typing import Type, get_type_hints
 from unittest.mock import patch
 
+from data_snack_dynamic_entity.cache import EntityCache, entity_cache
 from data_snack_dynamic_entity.factory import load_entities
 from data_snack_dynamic_entity.simple_entity.factory import SimpleEntityFactory
 from data_snack_dynamic_entity.simple_entity.types import SimpleEntityTemplates
@@ -176,7 +177,7 @@ def test__load_entities__passing_types_mapping(
 ):
     types_mapping = {"numpy.float16": np.float16}
     load_entities(simple_entity_templates, types_mapping)
-    simple_entity_factory_mock.assert_called_with(types_mapping)
+    simple_entity_factory_mock.assert_called_with(types_mapping, cache=entity_cache, observer=None)
 
 
 @patch('data_snack_dynamic_entity.factory.SimpleEntityFactory')
@@ -185,7 +186,7 @@ def test__load_entities__default_types_mapping(
         simple_entity_templates: SimpleEntityTemplates
 ):
     load_entities(simple_entity_templates)
-    simple_entity_factory_mock.assert_called_with({})
+    simple_entity_factory_mock.assert_called_with({}, cache=entity_cache, observer=None)
 
 
 @patch('data_snack_dynamic_entity.factory.SimpleEntityFactory.load_entities')
@@ -194,4 +195,31 @@ def test__load_entities__executing_load_entities(
         simple_entity_templates: SimpleEntityTemplates
 ):
     load_entities(simple_entity_templates, {})
-    load_entities_mock.assert_called_with(simple_entity_templates)
+    load_entities_mock.assert_called_with(simple_entity_templates, validate=False)
+
+
+@pytest.mark.parametrize("factory_slots, template_slots", [(True, False), (False, True)])
+def test__simple_entity_factory__load_entities_with_slots(
+        simple_entity_templates: SimpleEntityTemplates, factory_slots: bool, template_slots: bool
+) -> None:
+    """Testing if entities can be created with `__slots__` using a factory or a template option."""
+    simple_entity_templates["Car"]["slots"] = template_slots
+    Car = SimpleEntityFactory(slots=factory_slots).load_entities(simple_entity_templates)["Car"]
+
+    assert Car.__slots__ == ("index", "excluded", "name", "usage", "cost")
+    assert Car.get_keys() == ["index"]
+    assert Car.get_excluded_fields() == ["excluded"]
+
+    car = Car(index=1, excluded=2, name="name", usage=None)
+    assert car.cost == 0.0
+    assert car == Car(1, 2, "name", None, 0.0)
+    assert not car.__dict__
+
+
+def test__simple_entity_factory__slots_option_is_cached(simple_entity_templates: SimpleEntityTemplates) -> None:
+    cache = EntityCache()
+    Car = SimpleEntityFactory(cache=cache).load_entities(simple_entity_templates)["Car"]
+    SlottedCar = SimpleEntityFactory(cache=cache, slots=True).load_entities(simple_entity_templates)["Car"]
+
+    assert "__slots__" not in vars(Car)
+    assert "__slots__" in vars(SlottedCar)
@@ -0,0 +1,120 @@
+from typing import Any, Dict, Type
+
+import numpy as np
+import pytest
+
+from data_snack_dynamic_entity.cache import EntityCache
+from data_snack_dynamic_entity.simple_entity.exceptions import EntityParseException
+from data_snack_dynamic_entity.simple_entity.factory import SimpleEntityFactory
+
+
+@pytest.fixture
+def car_schema() -> Dict:
+    return {
+        "type": "simple",
+        "version": 1,
+        "properties": {
+            "index": {"type": "int", "key": True},
+            "brand": {"type": "str"},
+            "weight": {"type": "float", "optional": True},
+            "used": {"type": "bool", "default": False},
+            "cost": {"type": "numpy.float16", "optional": True},
+        }
+    }
+
+
+@pytest.fixture
+def Car(car_schema: Dict) -> Type:
+    factory = SimpleEntityFactory({"numpy.float16": np.float16}, coerce=True)
+    return factory.load_entity("Car", car_schema)
+
+
+def test__parse__exact_types(Car: Type) -> None:
+    car = Car.parse({"index": 1, "brand": "BMW", "weight": 1.5, "used": True, "cost": np.float16(2)})
+    assert car == Car(index=1, brand="BMW", weight=1.5, used=True, cost=np.float16(2))
+
+
+def test__parse__coerces_values(Car: Type) -> None:
+    car = Car.parse({"index": "1", "brand": 12, "weight": 3, "used": "yes", "cost": "2.5", "other": "ignored"})
+
+    assert car == Car(index=1, brand="12", weight=3.0, used=True, cost=np.float16(2.5))
+    assert type(car.weight) is float
+    assert type(car.cost) is np.float16
+
+
+def test__parse__missing_values(Car: Type) -> None:
+    assert Car.parse({"index": 1, "brand": "BMW"}) == Car(index=1, brand="BMW", weight=None, used=False, cost=None)
+
+
+@pytest.mark.parametrize("data", [
+    {"brand": "BMW"},
+    {"index": None, "brand": "BMW"},
+    {"index": "one", "brand": "BMW"},
+    {"index": 1.5, "brand": "BMW"},
+    {"index": True, "brand": "BMW"},
+    {"index": 1, "brand": ["BMW"]},
+    {"index": 1, "brand": "BMW", "used": "maybe"},
+    {"index": 1, "brand": "BMW", "cost": "cheap"},
+])
+def test__parse__invalid_values(Car: Type, data: Dict[str, Any]) -> None:
+    with pytest.raises(EntityParseException):
+        Car.parse(data)
+
+
+def test__parse_many(Car: Type) -> None:
+    assert Car.parse_many([{"index": "1", "brand": "BMW"}, {"index": 2, "brand": "Audi"}]) == [
+        Car(index=1, brand="BMW", weight=None, cost=None), Car(index=2, brand="Audi", weight=None, cost=None)
+    ]
+
+
+def test__parse__not_added_by_default(car_schema: Dict) -> None:
+    Car = SimpleEntityFactory({"numpy.float16": np.float16}).load_entity("Car", car_schema)
+    assert not hasattr(Car, "parse")
+
+
+def test__parse__option_is_a_part_of_cache_key(car_schema: Dict) -> None:
+    cache = EntityCache()
+    types_mapping = {"numpy.float16": np.float16}
+    Car = SimpleEntityFactory(types_mapping, cache=cache).load_entity("Car", car_schema)
+    ParsedCar = SimpleEntityFactory(types_mapping, cache=cache, coerce=True).load_entity("Car", car_schema)
+
+    assert Car is not ParsedCar
+    assert hasattr(ParsedCar, "parse")
+
+
+def test__parse__parametrized_types() -> None:
+    Order = SimpleEntityFactory(coerce=True).load_entity("Order", {
+        "type": "simple",
+        "version": 1,
+        "properties": {
+            "index": {"type": "int", "key": True},
+            "items": {"type": "List[int]"},
+            "note": {"type": "Union[int, str]", "optional": True},
+        }
+    })
+    assert Order.parse({"index": 1, "items": [1, 2], "note": "x"}) == Order(index=1, items=[1, 2], note="x")
+    with pytest.raises(EntityParseException):
+        Order.parse({"index": 1, "items": None})
+
+
+@pytest.mark.parametrize("items", ["abc", (1, 2), {"a": 1}])
+def test__parse__containers_are_not_constructed(items: Any) -> None:
+    Order = SimpleEntityFactory(coerce=True).load_entity("Order", {
+        "type": "simple",
+        "version": 1,
+        "properties": {"index": {"type": "int", "key": True}, "items": {"type": "List[int]"}},
+    })
+    with pytest.raises(EntityParseException):
+        Order.parse({"index": 1, "items": items})
+
+
+def test__parse__any() -> None:
+    Order = SimpleEntityFactory(coerce=True).load_entity("Order", {
+        "type": "simple",
+        "version": 1,
+        "properties": {"index": {"type": "int", "key": True}, "note": {"type": "Any"}},
+    })
+    for note in ["x", 1, [1], {"a": None}]:
+        assert Order.parse({"index": 1, "note": note}).note == note
+    with pytest.raises(EntityParseException):
+        Order.parse({"index": 1, "note": None})
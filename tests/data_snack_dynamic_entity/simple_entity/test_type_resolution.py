@@ -0,0 +1,84 @@
+import decimal
+import sys
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+import numpy as np
+import pytest
+
+from data_snack_dynamic_entity.factory import load_entities
+from data_snack_dynamic_entity.simple_entity.type_resolution import TypeResolver, parse_type_expression, type_names
+
+
+class Money:
+    def __init__(self, value):
+        self.value = value
+
+
+@pytest.mark.parametrize("expression, expected", [
+    ("int", int),
+    ("decimal.Decimal", decimal.Decimal),
+    ("numpy.float16", np.float16),
+    ("List[int]", List[int]),
+    ("list[int]", list[int]),
+    ("Dict[str, float]", Dict[str, float]),
+    ("Dict[str, Tuple[int, ...]]", Dict[str, Tuple[int, ...]]),
+    ("Union[int, None]", Optional[int]),
+    ("Money", Money),
+    ("List[Money]", List[Money]),
+])
+def test__type_resolver__resolve(expression: str, expected: Any) -> None:
+    assert TypeResolver({"Money": Money, "decimal": decimal, "numpy": np}).resolve(expression) == expected
+
+
+@pytest.mark.parametrize("expression", [
+    "print", "unknown", "decimal.localcontext", "decimal.Missing", "numpy.float16", "no_such_module.Type", "List[",
+    "List[int]]", "int[str]", "...", "", "Dict[str float]",
+])
+def test__type_resolver__resolve_invalid(expression: str) -> None:
+    with pytest.raises(ValueError):
+        TypeResolver({"decimal": decimal}).resolve(expression)
+
+
+def test__type_resolver__doesnt_import_modules() -> None:
+    """Testing if templates can't import modules which aren't mapped by `types_mapping`."""
+    assert "this" not in sys.modules  # prints a poem when imported
+    with pytest.raises(ValueError):
+        TypeResolver().resolve("this.Type")
+    assert "this" not in sys.modules
+
+
+def test__type_resolver__optional_memoized() -> None:
+    resolver = TypeResolver()
+    assert resolver.resolve("List[int]", optional=True) == Optional[List[int]]
+    assert resolver.resolve("List[int]", optional=True) is resolver.resolve("List[int]", optional=True)
+    assert TypeResolver().resolve("List[int]", optional=True) is resolver.resolve("List[int]", optional=True)
+
+
+def test__type_resolver__mapping_precedence() -> None:
+    assert TypeResolver({"int": str}).resolve("int") is int  # builtins first
+    assert TypeResolver({"decimal.Decimal": float}).resolve("List[decimal.Decimal]") == List[float]
+    assert TypeResolver({"Dict": Union}).resolve("Dict[int, str]") == Union[int, str]
+    assert TypeResolver({"decimal": decimal}).resolve("List[decimal.Decimal]") == List[decimal.Decimal]
+    with pytest.raises(ValueError):
+        TypeResolver().resolve("List[decimal.Decimal]")  # not shared with resolvers mapping the module
+
+
+def test__parse_type_expression() -> None:
+    assert parse_type_expression(" Dict[ str,List[x.Y] ] ") == ("Dict", (("str", ()), ("List", (("x.Y", ()),))))
+    assert type_names("Dict[str, List[Money]]") == {"Dict", "str", "List", "Money"}
+
+
+def test__load_entities__parametrized_types() -> None:
+    Car = load_entities({
+        "Car": {
+            "type": "simple",
+            "version": 1,
+            "properties": {
+                "index": {"type": "int", "key": True},
+                "prices": {"type": "List[decimal.Decimal]", "optional": True},
+                "owner": {"type": "Money"},
+            }
+        }
+    }, {"Money": Money, "decimal": decimal}, cache=None)["Car"]
+    assert Car.__dataclass_fields__["prices"].type == Optional[List[decimal.Decimal]]
+    assert Car.__dataclass_fields__["owner"].type is Money
@@ -0,0 +1,72 @@
+import asyncio
+import json
+from pathlib import Path
+from typing import Dict
+
+import pytest
+
+from data_snack_dynamic_entity.aio import aload_entities, aload_entities_from_paths
+from data_snack_dynamic_entity.factory import load_entities
+from data_snack_dynamic_entity.validate import ValidationError
+
+
+def _with_many_cars(entity_templates: Dict, cars: int) -> Dict:
+    return {**{f"Car{n}": entity_templates["Car"] for n in range(cars)}, **entity_templates}
+
+
+def test__aload_entities(entity_templates: Dict) -> None:
+    entities = asyncio.run(aload_entities(entity_templates, cache=None))
+    expected = load_entities(entity_templates, cache=None)
+
+    assert list(entities) == list(expected)
+    assert entities["Registration"].Meta.sources[0].entity is entities["Car"]
+    assert entities["Person"].get_keys() == expected["Person"].get_keys()
+
+
+def test__aload_entities__invalid_templates(entity_templates: Dict) -> None:
+    entity_templates["Person"] = {"type": "simple"}
+    with pytest.raises(ValidationError) as e:
+        asyncio.run(aload_entities(entity_templates, cache=None))
+    assert list(e.value.args[0]) == ["Person"]
+
+
+def test__aload_entities__other_tasks_keep_running(entity_templates: Dict) -> None:
+    async def run() -> int:
+        ticks = 0
+
+        async def tick() -> None:
+            nonlocal ticks
+            while True:
+                ticks += 1
+                await asyncio.sleep(0)
+
+        ticker = asyncio.create_task(tick())
+        await asyncio.sleep(0)
+        ticks = 0
+        await aload_entities(_with_many_cars(entity_templates, 20), cache=None, time_slice=0)
+        ticker.cancel()
+        return ticks
+
+    assert asyncio.run(run()) >= 20
+
+
+def test__aload_entities__cancelled(entity_templates: Dict) -> None:
+    async def run() -> None:
+        templates = _with_many_cars(entity_templates, 100)
+        task = asyncio.create_task(aload_entities(templates, cache=None, time_slice=0))
+        for _ in range(10):
+            await asyncio.sleep(0)
+        task.cancel()
+        await task
+
+    with pytest.raises(asyncio.CancelledError):
+        asyncio.run(run())
+
+
+def test__aload_entities_from_paths(tmp_path: Path, entity_templates: Dict) -> None:
+    registration = entity_templates.pop("Registration")
+    (tmp_path / "simple.json").write_text(json.dumps(entity_templates))
+    (tmp_path / "registration.json").write_text(json.dumps({"Registration": registration}))
+
+    entities = asyncio.run(aload_entities_from_paths(tmp_path, cache=None))
+    assert set(entities) == {"Car", "Person", "Registration"}
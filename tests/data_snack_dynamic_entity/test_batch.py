@@ -0,0 +1,103 @@
+from typing import Type
+
+import numpy as np
+import pytest
+
+from data_snack_dynamic_entity.batch import ColumnSpec, batch_type
+from data_snack_dynamic_entity.factory import load_entities
+
+
+@pytest.fixture
+def Car() -> Type:
+    return load_entities({
+        "Car": {
+            "type": "simple",
+            "version": 1,
+            "properties": {
+                "index": {"type": "int", "key": True},
+                "brand": {"type": "str"},
+                "weight": {"type": "float", "optional": True},
+                "cost": {"type": "numpy.float16"},
+                "tags": {"type": "list", "optional": True},
+            }
+        }
+    }, {"numpy.float16": np.float16}, cache=None)["Car"]
+
+
+@pytest.fixture
+def records() -> list:
+    return [
+        (1, "BMW", 1500.5, np.float16(1.5), ["new"]),
+        (2, "Audi", None, np.float16(2.5), None),
+        (3, "Fiat", 900.0, np.float16(3.5), []),
+    ]
+
+
+def test__batch_type(Car: Type) -> None:
+    CarBatch = batch_type(Car)
+
+    assert batch_type(Car) is CarBatch
+    assert CarBatch.entity_type is Car
+    assert CarBatch.columns_spec == {
+        "index": ColumnSpec(np.dtype(np.int64), False),
+        "brand": ColumnSpec(np.dtype(object), False),
+        "weight": ColumnSpec(np.dtype(np.float64), True),
+        "cost": ColumnSpec(np.dtype(np.float16), False),
+        "tags": ColumnSpec(np.dtype(object), True),
+    }
+
+
+def test__batch__from_records(Car: Type, records: list) -> None:
+    batch = batch_type(Car).from_records(records)
+
+    assert len(batch) == 3
+    assert batch.columns["index"].tolist() == [1, 2, 3]
+    assert batch.masks["weight"].tolist() == [True, False, True]
+    assert batch.column("weight").sum() == 2400.5
+    assert batch.columns["tags"][0] == ["new"]
+    assert batch.to_entities() == [Car(*record) for record in records]
+
+
+def test__batch__from_dict_records(Car: Type, records: list) -> None:
+    fields = list(batch_type(Car).columns_spec)
+    batch = batch_type(Car).from_records([dict(zip(fields, record)) for record in records])
+
+    assert batch.to_entities() == [Car(*record) for record in records]
+
+
+def test__batch__from_entities(Car: Type, records: list) -> None:
+    cars = [Car(*record) for record in records]
+    assert batch_type(Car).from_entities(cars).to_entities() == cars
+
+
+def test__batch__rows(Car: Type, records: list) -> None:
+    batch = batch_type(Car).from_records(records)
+    row = batch[1]
+
+    assert (row.index, row.brand, row.weight, row.tags) == (2, "Audi", None, None)
+    assert isinstance(row.index, int)
+    assert row == Car(*records[1])
+    assert row.get_keys() == ["index"]
+    assert batch[-1].brand == "Fiat"
+    assert [r.index for r in batch] == [1, 2, 3]
+    with pytest.raises(IndexError):
+        batch[3]
+
+
+def test__batch__select(Car: Type, records: list) -> None:
+    batch = batch_type(Car).from_records(records)
+    selected = batch[batch.columns["index"] > 1]
+
+    assert selected.to_entities() == [Car(*record) for record in records[1:]]
+    assert batch[:1].to_entities() == [Car(*records[0])]
+
+
+def test__batch__empty(Car: Type) -> None:
+    batch = batch_type(Car).from_records([])
+    assert len(batch) == 0
+    assert batch.to_entities() == []
+
+
+def test__batch__different_lengths(Car: Type) -> None:
+    with pytest.raises(ValueError):
+        batch_type(Car)({"index": [1, 2], "brand": ["BMW"], "weight": [1.0], "cost": [1.0], "tags": [None]})
@@ -0,0 +1,162 @@
+import decimal
+from dataclasses import fields
+from threading import Barrier, Thread
+from typing import Dict, List, Type
+
+import numpy as np
+import pytest
+
+from data_snack_dynamic_entity.cache import EntityCache, fingerprint
+from data_snack_dynamic_entity.factory import load_entities
+
+
+@pytest.fixture
+def cache() -> EntityCache:
+    return EntityCache()
+
+
+def test__fingerprint__depends_on_ordering() -> None:
+    assert fingerprint({"a": 1, "b": {"c": 2, "d": 3}}) == fingerprint({"a": 1, "b": {"c": 2, "d": 3}})
+    assert fingerprint({"a": 1, "b": {"c": 2, "d": 3}}) != fingerprint({"a": 1, "b": {"d": 3, "c": 2}})
+    assert fingerprint({"a": 1}) != fingerprint({"a": 2})
+
+
+def test__load_entities__reordered_properties(cache: EntityCache, entity_templates: Dict) -> None:
+    """Testing if reordered properties aren't resolved to the class with the previous field order."""
+    entities = load_entities(entity_templates, cache=cache)
+    properties = entity_templates["Car"]["properties"]
+    entity_templates["Car"]["properties"] = dict(reversed(properties.items()))
+    reloaded_entities = load_entities(entity_templates, cache=cache)
+
+    assert [f.name for f in fields(entities["Car"])] == ["index", "brand"]
+    assert [f.name for f in fields(reloaded_entities["Car"])] == ["brand", "index"]
+
+
+def test__load_entities__reuses_cached_types(cache: EntityCache, entity_templates: Dict) -> None:
+    """Testing if unchanged templates are resolved to the same class objects."""
+    entities = load_entities(entity_templates, cache=cache)
+    reloaded_entities = load_entities(entity_templates, cache=cache)
+
+    assert entities["Car"] is reloaded_entities["Car"]
+    assert entities["Registration"] is reloaded_entities["Registration"]
+    assert len(cache) == 3
+    assert cache.hits == 3
+
+
+def test__load_entities__rebuilds_changed_types(cache: EntityCache, entity_templates: Dict) -> None:
+    """Testing if a changed source entity invalidates the compound entity built on top of it."""
+    entities = load_entities(entity_templates, cache=cache)
+    entity_templates["Car"]["version"] = 2
+    reloaded_entities = load_entities(entity_templates, cache=cache)
+
+    assert entities["Car"] is not reloaded_entities["Car"]
+    assert entities["Registration"] is not reloaded_entities["Registration"]
+    assert reloaded_entities["Registration"].Meta.sources[0].entity is reloaded_entities["Car"]
+
+
+def test__load_entities__types_mapping_is_part_of_key(cache: EntityCache) -> None:
+    templates = {
+        "Car": {
+            "type": "simple",
+            "version": 1,
+            "properties": {
+                "index": {"type": "int", "key": True},
+                "value": {"type": "number"},
+            }
+        }
+    }
+    float_car = load_entities(templates, {"number": np.float16}, cache=cache)["Car"]
+    int_car = load_entities(templates, {"number": np.int8}, cache=cache)["Car"]
+    unrelated_mapping_car = load_entities(templates, {"number": np.float16, "other": np.int8}, cache=cache)["Car"]
+
+    assert float_car is not int_car
+    assert float_car is unrelated_mapping_car
+
+
+def test__load_entities__parametrized_types_mapping_is_part_of_key(cache: EntityCache) -> None:
+    templates = {
+        "Car": {
+            "type": "simple",
+            "version": 1,
+            "properties": {
+                "index": {"type": "int", "key": True},
+                "values": {"type": "List[number]"},
+            }
+        }
+    }
+    float_car = load_entities(templates, {"number": np.float16}, cache=cache)["Car"]
+    int_car = load_entities(templates, {"number": np.int8}, cache=cache)["Car"]
+
+    assert float_car is not int_car
+
+
+def test__load_entities__mapped_module_is_part_of_key(cache: EntityCache) -> None:
+    """Testing if a type resolved in a mapped module isn't reused by a load which doesn't map the module."""
+    templates = {
+        "Car": {
+            "type": "simple",
+            "version": 1,
+            "properties": {"index": {"type": "int", "key": True}, "price": {"type": "decimal.Decimal"}},
+        }
+    }
+    load_entities(templates, {"decimal": decimal}, cache=cache)
+    with pytest.raises(ValueError):
+        load_entities(templates, cache=cache)
+
+
+def test__load_entities__without_cache(entity_templates: Dict) -> None:
+    entities = load_entities(entity_templates, cache=None)
+    reloaded_entities = load_entities(entity_templates, cache=None)
+
+    assert entities["Car"] is not reloaded_entities["Car"]
+
+
+def test__entity_cache__unbounded_by_default(cache: EntityCache) -> None:
+    """Testing if classes of a big config aren't evicted before they're reused on the next reload."""
+    for n in range(10_000):
+        cache.put(str(n), int)
+
+    assert cache.maxsize is None
+    assert len(cache) == 10_000
+    assert cache.get("0") is int
+
+
+def test__entity_cache__concurrent_get_or_create(cache: EntityCache) -> None:
+    """Testing if threads missing the same key at once get the same type."""
+    barrier = Barrier(8)
+    results: List[Type] = []
+
+    def create() -> Type:
+        barrier.wait()  # all threads miss the key before any of them stores its type
+        return type("Car", (), {})
+
+    threads = [Thread(target=lambda: results.append(cache.get_or_create("Car", create))) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(results) == 8
+    assert all(result is results[0] for result in results)
+
+
+def test__entity_cache__lru_eviction() -> None:
+    cache = EntityCache(maxsize=2)
+    cache.put("a", int)
+    cache.put("b", str)
+    assert cache.get("a") is int  # "b" becomes the least recently used one
+    cache.put("c", float)
+
+    assert "a" in cache
+    assert "b" not in cache
+    assert "c" in cache
+
+
+def test__entity_cache__clear(cache: EntityCache) -> None:
+    cache.put("a", int)
+    cache.get("a")
+    cache.clear()
+
+    assert len(cache) == 0
+    assert cache.get("a") is None
+    assert cache.hits == 0
@@ -0,0 +1,118 @@
+import dataclasses
+import time
+from decimal import Decimal
+from pathlib import Path
+from typing import Dict, get_type_hints
+
+import numpy as np
+import pytest
+from data_snack.entities import Entity
+from data_snack.entities.compound import CompoundEntity
+
+from data_snack_dynamic_entity.codegen import generate_module_source, load_module_entities, write_module
+from data_snack_dynamic_entity.factory import load_entities
+
+
+@pytest.fixture
+def entity_templates(entity_templates: Dict) -> Dict:
+    car, person, registration = entity_templates["Car"], entity_templates["Person"], entity_templates["Registration"]
+    car["version"] = 2
+    car["properties"].update({
+        "excluded": {"type": "int", "excluded": True},
+        "brand": {"type": "str", "optional": True},
+        "cost": {"type": "float", "default": 10.5},
+        "weight": {"type": "numpy.float16"},
+    })
+    person["slots"] = True
+    person["properties"]["name"]["default"] = "unknown"
+    registration["sources"][0]["fields"].append({"field": "cost", "source_field": "cost"})
+    registration["sources"][1]["optional"] = True
+    return {"Registration": registration, "Car": car, "Person": person}  # compound entity defined before its sources
+
+
+@pytest.fixture
+def types_mapping() -> Dict:
+    return {"numpy.float16": np.float16}
+
+
+def test__write_module__defines_same_entities(
+        entity_templates: Dict, types_mapping: Dict, tmp_path: Path
+) -> None:
+    """Testing if generated module defines entities equivalent to the ones created by `load_entities`."""
+    path = write_module(entity_templates, tmp_path / "entities.py", types_mapping)
+    entities = load_module_entities(path)
+    expected_entities = load_entities(entity_templates, types_mapping, cache=None)
+
+    assert list(entities) == list(expected_entities)
+    for entity_name, entity_type in entities.items():
+        expected_type = expected_entities[entity_name]
+        assert get_type_hints(entity_type) == get_type_hints(expected_type)
+        assert [(f.name, f.default) for f in dataclasses.fields(entity_type)] == [
+            (f.name, f.default) for f in dataclasses.fields(expected_type)
+        ]
+        assert entity_type.get_keys() == expected_type.get_keys()
+        assert entity_type.get_excluded_fields() == expected_type.get_excluded_fields()
+
+    Car, Person, Registration = entities["Car"], entities["Person"], entities["Registration"]
+    assert issubclass(Car, Entity)
+    assert Car.Meta.version == 2
+    assert Car(index=1, excluded=0, brand=None, weight=np.float16(1)).cost == 10.5
+    assert "__slots__" in vars(Person)
+    assert Person(index=1).name == "unknown"
+    assert Person(index=1) == Person(1, "unknown") != Person(index=2)
+    assert repr(Person(index=1)) == repr(expected_entities["Person"](index=1))
+    assert dataclasses.replace(Person(index=1), name="John").name == "John"
+    assert issubclass(Registration, CompoundEntity)
+    assert Registration.Meta.sources[0].entity is Car
+    assert Registration.Meta.sources[0].fields_mapping == {"car_index": "index", "brand": "brand", "cost": "cost"}
+    assert Registration.Meta.sources[1].entity is Person
+    assert Registration.Meta.sources[1].optional is True
+    assert Registration.from_sources(Car(index=1, excluded=0, brand="BMW", weight=None), None).brand == "BMW"
+
+
+def test__write_module__compile(entity_templates: Dict, types_mapping: Dict, tmp_path: Path) -> None:
+    path = write_module(entity_templates, tmp_path / "entities.py", types_mapping, compile=True)
+
+    assert path == tmp_path / "entities.py"
+    assert list((tmp_path / "__pycache__").glob("entities.*.pyc"))
+
+
+def test__load_module_entities__faster_than_load_entities(tmp_path: Path) -> None:
+    """Testing if importing a compiled module skips the dataclass processing done by `load_entities`."""
+    templates = {
+        f"Car{n}": {
+            "type": "simple",
+            "version": 1,
+            "properties": {
+                "index": {"type": "int", "key": True},
+                **{f"field{i}": {"type": "float", "default": 0.0} for i in range(20)},
+            }
+        }
+        for n in range(100)
+    }
+    path = write_module(templates, tmp_path / "entities.py", compile=True)
+
+    start = time.perf_counter()
+    load_module_entities(path)
+    import_seconds = time.perf_counter() - start
+    start = time.perf_counter()
+    load_entities(templates, validate=False, cache=None)
+    load_seconds = time.perf_counter() - start
+
+    assert import_seconds < load_seconds
+
+
+def test__generate_module_source__not_importable_type() -> None:
+    class Local:
+        ...
+
+    templates = {
+        "Car": {
+            "type": "simple",
+            "version": 1,
+            "properties": {"index": {"type": "int", "key": True}, "value": {"type": "local"}}
+        }
+    }
+    with pytest.raises(ValueError):
+        generate_module_source(templates, {"local": Local})
+    assert "decimal.Decimal" in generate_module_source(templates, {"local": Decimal})
@@ -0,0 +1,157 @@
+import copy
+from typing import Callable, Dict, List, Tuple
+
+import pytest
+
+from data_snack_dynamic_entity.diff import ChangeKind, TemplateChange, diff_templates
+
+
+@pytest.fixture
+def entity_templates(entity_templates: Dict) -> Dict:
+    entity_templates["Car"]["properties"]["color"] = {"type": "str", "optional": True, "default": "black"}
+    return entity_templates
+
+
+def _set(path: Tuple, value) -> Callable[[Dict], None]:
+    def change(templates: Dict) -> None:
+        target = templates
+        for name in path[:-1]:
+            target = target[name]
+        target[path[-1]] = value
+    return change
+
+
+def _delete(path: Tuple) -> Callable[[Dict], None]:
+    def change(templates: Dict) -> None:
+        target = templates
+        for name in path[:-1]:
+            target = target[name]
+        del target[path[-1]]
+    return change
+
+
+@pytest.mark.parametrize("change, expected", [
+    (
+        _set(("Car", "properties", "year"), {"type": "int", "default": 0}),
+        [TemplateChange("Car", ChangeKind.FIELD_ADDED_WITH_DEFAULT, "year")],
+    ),
+    (
+        _set(("Car", "properties", "year"), {"type": "int"}),
+        [TemplateChange("Car", ChangeKind.FIELD_ADDED, "year", compatible=False)],
+    ),
+    (
+        _delete(("Car", "properties", "brand")),
+        [TemplateChange("Car", ChangeKind.FIELD_REMOVED, "brand", compatible=False)],
+    ),
+    (
+        _set(("Car", "properties", "brand", "type"), "int"),
+        [TemplateChange("Car", ChangeKind.TYPE_CHANGE, "brand", compatible=False, description="str -> int")],
+    ),
+    (
+        _set(("Car", "properties", "brand", "key"), True),
+        [TemplateChange(
+            "Car", ChangeKind.KEY_CHANGE, compatible=False, description="['index'] -> ['index', 'brand']"
+        )],
+    ),
+    (
+        _set(("Car", "properties", "brand", "excluded"), True),
+        [TemplateChange(
+            "Car", ChangeKind.EXCLUDED_TOGGLE, "brand", compatible=False,
+            description="shifts positions of values stored by `TupleSerializer`",
+        )],
+    ),
+    (
+        _set(("Car", "properties", "brand", "optional"), True),
+        [TemplateChange("Car", ChangeKind.OPTIONAL_TOGGLE, "brand")],
+    ),
+    (
+        _set(("Car", "properties", "color", "default"), "white"),
+        [TemplateChange("Car", ChangeKind.DEFAULT_CHANGE, "color")],
+    ),
+    (
+        _set(("Car", "version"), 2),
+        [TemplateChange("Car", ChangeKind.VERSION_CHANGE, description="1 -> 2")],
+    ),
+    (
+        _set(("Registration", "sources", 0, "fields", 0, "field"), "index"),
+        [TemplateChange("Registration", ChangeKind.COMPOUND_SOURCE_REMAP)],
+    ),
+    (
+        _set(("Registration", "fields_order"), ["car_index"]),
+        [TemplateChange("Registration", ChangeKind.FIELD_ORDER_CHANGE)],
+    ),
+])
+def test__diff_templates(entity_templates: Dict, change: Callable, expected: List[TemplateChange]) -> None:
+    new_templates = copy.deepcopy(entity_templates)
+    change(new_templates)
+    assert diff_templates(entity_templates, new_templates).changes == expected
+
+
+def test__diff_templates__field_with_default_inserted_before_existing_default(entity_templates: Dict) -> None:
+    new_templates = copy.deepcopy(entity_templates)
+    properties = new_templates["Car"]["properties"]
+    new_templates["Car"]["properties"] = {
+        "index": properties["index"],
+        "brand": properties["brand"],
+        "year": {"type": "int", "default": 0},
+        "color": properties["color"],
+    }
+    diff = diff_templates(entity_templates, new_templates)
+
+    assert diff.changes == [TemplateChange(
+        "Car", ChangeKind.FIELD_ADDED_WITH_DEFAULT, "year", compatible=False,
+        description="shifts positions of stored values",
+    )]
+    assert diff.version_bump_required == ["Car"]
+
+
+def test__diff_templates__added_default_moves_field(entity_templates: Dict) -> None:
+    entity_templates["Car"]["properties"]["model"] = {"type": "str"}
+    new_templates = copy.deepcopy(entity_templates)
+    new_templates["Car"]["properties"]["brand"]["default"] = "unknown"
+    diff = diff_templates(entity_templates, new_templates)
+
+    assert [change.kind for change in diff.changes] == [ChangeKind.FIELD_ORDER_CHANGE, ChangeKind.DEFAULT_CHANGE]
+    assert diff.incompatible_entities == ["Car"]
+
+
+def test__diff_templates__reordered_properties(entity_templates: Dict) -> None:
+    new_templates = copy.deepcopy(entity_templates)
+    new_templates["Car"]["properties"] = {
+        name: new_templates["Car"]["properties"][name] for name in ["brand", "index", "color"]
+    }
+    diff = diff_templates(entity_templates, new_templates)
+
+    assert diff.changes == [TemplateChange(
+        "Car", ChangeKind.FIELD_ORDER_CHANGE, compatible=False,
+        description="['index', 'brand', 'color'] -> ['brand', 'index', 'color']",
+    )]
+
+
+def test__diff_templates__entities(entity_templates: Dict) -> None:
+    new_templates = copy.deepcopy(entity_templates)
+    del new_templates["Registration"]
+    new_templates["Truck"] = {"type": "simple", "version": 1, "properties": {"index": {"type": "int", "key": True}}}
+
+    assert diff_templates(entity_templates, new_templates).changes == [
+        TemplateChange("Registration", ChangeKind.ENTITY_REMOVED),
+        TemplateChange("Truck", ChangeKind.ENTITY_ADDED),
+    ]
+
+
+def test__diff_templates__version_bumps(entity_templates: Dict) -> None:
+    new_templates = copy.deepcopy(entity_templates)
+    new_templates["Car"]["properties"]["brand"]["type"] = "int"
+    new_templates["Truck"] = {**copy.deepcopy(entity_templates["Car"]), "version": 1}
+    old_templates = {**entity_templates, "Truck": copy.deepcopy(entity_templates["Car"])}
+    new_templates["Truck"]["version"] = 2
+    new_templates["Truck"]["properties"]["brand"]["optional"] = True
+    diff = diff_templates(old_templates, new_templates)
+
+    assert diff.changed_entities == ["Car", "Truck"]
+    assert diff.version_bump_required == ["Car"]
+    assert diff.unnecessary_version_bumps == ["Truck"]
+
+
+def test__diff_templates__no_changes(entity_templates: Dict) -> None:
+    assert diff_templates(entity_templates, copy.deepcopy(entity_templates)).changes == []
@@ -0,0 +1,97 @@
+from pathlib import Path
+from dataclasses import fields
+from typing import Dict, get_type_hints
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from data_snack_dynamic_entity.disk_cache import DiskCache, load_entities_with_disk_cache
+from data_snack_dynamic_entity.factory import load_entities
+
+
+@pytest.fixture
+def disk_cache(tmp_path: Path) -> DiskCache:
+    return DiskCache(tmp_path / "plans")
+
+
+@pytest.fixture
+def entity_templates(entity_templates: Dict) -> Dict:
+    entity_templates["Car"]["properties"]["brand"].update({"optional": True, "default": "unknown"})
+    person_source = entity_templates["Registration"]["sources"][1]
+    person_source["fields"].append({"field": "name", "source_field": "name"})
+    person_source["optional"] = True
+    return {"Registration": entity_templates.pop("Registration"), **entity_templates}  # compound entity first
+
+
+def test__load_entities_with_disk_cache__stores_plan(disk_cache: DiskCache, entity_templates: Dict) -> None:
+    entities = load_entities_with_disk_cache(entity_templates, disk_cache, cache=None)
+    plan = disk_cache.load(disk_cache.key(entity_templates))
+
+    assert plan["order"] == ["Car", "Person", "Registration"]
+    assert plan["simple_entities"]["Car"]["keys"] == ["index"]
+    assert plan["simple_entities"]["Car"]["fields_with_defaults"] == [
+        {"name": "brand", "type": "str", "optional": True, "default": "unknown"}
+    ]
+    assert [f["name"] for f in plan["compound_entities"]["Registration"]["fields"]] == [
+        "car_index", "person_index", "name"
+    ]
+    assert list(entities) == list(load_entities(entity_templates, cache=None))
+
+
+@patch("data_snack_dynamic_entity.disk_cache.validate_entity_templates")
+def test__load_entities_with_disk_cache__uses_stored_plan(
+        validate_mock: MagicMock, disk_cache: DiskCache, entity_templates: Dict
+) -> None:
+    """Testing if validation and normalization are skipped when the plan is already stored."""
+    load_entities_with_disk_cache(entity_templates, disk_cache, cache=None)
+    with patch("data_snack_dynamic_entity.disk_cache.SimpleEntityFactory.build_spec") as build_spec_mock:
+        entities = load_entities_with_disk_cache(entity_templates, disk_cache, cache=None)
+
+    validate_mock.assert_called_once()
+    build_spec_mock.assert_not_called()
+    expected_entities = load_entities(entity_templates, cache=None)
+    assert list(entities) == list(expected_entities)
+    for entity_name, entity_type in entities.items():
+        assert get_type_hints(entity_type) == get_type_hints(expected_entities[entity_name])
+    assert entities["Registration"].Meta.sources[0].entity is entities["Car"]
+    assert entities["Car"](index=1).brand == "unknown"
+
+
+def test__load_entities_with_disk_cache__invalidates_changed_templates(
+        disk_cache: DiskCache, entity_templates: Dict
+) -> None:
+    load_entities_with_disk_cache(entity_templates, disk_cache, cache=None)
+    entity_templates["Car"]["properties"]["weight"] = {"type": "float"}
+    entities = load_entities_with_disk_cache(entity_templates, disk_cache, cache=None)
+
+    assert "weight" in get_type_hints(entities["Car"])
+    assert len(list(disk_cache.directory.glob("*.json"))) == 2
+
+
+def test__load_entities_with_disk_cache__reordered_properties(disk_cache: DiskCache, entity_templates: Dict) -> None:
+    """Testing if a plan with the previous field order isn't used after properties were reordered."""
+    load_entities_with_disk_cache(entity_templates, disk_cache, cache=None)
+    properties = entity_templates["Person"]["properties"]
+    entity_templates["Person"]["properties"] = dict(reversed(properties.items()))
+    entities = load_entities_with_disk_cache(entity_templates, disk_cache, cache=None)
+
+    assert [f.name for f in fields(entities["Person"])] == ["name", "index"]
+    assert len(list(disk_cache.directory.glob("*.json"))) == 2
+
+
+def test__disk_cache__key_depends_on_package_version(disk_cache: DiskCache, entity_templates: Dict) -> None:
+    key = disk_cache.key(entity_templates)
+    with patch("data_snack_dynamic_entity.disk_cache._package_version", return_value="0.0.0"):
+        assert disk_cache.key(entity_templates) != key
+
+
+def test__disk_cache__unreadable_plan(disk_cache: DiskCache, entity_templates: Dict) -> None:
+    key = disk_cache.key(entity_templates)
+    disk_cache.directory.mkdir()
+    (disk_cache.directory / f"{key}.json").write_text("{")
+
+    assert disk_cache.load(key) is None
+    assert load_entities_with_disk_cache(entity_templates, disk_cache, cache=None)
+    assert disk_cache.load(key) is not None
+    disk_cache.clear()
+    assert disk_cache.load(key) is None
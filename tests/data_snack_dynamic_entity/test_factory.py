@@ -4,7 +4,7 @@ from unittest.mock import patch, MagicMock
 import pytest
 
 from data_snack_dynamic_entity.compound_entity.types import CompoundEntityTemplates
-from data_snack_dynamic_entity.factory import load_entities
+from data_snack_dynamic_entity.factory import EntityBuilder, load_entities
 from data_snack_dynamic_entity.simple_entity.types import SimpleEntityTemplates
 from data_snack_dynamic_entity.types import EntityTemplates
 
@@ -135,5 +135,19 @@ def test__compound_load_entities__executing_load_entities(
 
     load_entities(entity_templates)
 
-    simple_load_entities_mock.assert_called_with(simple_entity_templates)
-    compound_load_entities_mock.assert_called_with(compound_entity_templates, source_entities_mock)
+    simple_load_entities_mock.assert_called_with(simple_entity_templates, validate=False)
+    compound_load_entities_mock.assert_called_with(
+        compound_entity_templates, source_entities_mock, validate=False
+    )
+
+
+def test__entity_builder__rebuild(entity_templates: EntityTemplates) -> None:
+    entities = load_entities(entity_templates, cache=None)
+    entity_templates["Car"]["version"] = 2
+
+    rebuilt = EntityBuilder(cache=None).rebuild(entity_templates, ["Car", "Registration"], entities)
+
+    assert list(rebuilt) == ["Person", "Car", "Registration"]
+    assert rebuilt["Person"] is entities["Person"]
+    assert rebuilt["Car"] is not entities["Car"]
+    assert rebuilt["Registration"].Meta.sources[0].entity is rebuilt["Car"]
@@ -0,0 +1,87 @@
+from typing import Dict
+
+import pytest
+
+from data_snack_dynamic_entity.compound_entity.exceptions import CyclicSourceEntityException
+from data_snack_dynamic_entity.factory import load_entities
+from data_snack_dynamic_entity.graph import EntityGraph
+from data_snack_dynamic_entity.lazy import load_entities_lazy
+
+
+def _compound(*sources: str) -> Dict:
+    return {
+        "type": "compound",
+        "sources": [
+            {"entity": source, "fields": [{"field": f"{source.lower()}_index", "source_field": "index"}]}
+            for source in sources
+        ]
+    }
+
+
+@pytest.fixture
+def entity_templates(entity_templates: Dict) -> Dict:
+    registration_source = entity_templates["Registration"]["sources"][0]
+    registration_source["fields"][0]["field"] = "index"
+    entity_templates["Registration"]["sources"] = [registration_source]
+    return {"Ownership": _compound("Registration", "Person"), **entity_templates}
+
+
+def test__entity_graph__from_templates(entity_templates: Dict) -> None:
+    graph = EntityGraph.from_templates(entity_templates)
+
+    assert graph.dependencies == {
+        "Ownership": ["Registration", "Person"],
+        "Car": [],
+        "Person": [],
+        "Registration": ["Car"],
+    }
+    assert graph.dependents == {
+        "Ownership": [],
+        "Car": ["Registration"],
+        "Person": ["Ownership"],
+        "Registration": ["Ownership"],
+    }
+
+
+def test__entity_graph__topological_order(entity_templates: Dict) -> None:
+    graph = EntityGraph.from_templates(entity_templates)
+
+    assert graph.topological_order() == ["Car", "Person", "Registration", "Ownership"]
+    assert graph.topological_order(["Ownership", "Registration"]) == ["Registration", "Ownership"]
+
+
+def test__entity_graph__upstream_and_downstream(entity_templates: Dict) -> None:
+    graph = EntityGraph.from_templates(entity_templates)
+
+    assert graph.upstream(["Registration"]) == {"Registration", "Car"}
+    assert graph.downstream(["Car"]) == {"Car", "Registration", "Ownership"}
+
+
+def test__entity_graph__cycle() -> None:
+    graph = EntityGraph.from_templates({"A": _compound("B"), "B": _compound("C"), "C": _compound("B")})
+
+    with pytest.raises(CyclicSourceEntityException, match="B -> C -> B"):
+        graph.topological_order()
+
+
+def test__load_entities__compound_entity_sources(entity_templates: Dict) -> None:
+    """Testing if compound entities can use other compound entities as their sources."""
+    entities = load_entities(entity_templates, cache=None)
+
+    assert list(entities) == ["Car", "Person", "Ownership", "Registration"]
+    assert entities["Ownership"].Meta.sources[0].entity is entities["Registration"]
+    assert entities["Registration"].Meta.sources[0].entity is entities["Car"]
+
+
+def test__load_entities__cyclic_compound_entity_sources(entity_templates: Dict) -> None:
+    entity_templates["Registration"] = _compound("Ownership")
+
+    with pytest.raises(CyclicSourceEntityException):
+        load_entities(entity_templates, cache=None)
+
+
+def test__load_entities_lazy__compound_entity_sources(entity_templates: Dict) -> None:
+    entities = load_entities_lazy(entity_templates, cache=None)
+
+    assert entities["Ownership"].Meta.sources[0].entity is entities["Registration"]
+    assert entities.loaded == ["Car", "Person", "Registration", "Ownership"]
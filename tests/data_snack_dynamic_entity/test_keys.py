@@ -0,0 +1,63 @@
+from typing import Type
+
+import numpy as np
+import pytest
+from data_snack.key_factories import ClusterKey, HashKey, Key, NonClusterKey
+
+from data_snack_dynamic_entity.factory import load_entities
+from data_snack_dynamic_entity.keys import key_builder
+
+
+class ReversedKey(Key):
+    def get_pattern(self, pattern: str) -> str:
+        return f"{pattern}-{self.entity_type.__name__}"
+
+
+@pytest.fixture
+def Car() -> Type:
+    return load_entities({
+        "Car": {
+            "type": "simple",
+            "version": 3,
+            "properties": {
+                "index": {"type": "int", "key": True},
+                "brand": {"type": "str"},
+                "market": {"type": "str", "key": True},
+            }
+        }
+    }, cache=None)["Car"]
+
+
+@pytest.fixture
+def rows() -> list:
+    return [(1, "pl"), (2, "de"), (30, "{x}")]
+
+
+@pytest.mark.parametrize("key_factory", [NonClusterKey, ClusterKey, HashKey, ReversedKey])
+def test__key_builder__from_rows(Car: Type, rows: list, key_factory: Type[Key]) -> None:
+    expected = [key_factory(Car, list(row)).keystring for row in rows]
+    assert key_builder(Car, key_factory).from_rows(rows) == expected
+
+
+@pytest.mark.parametrize("key_factory", [NonClusterKey, ClusterKey, HashKey])
+def test__key_builder__from_columns_numpy(Car: Type, rows: list, key_factory: Type[Key]) -> None:
+    columns = {"index": np.array([row[0] for row in rows]), "market": np.array([row[1] for row in rows])}
+    expected = [key_factory(Car, list(row)).keystring for row in rows]
+
+    assert key_builder(Car, key_factory).from_columns(columns, use_numpy=True).tolist() == expected
+    assert key_builder(Car, key_factory).from_columns(columns) == expected
+
+
+def test__key_builder__from_entities(Car: Type, rows: list) -> None:
+    cars = [Car(index=index, brand="BMW", market=market) for index, market in rows]
+    assert key_builder(Car).from_entities(cars) == ["Car-3-1_pl", "Car-3-2_de", "Car-3-30_{x}"]
+
+
+def test__key_builder__cached(Car: Type) -> None:
+    assert key_builder(Car) is key_builder(Car)
+    assert key_builder(Car, ClusterKey) is not key_builder(Car)
+
+
+def test__key_builder__empty(Car: Type) -> None:
+    assert key_builder(Car).from_rows([]) == []
+    assert key_builder(Car).from_columns([[], []], use_numpy=True).tolist() == []
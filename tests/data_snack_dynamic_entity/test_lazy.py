@@ -0,0 +1,68 @@
+from typing import Dict
+
+import pytest
+
+from data_snack_dynamic_entity.compound_entity.exceptions import NonExistingSourceEntityException
+from data_snack_dynamic_entity.lazy import load_entities_lazy
+from data_snack_dynamic_entity.validate import ValidationError
+
+
+@pytest.fixture
+def entity_templates(entity_templates: Dict) -> Dict:
+    del entity_templates["Registration"]["sources"][1]  # `Registration` doesn't depend on `Person`
+    return entity_templates
+
+
+def test__load_entities_lazy__creates_entities_on_lookup(entity_templates: Dict) -> None:
+    entities = load_entities_lazy(entity_templates, cache=None)
+
+    assert entities.loaded == []
+    assert len(entities) == 3
+    assert "Person" in entities
+    assert entities.loaded == []
+
+    Registration = entities["Registration"]
+    assert entities.loaded == ["Car", "Registration"]
+    assert Registration.Meta.sources[0].entity is entities["Car"]
+    assert entities["Registration"] is Registration
+
+
+def test__load_entities_lazy__load_all(entity_templates: Dict) -> None:
+    entities = load_entities_lazy(entity_templates, cache=None)
+
+    assert list(entities.load_all()) == ["Car", "Person", "Registration"]
+    assert dict(entities) == entities.load_all()
+
+
+def test__load_entities_lazy__missing_entity(entity_templates: Dict) -> None:
+    entities = load_entities_lazy(entity_templates, cache=None)
+
+    with pytest.raises(KeyError):
+        entities["Bike"]
+    assert entities.get("Bike") is None
+
+
+def test__load_entities_lazy__missing_source_entity(entity_templates: Dict) -> None:
+    entity_templates["Registration"]["sources"][0]["entity"] = "Bike"
+    entities = load_entities_lazy(entity_templates, cache=None)
+
+    assert entities["Person"]
+    with pytest.raises(NonExistingSourceEntityException):
+        entities["Registration"]
+
+
+def test__load_entities_lazy__eager_validation(entity_templates: Dict) -> None:
+    entity_templates["Person"]["version"] = "1"
+
+    with pytest.raises(ValidationError):
+        load_entities_lazy(entity_templates, cache=None)
+
+
+def test__load_entities_lazy__validation_on_demand(entity_templates: Dict) -> None:
+    entity_templates["Person"]["version"] = "1"
+    entities = load_entities_lazy(entity_templates, cache=None, validate_on_demand=True)
+
+    assert entities["Registration"]
+    with pytest.raises(ValidationError) as e:
+        entities["Person"]
+    assert list(e.value.args[0]) == ["Person"]
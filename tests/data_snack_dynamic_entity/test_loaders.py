@@ -0,0 +1,174 @@
+import io
+import json
+from pathlib import Path
+from typing import Dict, get_type_hints
+
+import pytest
+
+from data_snack_dynamic_entity.compound_entity.exceptions import (
+    CyclicSourceEntityException,
+    NonExistingSourceEntityException,
+)
+from data_snack_dynamic_entity.exceptions import DuplicateEntityException, InvalidTemplatesFileException
+from data_snack_dynamic_entity.factory import load_entities
+from data_snack_dynamic_entity.loaders import iter_json_templates, load_entities_from_paths, stream_entities
+from data_snack_dynamic_entity.validate import ValidationError
+
+
+@pytest.fixture
+def entity_templates(entity_templates: Dict) -> Dict:
+    entity_templates["Car"]["properties"]["brand"].update({"optional": True, "default": "unknown"})
+    entity_templates["Person"]["properties"]["name"]["default"] = "a \\\"quoted\\\" {name}"
+    person_source = entity_templates["Registration"]["sources"][1]
+    person_source["fields"].append({"field": "name", "source_field": "name"})
+    person_source["optional"] = True
+    return {"Registration": entity_templates.pop("Registration"), **entity_templates}  # compound entity first
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 1 << 16])
+def test__iter_json_templates(entity_templates: Dict, chunk_size: int) -> None:
+    file = io.StringIO(json.dumps(entity_templates, indent=4))
+    assert list(iter_json_templates(file, chunk_size)) == list(entity_templates.items())
+
+
+@pytest.mark.parametrize("source", ["{}", " \n{ } "])
+def test__iter_json_templates__empty(source: str) -> None:
+    assert list(iter_json_templates(io.StringIO(source))) == []
+
+
+@pytest.mark.parametrize("source", ["[]", '{"Car": {}', '{"Car" {}}', '{"Car": {}, }', '{"Car": 12', '{1: {}}'])
+def test__iter_json_templates__invalid_json(source: str) -> None:
+    with pytest.raises(json.JSONDecodeError):
+        list(iter_json_templates(io.StringIO(source), chunk_size=1))
+
+
+def test__stream_entities(tmp_path: Path, entity_templates: Dict) -> None:
+    path = tmp_path / "templates.json"
+    path.write_text(json.dumps(entity_templates))
+    streamed = list(stream_entities(path, cache=None, chunk_size=16))
+    expected = load_entities(entity_templates, cache=None)
+
+    assert [name for name, _ in streamed] == ["Car", "Person", "Registration"]
+    for name, entity_type in streamed:
+        assert get_type_hints(entity_type) == get_type_hints(expected[name])
+
+
+def test__stream_entities__compound_of_compounds(tmp_path: Path, entity_templates: Dict) -> None:
+    entity_templates = {
+        "Summary": {
+            "type": "compound",
+            "sources": [
+                {
+                    "entity": "Registration",
+                    "fields": [
+                        {"field": "car_index", "source_field": "car_index"},
+                        {"field": "person_index", "source_field": "person_index"},
+                    ]
+                }
+            ],
+        },
+        **entity_templates,
+    }
+    path = tmp_path / "templates.json"
+    path.write_text(json.dumps(entity_templates))
+    entities = dict(stream_entities(path, cache=None))
+
+    assert list(entities) == ["Car", "Person", "Registration", "Summary"]
+    assert entities["Summary"].Meta.sources[0].entity is entities["Registration"]
+
+
+def test__stream_entities__yaml(tmp_path: Path, entity_templates: Dict) -> None:
+    yaml = pytest.importorskip("yaml")
+    path = tmp_path / "templates.yaml"
+    path.write_text(yaml.safe_dump(entity_templates, sort_keys=False))
+    entities = dict(stream_entities(path, cache=None))
+
+    assert list(entities) == ["Car", "Person", "Registration"]
+    default = entity_templates["Person"]["properties"]["name"]["default"]
+    assert entities["Person"].__dataclass_fields__["name"].default == default
+
+
+def test__stream_entities__invalid_template(tmp_path: Path, entity_templates: Dict) -> None:
+    entity_templates["Person"]["version"] = "one"
+    path = tmp_path / "templates.json"
+    path.write_text(json.dumps(entity_templates))
+    streamed = stream_entities(path, cache=None)
+
+    assert next(streamed)[0] == "Car"
+    with pytest.raises(ValidationError) as e:
+        next(streamed)
+    assert list(e.value.args[0]) == ["Person"]
+
+
+def test__stream_entities__duplicate(tmp_path: Path) -> None:
+    path = tmp_path / "templates.json"
+    path.write_text(
+        '{"Car": {"type": "simple", "version": 1, "properties": {"index": {"type": "int", "key": true}}}, "Car": {}}'
+    )
+    with pytest.raises(DuplicateEntityException):
+        list(stream_entities(path, cache=None))
+
+
+def test__stream_entities__missing_source(tmp_path: Path, entity_templates: Dict) -> None:
+    del entity_templates["Person"]
+    path = tmp_path / "templates.json"
+    path.write_text(json.dumps(entity_templates))
+    with pytest.raises(NonExistingSourceEntityException):
+        list(stream_entities(path, cache=None))
+
+
+def test__stream_entities__cycle(tmp_path: Path) -> None:
+    path = tmp_path / "templates.json"
+    path.write_text(json.dumps({
+        "A": {"type": "compound", "sources": [{"entity": "B", "fields": []}]},
+        "B": {"type": "compound", "sources": [{"entity": "A", "fields": []}]},
+    }))
+    with pytest.raises(CyclicSourceEntityException):
+        list(stream_entities(path, cache=None))
+
+
+def _write_split_templates(directory: Path, entity_templates: Dict) -> None:
+    (directory / "cars").mkdir(parents=True)
+    (directory / "cars" / "car.json").write_text(json.dumps({"Car": entity_templates["Car"]}))
+    (directory / "person.json").write_text(json.dumps({"Person": entity_templates["Person"]}))
+    (directory / "registration.json").write_text(json.dumps({"Registration": entity_templates["Registration"]}))
+    (directory / "notes.txt").write_text("not a template")
+
+
+@pytest.mark.parametrize("processes", [False, True])
+def test__load_entities_from_paths(tmp_path: Path, entity_templates: Dict, processes: bool) -> None:
+    _write_split_templates(tmp_path, entity_templates)
+    entities = load_entities_from_paths(tmp_path, cache=None, max_workers=2, processes=processes)
+    expected = load_entities(entity_templates, cache=None)
+
+    assert list(entities) == ["Car", "Person", "Registration"]
+    for name, entity_type in entities.items():
+        assert get_type_hints(entity_type) == get_type_hints(expected[name])
+
+
+def test__load_entities_from_paths__duplicate(tmp_path: Path, entity_templates: Dict) -> None:
+    _write_split_templates(tmp_path, entity_templates)
+    (tmp_path / "other.json").write_text(json.dumps({"Person": entity_templates["Person"]}))
+    with pytest.raises(DuplicateEntityException):
+        load_entities_from_paths(tmp_path, cache=None)
+
+
+@pytest.mark.parametrize("processes", [False, True])
+@pytest.mark.parametrize("fast_validation", [False, True])
+def test__load_entities_from_paths__errors_of_all_files(
+        tmp_path: Path, entity_templates: Dict, processes: bool, fast_validation: bool
+) -> None:
+    _write_split_templates(tmp_path, entity_templates)
+    (tmp_path / "invalid.json").write_text(json.dumps({"Truck": {"type": "simple"}}))
+    (tmp_path / "list.json").write_text("[]")
+    with pytest.raises(ValidationError) as e:
+        load_entities_from_paths(tmp_path, cache=None, fast_validation=fast_validation, processes=processes)
+    assert set(e.value.args[0]) == {"Truck", str(tmp_path / "list.json")}
+    assert e.value.args[0]["Truck"][0].path[0] == "Truck"
+
+
+def test__load_entities_from_paths__not_a_dictionary(tmp_path: Path, entity_templates: Dict) -> None:
+    _write_split_templates(tmp_path, entity_templates)
+    (tmp_path / "list.json").write_text("[]")
+    with pytest.raises(InvalidTemplatesFileException):
+        load_entities_from_paths(tmp_path, cache=None, validate=False)
@@ -0,0 +1,57 @@
+import copy
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from data_snack_dynamic_entity.factory import load_entities
+from data_snack_dynamic_entity.parallel import load_entities_parallel
+from data_snack_dynamic_entity.validate import ValidationError
+
+
+@pytest.fixture
+def templates(entity_templates: Dict) -> Dict:
+    car = entity_templates["Car"]
+    car["properties"]["brand"]["default"] = "BMW"
+    car["properties"]["weight"] = {"type": "float", "optional": True}
+    templates = {f"Car{i}": copy.deepcopy(car) for i in range(10)}
+    templates["Registration"] = entity_templates["Registration"]
+    templates["Registration"]["sources"] = [{**templates["Registration"]["sources"][0], "entity": "Car3"}]
+    return templates
+
+
+def _describe(entities: Dict) -> Dict:
+    return {name: (t.__name__, t.__annotations__, t.get_keys()) for name, t in entities.items()}
+
+
+def test__load_entities_parallel(templates: Dict) -> None:
+    entities = load_entities_parallel(templates, cache=None, max_workers=2)
+
+    assert list(entities) == list(templates)
+    assert _describe(entities) == _describe(load_entities(templates, cache=None))
+    assert entities["Registration"].Meta.sources[0].entity is entities["Car3"]
+
+
+def test__load_entities_parallel__executor(templates: Dict) -> None:
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        entities = load_entities_parallel(templates, cache=None, executor=executor)
+    assert list(entities) == list(templates)
+
+
+@pytest.mark.parametrize("max_workers", [1, 2])
+@pytest.mark.parametrize("fast_validation", [False, True])
+def test__load_entities_parallel__validation_errors(templates: Dict, max_workers: int, fast_validation: bool) -> None:
+    templates["Car1"] = {"type": "simple", "properties": {}}
+    templates["Car7"] = {"type": "simple", "version": "1", "properties": {}}
+    with pytest.raises(ValidationError) as e:
+        load_entities_parallel(templates, cache=None, fast_validation=fast_validation, max_workers=max_workers)
+    assert sorted(e.value.args[0]) == ["Car1", "Car7"]
+
+
+@patch("data_snack_dynamic_entity.parallel.ProcessPoolExecutor")
+def test__load_entities_parallel__single_worker(executor_mock: MagicMock, templates: Dict) -> None:
+    entities = load_entities_parallel(templates, cache=None, max_workers=1)
+
+    executor_mock.assert_not_called()
+    assert _describe(entities) == _describe(load_entities(templates, cache=None))
@@ -0,0 +1,59 @@
+import json
+from typing import Dict
+
+import pytest
+
+from data_snack_dynamic_entity.factory import load_entities
+from data_snack_dynamic_entity.profiling import ProfileCollector, tracing_allocations
+
+
+@pytest.fixture
+def entity_templates(entity_templates: Dict) -> Dict:
+    entity_templates["Car"]["properties"].update({"weight": {"type": "float"}, "color": {"type": "str"}})
+    return entity_templates
+
+
+def test__profile_collector__phases_and_entities(entity_templates: Dict) -> None:
+    collector = ProfileCollector()
+    load_entities(entity_templates, cache=None, observer=collector)
+    report = collector.report(entity_templates)
+
+    assert [timing.phase for timing in report.phases] == [
+        "validation", "split", "simple_entities", "compound_entities"
+    ]
+    assert [(timing.name, timing.phase) for timing in report.entities] == [
+        ("Car", "simple_entities"), ("Person", "simple_entities"), ("Registration", "compound_entities")
+    ]
+    assert all(timing.seconds >= 0 and timing.allocated_bytes is None for timing in report.phases)
+    assert report.total_seconds == pytest.approx(sum(timing.seconds for timing in report.phases))
+    assert report.phase("simple_entities").seconds >= sum(
+        timing.seconds for timing in report.entities if timing.phase == "simple_entities"
+    )
+
+
+def test__profile_collector__without_validation(entity_templates: Dict) -> None:
+    collector = ProfileCollector()
+    load_entities(entity_templates, cache=None, validate=False, observer=collector)
+    assert collector.report().phase("validation") is None
+
+
+def test__load_report__slowest_entities_and_largest_templates(entity_templates: Dict) -> None:
+    collector = ProfileCollector()
+    load_entities(entity_templates, cache=None, observer=collector)
+    report = collector.report(entity_templates)
+
+    slowest = report.slowest_entities(2)
+    assert len(slowest) == 2 and slowest[0].seconds >= slowest[1].seconds
+    assert report.largest_templates(2) == [("Car", 4), ("Registration", 3)]
+    summary = report.to_dict(limit=1)
+    assert json.loads(json.dumps(summary)) == summary
+    assert summary["largest_templates"] == [{"entity": "Car", "fields": 4}]
+
+
+def test__profile_collector__allocations(entity_templates: Dict) -> None:
+    collector = ProfileCollector()
+    with tracing_allocations():
+        load_entities(entity_templates, cache=None, observer=collector)
+    report = collector.report()
+    assert report.phase("simple_entities").allocated_bytes > 0
+    assert all(timing.allocated_bytes is not None for timing in report.entities)
@@ -0,0 +1,74 @@
+from threading import Event, Thread
+from typing import Dict, List
+
+import pytest
+
+from data_snack_dynamic_entity.registry import EntityRegistry
+from data_snack_dynamic_entity.validate import ValidationError
+
+
+def _templates(entity_templates: Dict, version: int) -> Dict:
+    entity_templates["Car"]["version"] = version
+    return entity_templates
+
+
+def test__entity_registry__snapshot_is_immutable(entity_templates: Dict) -> None:
+    registry = EntityRegistry()
+    registry.load(_templates(entity_templates, 1), cache=None)
+    snapshot = registry.snapshot()
+    registry.load(_templates(entity_templates, 2), cache=None)
+
+    assert snapshot["Car"].version == 1
+    assert registry["Car"].version == 2
+    assert registry.generation == 2
+    with pytest.raises(TypeError):
+        snapshot["Car"] = None
+
+
+def test__entity_registry__update() -> None:
+    registry = EntityRegistry({"A": int, "B": str})
+    registry.update({"C": float}, removed=["A"])
+    assert dict(registry) == {"B": str, "C": float}
+
+
+def test__entity_registry__failed_load_keeps_snapshot(entity_templates: Dict) -> None:
+    registry = EntityRegistry()
+    registry.load(_templates(entity_templates, 1), cache=None)
+    with pytest.raises(ValidationError):
+        registry.load({"Car": {"type": "simple"}}, cache=None)
+    assert registry["Car"].version == 1
+
+
+def test__entity_registry__concurrent_readers_and_reloads(entity_templates: Dict) -> None:
+    registry = EntityRegistry()
+    registry.load(_templates(entity_templates, 0), cache=None)
+    stopped = Event()
+    errors: List[str] = []
+    reads = []
+
+    def read() -> None:
+        count = 0
+        while not stopped.is_set():
+            snapshot = registry.snapshot()
+            car, registration = snapshot["Car"], snapshot["Registration"]
+            if registration.Meta.sources[0].entity is not car:
+                errors.append(f"Inconsistent snapshot of version {car.version}")
+            if len(registry) != 3 or "Car" not in registry:
+                errors.append("Incomplete registry")
+            count += 1
+        reads.append(count)
+
+    readers = [Thread(target=read) for _ in range(8)]
+    for reader in readers:
+        reader.start()
+    try:
+        for version in range(1, 20):
+            registry.load(_templates(entity_templates, version), cache=None, validate=False)
+    finally:
+        stopped.set()
+        for reader in readers:
+            reader.join()
+
+    assert not errors
+    assert all(count > 0 for count in reads)
+    assert registry["Car"].version == 19 and registry.generation == 20
@@ -0,0 +1,134 @@
+import json
+import os
+from pathlib import Path
+from dataclasses import fields
+from threading import Event
+from typing import Any, Dict
+
+import pytest
+
+from data_snack_dynamic_entity.compound_entity.exceptions import NonExistingSourceEntityException
+from data_snack_dynamic_entity.exceptions import InvalidTemplatesFileException
+from data_snack_dynamic_entity.reload import ChangeReport, EntityReloader
+from data_snack_dynamic_entity.validate import ValidationError
+
+
+def _write(path: Path, templates: Any) -> None:
+    mtime = path.stat().st_mtime_ns + 1_000_000 if path.exists() else None
+    path.write_text(json.dumps(templates))
+    if mtime is not None:  # don't rely on the resolution of file system timestamps
+        os.utime(path, ns=(mtime, mtime))
+
+
+@pytest.fixture
+def reloader(tmp_path: Path, entity_templates: Dict) -> EntityReloader:
+    _write(tmp_path / "car.json", {"Car": entity_templates["Car"]})
+    _write(tmp_path / "other.json", {name: entity_templates[name] for name in ["Person", "Registration"]})
+    return EntityReloader(tmp_path, cache=None)
+
+
+def test__entity_reloader__initial_load(reloader: EntityReloader) -> None:
+    report = reloader.check()
+
+    assert report == ChangeReport(
+        added=["Car", "Person", "Registration"], rebuilt=["Car", "Person", "Registration"]
+    )
+    assert list(reloader.registry) == ["Car", "Person", "Registration"]
+    assert reloader.registry["Registration"].Meta.sources[0].entity is reloader.registry["Car"]
+
+
+def test__entity_reloader__no_changes(reloader: EntityReloader) -> None:
+    reloader.check()
+    entities = dict(reloader.registry)
+
+    assert not reloader.check().has_changes
+    assert dict(reloader.registry) == entities
+
+
+def test__entity_reloader__rebuilds_changed_and_dependents(
+        reloader: EntityReloader, tmp_path: Path, entity_templates: Dict
+) -> None:
+    reloader.check()
+    entities = dict(reloader.registry)
+    entity_templates["Car"]["properties"]["brand"]["optional"] = True
+    _write(tmp_path / "car.json", {"Car": entity_templates["Car"]})
+    report = reloader.check()
+
+    assert report == ChangeReport(changed=["Car"], rebuilt=["Car", "Registration"])
+    assert reloader.registry["Person"] is entities["Person"]
+    assert reloader.registry["Car"] is not entities["Car"]
+    assert reloader.registry["Registration"].Meta.sources[0].entity is reloader.registry["Car"]
+
+
+def test__entity_reloader__reordered_properties(reloader: EntityReloader, entity_templates: Dict) -> None:
+    """Testing if reordered properties are a change, they decide the order of fields."""
+    reloader.apply(entity_templates)
+    car = entity_templates["Car"]
+    reordered_car = {**car, "properties": dict(reversed(car["properties"].items()))}
+    report = reloader.apply({**entity_templates, "Car": reordered_car})
+
+    assert report == ChangeReport(changed=["Car"], rebuilt=["Car", "Registration"])
+    assert [f.name for f in fields(reloader.registry["Car"])] == ["brand", "index"]
+
+
+def test__entity_reloader__invalid_change_keeps_registry(
+        reloader: EntityReloader, tmp_path: Path, entity_templates: Dict
+) -> None:
+    reloader.check()
+    entities = dict(reloader.registry)
+    _write(tmp_path / "car.json", {"Car": {"type": "simple"}})
+
+    with pytest.raises(ValidationError):
+        reloader.check()
+    assert dict(reloader.registry) == entities
+
+
+@pytest.mark.parametrize("content", [None, []])
+def test__entity_reloader__partially_written_file_keeps_registry(
+        reloader: EntityReloader, tmp_path: Path, content: Any
+) -> None:
+    """Testing if entities of a file which isn't a dictionary, e.g. an empty YAML file, aren't unpublished."""
+    reloader.check()
+    entities = dict(reloader.registry)
+    _write(tmp_path / "car.json", content)
+
+    with pytest.raises(InvalidTemplatesFileException):
+        reloader.check()
+    assert dict(reloader.registry) == entities
+    with pytest.raises(InvalidTemplatesFileException):
+        reloader.check()  # the file is read again until it's complete
+
+
+def test__entity_reloader__removed_source(reloader: EntityReloader, tmp_path: Path) -> None:
+    reloader.check()
+    entities = dict(reloader.registry)
+    (tmp_path / "car.json").unlink()
+
+    with pytest.raises(NonExistingSourceEntityException):
+        reloader.check()
+    assert dict(reloader.registry) == entities
+
+
+def test__entity_reloader__apply_removed(reloader: EntityReloader, entity_templates: Dict) -> None:
+    reloader.apply(entity_templates)
+    report = reloader.apply({"Car": entity_templates["Car"]})
+
+    assert report == ChangeReport(removed=["Person", "Registration"])
+    assert list(reloader.registry) == ["Car"]
+
+
+def test__entity_reloader__watch(reloader: EntityReloader, tmp_path: Path, entity_templates: Dict) -> None:
+    reports, changed = [], Event()
+
+    def on_change(report: ChangeReport) -> None:
+        reports.append(report)
+        changed.set()
+
+    thread = reloader.watch(interval=0.01, on_change=on_change)
+    try:
+        assert changed.wait(5)
+    finally:
+        reloader.stop()
+        thread.join(5)
+    assert reports[0].added == ["Car", "Person", "Registration"]
+    assert not thread.is_alive()
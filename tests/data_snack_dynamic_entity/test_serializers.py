@@ -0,0 +1,132 @@
+import dataclasses
+import datetime
+import decimal
+import http
+import json
+from typing import Dict, Type
+
+import numpy as np
+import pytest
+
+from data_snack_dynamic_entity.factory import load_entities
+from data_snack_dynamic_entity.serializers import TupleSerializer
+
+
+@pytest.fixture
+def entity_templates(entity_templates: Dict) -> Dict:
+    entity_templates["Car"]["properties"].update({
+        "notes": {"type": "str", "excluded": True},
+        "color": {"type": "str", "default": "black", "excluded": True},
+        "weight": {"type": "float", "default": 1.5},
+    })
+    entity_templates["Registration"]["sources"] = [
+        {
+            "entity": "Car",
+            "fields": [
+                {"field": "car_index", "source_field": "index"},
+                {"field": "color", "source_field": "color"},
+                {"field": "weight", "source_field": "weight"},
+            ]
+        },
+    ]
+    return entity_templates
+
+
+@pytest.fixture
+def entities(entity_templates: Dict) -> Dict[str, Type]:
+    return load_entities(entity_templates, cache=None)
+
+
+def test__to_tuple__skips_excluded_fields(entities: Dict[str, Type]) -> None:
+    Car = entities["Car"]
+    car = Car(index=1, brand="BMW", notes="new", color="red", weight=2.0)
+
+    assert car.to_tuple() == (1, "BMW", 2.0)
+    assert Car.from_tuple(car.to_tuple()) == Car(index=1, brand="BMW", notes=None, color="black", weight=2.0)
+
+
+def test__to_bytes(entities: Dict[str, Type]) -> None:
+    Car = entities["Car"]
+    car = Car(index=1, brand="BMW", notes=None)
+
+    assert isinstance(car.to_bytes(), bytes)
+    assert Car.from_bytes(car.to_bytes()) == car
+
+
+def test__to_bytes__stores_json(entities: Dict[str, Type]) -> None:
+    Car = entities["Car"]
+    car = Car(index=1, brand="BMW", notes="new", weight=2.0)
+
+    assert json.loads(car.to_bytes()) == [1, "BMW", 2.0]
+
+
+def test__to_bytes__field_types() -> None:
+    Car = load_entities({
+        "Car": {
+            "type": "simple",
+            "version": 1,
+            "properties": {
+                "index": {"type": "int", "key": True},
+                "price": {"type": "decimal.Decimal"},
+                "cost": {"type": "numpy.float16", "optional": True},
+                "registered": {"type": "datetime.date"},
+                "status": {"type": "http.HTTPStatus"},
+                "sizes": {"type": "Tuple[int, ...]"},
+                "photo": {"type": "bytes", "optional": True},
+            },
+        }
+    }, {"datetime": datetime, "decimal": decimal, "http": http, "numpy": np}, cache=None)["Car"]
+    car = Car(
+        index=1, price=decimal.Decimal("1.10"), cost=np.float16(2.5), registered=datetime.date(2020, 1, 2),
+        status=http.HTTPStatus.OK, sizes=(1, 2), photo=b"\x00",
+    )
+
+    assert Car.from_bytes(car.to_bytes()) == car
+    assert type(Car.from_bytes(car.to_bytes()).cost) is np.float16
+    assert Car.from_bytes(dataclasses.replace(car, cost=None, photo=None).to_bytes()).photo is None
+
+
+def test__from_bytes__appended_field_with_default(entities: Dict[str, Type]) -> None:
+    Car = entities["Car"]
+
+    assert Car.from_bytes(b'[1,"BMW"]') == Car(index=1, brand="BMW", notes=None, weight=1.5)
+
+
+def test__compound_entity_serializers(entities: Dict[str, Type]) -> None:
+    Registration = entities["Registration"]
+    registration = Registration(car_index=1, color="red", weight=2.0)
+
+    assert registration.to_tuple() == (1, 2.0)
+    assert Registration.from_bytes(registration.to_bytes()) == Registration(car_index=1, color="black", weight=2.0)
+
+
+def test__serializers__slots(entity_templates: Dict) -> None:
+    entity_templates["Car"]["slots"] = True
+    Car = load_entities(entity_templates, cache=None)["Car"]
+    car = Car(index=1, brand="BMW", notes=None)
+
+    assert Car.from_bytes(car.to_bytes()) == car
+
+
+def test__serializers__field_named_like_method() -> None:
+    Car = load_entities({
+        "Car": {
+            "type": "simple",
+            "version": 1,
+            "properties": {"index": {"type": "int", "key": True}, "to_tuple": {"type": "str"}},
+        }
+    }, cache=None)["Car"]
+    car = Car(index=1, to_tuple="value")
+
+    assert car.to_tuple == "value"
+    assert Car.from_bytes(car.to_bytes()) == car
+
+
+def test__tuple_serializer(entities: Dict[str, Type]) -> None:
+    Car = entities["Car"]
+    serializer = TupleSerializer(Car)
+    cars = [Car(index=1, brand="BMW", notes=None), Car(index=2, brand="Audi", notes=None)]
+
+    assert serializer.deserialize(serializer.serialize(cars[0])) == cars[0]
+    assert serializer.deserialize([*serializer.serialize(cars, many=True), None], many=True) == [*cars, None]
+    assert serializer.deserialize(None) is None
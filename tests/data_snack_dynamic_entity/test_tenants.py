@@ -0,0 +1,95 @@
+from dataclasses import fields
+from typing import Dict
+
+import pytest
+
+from data_snack_dynamic_entity.cache import EntityCache
+from data_snack_dynamic_entity.compound_entity.exceptions import NonExistingSourceEntityException
+from data_snack_dynamic_entity.tenants import TenantRegistry
+from data_snack_dynamic_entity.validate import ValidationError
+
+
+@pytest.fixture
+def car_override() -> Dict:
+    return {
+        "type": "simple",
+        "version": 2,
+        "properties": {
+            "index": {"type": "int", "key": True},
+            "brand": {"type": "str"},
+            "color": {"type": "str", "default": "black"},
+        }
+    }
+
+
+@pytest.fixture
+def tenants(entity_templates: Dict) -> TenantRegistry:
+    return TenantRegistry(entity_templates, cache=EntityCache())
+
+
+def test__tenant_registry__shares_base_types(tenants: TenantRegistry) -> None:
+    acme = tenants.set_tenant("acme")
+    umbrella = tenants.set_tenant("umbrella")
+
+    assert dict(acme) == dict(umbrella) == tenants.base
+    assert list(tenants) == ["acme", "umbrella"]
+    assert len(tenants.unique_types()) == 3
+
+
+def test__tenant_registry__overrides(tenants: TenantRegistry, car_override: Dict) -> None:
+    acme = tenants.set_tenant("acme", {"Car": car_override})
+    base = tenants.base
+
+    assert acme["Car"] is not base["Car"]
+    assert acme["Car"].version == 2
+    assert acme["Registration"] is not base["Registration"]  # depends on the overridden entity
+    assert acme["Person"] is base["Person"]
+    assert tenants.tenant_templates("acme")["Car"] == car_override
+
+
+def test__tenant_registry__identical_overrides_share_types(tenants: TenantRegistry, car_override: Dict) -> None:
+    acme = tenants.set_tenant("acme", {"Car": car_override})
+    umbrella = tenants.set_tenant("umbrella", {"Car": dict(car_override)})
+
+    assert dict(acme) == dict(umbrella)
+    assert len(tenants.unique_types()) == 5
+
+
+def test__tenant_registry__reordered_properties(tenants: TenantRegistry, entity_templates: Dict) -> None:
+    """Testing if an override which only reorders properties doesn't reuse the base type."""
+    car = entity_templates["Car"]
+    acme = tenants.set_tenant("acme", {"Car": {**car, "properties": dict(reversed(car["properties"].items()))}})
+
+    assert [f.name for f in fields(acme["Car"])] == ["brand", "index"]
+    assert acme["Registration"] is not tenants.base["Registration"]
+
+
+def test__tenant_registry__add_and_remove_entities(tenants: TenantRegistry, entity_templates: Dict) -> None:
+    acme = tenants.set_tenant("acme", {"Registration": None, "Truck": {**entity_templates["Car"], "version": 3}})
+
+    assert list(acme) == ["Car", "Person", "Truck"]
+    with pytest.raises(NonExistingSourceEntityException):
+        tenants.set_tenant("acme", {"Car": None})
+    assert list(tenants["acme"]) == ["Car", "Person", "Truck"]  # previous types are kept
+
+
+def test__tenant_registry__set_tenant_updates_registry(tenants: TenantRegistry, car_override: Dict) -> None:
+    acme = tenants.set_tenant("acme", {"Car": car_override})
+    tenants.set_tenant("acme")
+
+    assert tenants["acme"] is acme
+    assert acme["Car"] is tenants.base["Car"]
+    assert tenants.overrides("acme") == {}
+
+
+def test__tenant_registry__invalid_override(tenants: TenantRegistry) -> None:
+    with pytest.raises(ValidationError):
+        tenants.set_tenant("acme", {"Car": {"type": "simple", "properties": {}}})
+    assert "acme" not in tenants
+
+
+def test__tenant_registry__remove_tenant(tenants: TenantRegistry) -> None:
+    tenants.set_tenant("acme")
+    tenants.remove_tenant("acme")
+    with pytest.raises(KeyError):
+        tenants["acme"]
@@ -0,0 +1,133 @@
+from typing import Dict, List
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from data_snack_dynamic_entity.factory import load_entities
+from data_snack_dynamic_entity.validate import (
+    _iter_entity_errors,
+    collect_validation_errors,
+    validate_entity_templates,
+    EntityTemplatesValidator,
+    ValidationError,
+)
+
+_SIMPLE = {"type": "simple", "version": 1, "properties": {"index": {"type": "int", "key": True}}}
+_COMPOUND = {
+    "type": "compound",
+    "sources": [{"entity": "Car", "fields": [{"field": "index", "source_field": "index"}]}],
+}
+
+
+def _errors(templates: Dict, fast: bool) -> List:
+    return [(list(error.path), error.message) for error in collect_validation_errors(templates, fast)]
+
+
+@pytest.mark.parametrize(
+    "templates",
+    [
+        {"Car": _SIMPLE, "Registration": _COMPOUND},
+        [],
+        {"car": _SIMPLE, "other": _SIMPLE},
+        {"Car": {}},
+        {"Car": {**_SIMPLE, "version": True}},
+        {"Car": {**_SIMPLE, "version": 1.0}},
+        {"Car": {**_SIMPLE, "type": "compound"}},
+        {"Car": {**_SIMPLE, "properties": {"index": {"key": True, "optional": 0}}}},
+        {"Car": {**_SIMPLE, "properties": {"index": {"key": True, "default": 1}}}},
+        {"Car": {**_SIMPLE, "properties": {"index": {"key": 0}}}},
+        {"Car": {**_SIMPLE, "properties": {"index": {"type": "int", "default": {}}}}},
+        {"Car": {**_SIMPLE, "properties": {"in-dex": {"type": "int"}}}},
+        {"Car": {**_SIMPLE, "properties": {"index": {"typo": "int"}}}},
+        {"Registration": {**_COMPOUND, "sources": [{"entity": "Car", "fields": [], "optional": 1}]}},
+        {"Registration": {**_COMPOUND, "sources": [{"entity": "Car", "fields": [{"field": "index"}]}]}},
+        {"Registration": {**_COMPOUND, "sources": {}}},
+        {"Registration": {"type": "compound"}},
+        {"Car": {**_SIMPLE, "slots": True}, "Registration": {**_COMPOUND, "slots": False}},
+        {"Car": {**_SIMPLE, "slots": 1}},
+        {"Registration": {**_COMPOUND, "slots": "true"}},
+        {"Registration": {**_COMPOUND, "fields_order": ["index"]}},
+        {"Registration": {**_COMPOUND, "fields_order": ["index", "index"]}},
+        {"Registration": {**_COMPOUND, "fields_order": "index"}},
+        {"Registration": {**_COMPOUND, "fields_order": [1]}},
+    ]
+)
+def test__collect_validation_errors__fast_validator_parity(templates: Dict) -> None:
+    """Testing if the hand-written validator reports the same errors as the jsonschema one."""
+    assert _errors(templates, fast=True) == _errors(templates, fast=False)
+
+
+def test__validate_entity_templates__fast() -> None:
+    validate_entity_templates({"Car": _SIMPLE}, fast=True)
+    with pytest.raises(ValidationError):
+        validate_entity_templates({"Car": {}}, fast=True)
+
+
+@patch("data_snack_dynamic_entity.factory.validate_entity_templates")
+def test__load_entities__validates_once(validate_mock: MagicMock) -> None:
+    templates = {"Car": _SIMPLE, "Registration": _COMPOUND}
+    with patch("data_snack_dynamic_entity.simple_entity.factory.validate_entity_templates") as simple_validate_mock, \
+            patch("data_snack_dynamic_entity.compound_entity.factory.validate_entity_templates") as compound_validate_mock:
+        load_entities(templates, cache=None)
+
+    validate_mock.assert_called_once_with(templates, fast=False)
+    simple_validate_mock.assert_not_called()
+    compound_validate_mock.assert_not_called()
+
+
+@pytest.mark.parametrize("fast", [False, True])
+def test__entity_templates_validator__groups_errors_by_entity(fast: bool) -> None:
+    templates = {
+        "Car": {**_SIMPLE, "version": True},
+        "Person": _SIMPLE,
+        "Registration": {"type": "compound"},
+    }
+    errors = EntityTemplatesValidator(fast=fast).collect_errors(templates)
+
+    assert list(errors) == ["Car", "Registration"]
+    assert [
+        (list(error.path), error.message) for entity_errors in errors.values() for error in entity_errors
+    ] == _errors(templates, fast=False)
+
+
+def test__entity_templates_validator__fail_fast() -> None:
+    templates = {"Car": {}, "Person": {}}
+    with pytest.raises(ValidationError) as e:
+        EntityTemplatesValidator(fail_fast=True).validate(templates)
+
+    assert list(e.value.args[0]) == ["Car"]
+
+
+def test__entity_templates_validator__wrong_entity_name() -> None:
+    errors = EntityTemplatesValidator().collect_errors({"car": _SIMPLE})
+
+    assert [error.message for error in errors["car"]] == [
+        "'car' does not match any of the regexes: '^[A-Z][a-zA-Z0-9]*$'"
+    ]
+
+
+def test__entity_templates_validator__skips_validated_entities() -> None:
+    validator = EntityTemplatesValidator()
+    validator.validate({"Car": _SIMPLE, "Person": _SIMPLE})
+
+    with patch("data_snack_dynamic_entity.validate._iter_entity_errors", wraps=_iter_entity_errors) as iter_mock:
+        validator.validate({"Car": _SIMPLE, "Person": {**_SIMPLE, "version": 2}})
+
+    iter_mock.assert_called_once_with("Person", {**_SIMPLE, "version": 2})
+
+
+def test__entity_templates_validator__does_not_remember_invalid_entities() -> None:
+    validator = EntityTemplatesValidator()
+    with pytest.raises(ValidationError):
+        validator.validate({"Car": {}})
+    with pytest.raises(ValidationError):
+        validator.validate({"Car": {}})
+
+
+def test__load_entities__with_validator() -> None:
+    validator = EntityTemplatesValidator()
+    entities = load_entities({"Car": _SIMPLE}, validator=validator, cache=None)
+
+    assert list(entities) == ["Car"]
+    with pytest.raises(ValidationError):
+        load_entities({"Car": {**_SIMPLE, "version": "1"}}, validator=validator, cache=None)